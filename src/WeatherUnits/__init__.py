@@ -1,57 +1,128 @@
-from typing import Type, overload, Tuple
-
-from .config import config
-
-from . import base
-
-SmartFloat = base.SmartFloat
-Measurement = base.Measurement
-ScalingMeasurement = base.ScalingMeasurement
-Dimension = base.Dimension
-Dimensionless = base.Dimensionless
-NonPlural = base.NonPlural
-DerivedMeasurement = base.DerivedMeasurement
-Index = base.Index
-Quantity = base.Quantity
-SystemVariant = base.SystemVariant
-FiniteField = base.FiniteField
-
-from .others import (Light, Angle, Percentage, Voltage,
-                     LightningStrike, Humidity, Direction,
-                     Coverage, Probability)
-from .temperature import Temperature
-from .length import Length
-from .mass import Mass
-from .time_ import Time
-from .pressure import Pressure
-from . import airQuality as AirQuality
-from . import digital as Digital
-from . import derived
-
-Rate = derived.DistanceOverTime
-Wind = derived.Wind
-Precipitation = derived.Precipitation
-Other = others
-Light = others.Light
-PartsPer = derived.PartsPer
-Volume = derived.Volume
-Density = derived.Density
-PartsPer = derived.PartsPer
+from importlib import import_module
+from types import ModuleType
+from typing import Type, overload, Tuple, TYPE_CHECKING
+import sys
+
+if TYPE_CHECKING:
+	from .base import Measurement, Dimension, Dimensionless
+
+# Subpackages are only imported when one of their names is first accessed; importing WeatherUnits
+# itself does not load the config or create any unit classes.
+_lazyAttributes = {
+	'config': ('.config', 'config'),
+	'SmartFloat': ('.base', 'SmartFloat'),
+	'Measurement': ('.base', 'Measurement'),
+	'ScalingMeasurement': ('.base', 'ScalingMeasurement'),
+	'Dimension': ('.base', 'Dimension'),
+	'Dimensionless': ('.base', 'Dimensionless'),
+	'NonPlural': ('.base', 'NonPlural'),
+	'DerivedMeasurement': ('.base', 'DerivedMeasurement'),
+	'CompactMeasurement': ('.base', 'CompactMeasurement'),
+	'Index': ('.base', 'Index'),
+	'Quantity': ('.base', 'Quantity'),
+	'SystemVariant': ('.base', 'SystemVariant'),
+	'FiniteField': ('.base', 'FiniteField'),
+	'Light': ('.others', 'Light'),
+	'Angle': ('.others', 'Angle'),
+	'Percentage': ('.others', 'Percentage'),
+	'Voltage': ('.others', 'Voltage'),
+	'LightningStrike': ('.others', 'LightningStrike'),
+	'Humidity': ('.others', 'Humidity'),
+	'Direction': ('.others', 'Direction'),
+	'Coverage': ('.others', 'Coverage'),
+	'Probability': ('.others', 'Probability'),
+	'Other': ('.others', None),
+	'Temperature': ('.temperature', 'Temperature'),
+	'Length': ('.length', 'Length'),
+	'Mass': ('.mass', 'Mass'),
+	'Time': ('.time_', 'Time'),
+	'Pressure': ('.pressure', 'Pressure'),
+	'AirQuality': ('.airQuality', None),
+	'Digital': ('.digital', None),
+	'Rate': ('.derived', 'DistanceOverTime'),
+	'Wind': ('.derived', 'Wind'),
+	'Precipitation': ('.derived', 'Precipitation'),
+	'PartsPer': ('.derived', 'PartsPer'),
+	'Volume': ('.derived', 'Volume'),
+	'Density': ('.derived', 'Density'),
+	'PressureTendency': ('.derived', 'PressureTendency'),
+	'MeasurementArray': ('.array', 'MeasurementArray'),
+	'converter': ('.conversion', 'converter'),
+	'Converter': ('.conversion', 'Converter'),
+	'format_many': ('.formatting', 'format_many'),
+	'BatchFormatter': ('.formatting', 'BatchFormatter'),
+	'RunningStats': ('.stats', 'RunningStats'),
+	'MeasurementSeries': ('.series', 'MeasurementSeries'),
+	'PressureTrend': ('.trend', 'PressureTrend'),
+}
+
+_subpackages = {'base', 'config', 'errors', 'utils', 'others', 'temperature', 'length', 'mass', 'time_', 'pressure',
+	'airQuality', 'digital', 'derived', 'defaults', 'array', 'conversion', 'formatting', 'stats', 'series', 'trend'}
+
+_unitModules = ('.others', '.temperature', '.length', '.mass', '.time_', '.pressure', '.airQuality', '.digital', '.derived')
+
+
+def __getattr__(name: str):
+	if name in _lazyAttributes:
+		module, attribute = _lazyAttributes[name]
+		value = import_module(module, __name__)
+		if attribute is not None:
+			value = getattr(value, attribute)
+	elif name in _subpackages:
+		value = import_module(f'.{name}', __name__)
+	else:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	globals()[name] = value
+	return value
+
+
+def __dir__():
+	return sorted(set(globals()) | _lazyAttributes.keys() | _subpackages)
+
+
+def _loadUnits():
+	"""Imports every unit subpackage so lookups across all of Measurement see the complete registry."""
+	for module in _unitModules:
+		import_module(module, __name__)
+
+
+class _Package(ModuleType):
+	"""
+	Keeps WeatherUnits.config pointing at the Config instance rather than the config subpackage,
+	which the import system would otherwise set as an attribute when it is first imported.
+	"""
+
+	@property
+	def config(self):
+		try:
+			return self.__dict__['config']
+		except KeyError:
+			return __getattr__('config')
+
+	@config.setter
+	def config(self, value):
+		if not isinstance(value, ModuleType):
+			self.__dict__['config'] = value
+
+
+sys.modules[__name__].__class__ = _Package
 
 
 @overload
-def auto(value: int | float | int, unit: str) -> Measurement: ...
+def auto(value: int | float | int, unit: str) -> 'Measurement': ...
 
 
 @overload
-def auto(value: str) -> Measurement: ...
+def auto(value: str) -> 'Measurement': ...
 
 
 @overload
-def auto(unit: str) -> Type[Measurement] | Tuple[Type[Measurement], ...]: ...
+def auto(unit: str) -> 'Type[Measurement] | Tuple[Type[Measurement], ...]': ...
 
 
-def auto(*args, dimension: Type[Dimension | Dimensionless] = None) -> Measurement | Type[Measurement] | Tuple[Type[Measurement], ...]:
+def auto(*args, dimension: 'Type[Dimension | Dimensionless]' = None) -> 'Measurement | Type[Measurement] | Tuple[Type[Measurement], ...]':
+	from .base import Measurement, DerivedMeasurement, FormatSpec
+	_loadUnits()
 	dimension = dimension or Measurement
 	match args:
 		case [int(value) | float(value) | str(value), str(unit)]:
@@ -64,7 +135,7 @@ def auto(*args, dimension: Type[Dimension | Dimensionless] = None) -> Measuremen
 			raise NotImplementedError('Multi-Unit values are not supported yet')
 
 		case [str(value)]:
-			number = base.FormatSpec.number.search(value)
+			number = FormatSpec.number.search(value)
 			if number is not None:
 				number = number.groupdict()['number']
 
@@ -87,4 +158,6 @@ def auto(*args, dimension: Type[Dimension | Dimensionless] = None) -> Measuremen
 
 __all__ = ['auto', 'Measurement', 'Temperature', 'Length', 'Mass', 'Time', 'Pressure', 'Other', 'Light', 'PartsPer',
 	'Volume', 'Density', 'PartsPer', 'Rate', 'Wind', 'Precipitation', 'AirQuality', 'Voltage', 'Digital', 'config',
-	'Precipitation', 'LightningStrike', 'Angle', 'Percentage', 'Humidity', 'Direction', 'Coverage', 'Probability']
+	'Precipitation', 'LightningStrike', 'Angle', 'Percentage', 'Humidity', 'Direction', 'Coverage', 'Probability',
+	'MeasurementArray', 'converter', 'Converter', 'format_many', 'BatchFormatter', 'CompactMeasurement', 'RunningStats',
+	'MeasurementSeries', 'PressureTrend', 'PressureTendency']
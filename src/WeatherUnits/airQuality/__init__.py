@@ -1,6 +1,7 @@
 from enum import Enum
+from importlib import import_module
 
-__all__ = ['PrimaryPollutant', 'HeathConcern', 'AQI', 'PollutionIndex']
+__all__ = ['PrimaryPollutant', 'HeathConcern', 'AQI', 'PollutionIndex', 'Breakpoints', 'breakpoints', 'concentration', 'aqi', 'AirQualityIndex', 'airQualityIndex']
 
 from ..base import Measurement
 
@@ -85,15 +86,31 @@ class AQI(Measurement):
 
 	@property
 	def enum(self) -> HeathConcern:
-		if self >= 50:
+		if self <= 50:
 			return HeathConcern.Good
-		elif self >= 100:
+		elif self <= 100:
 			return HeathConcern.Moderate
-		elif self >= 150:
+		elif self <= 150:
 			return HeathConcern.UnhealthyForSensitiveGroups
-		elif self >= 200:
+		elif self <= 200:
 			return HeathConcern.Unhealthy
-		elif self >= 300:
+		elif self <= 300:
 			return HeathConcern.VeryUnhealthy
 		else:
 			return HeathConcern.Hazardous
+
+
+# the index imports arrays, conversions and derived units, so it is only loaded when used
+_indexAttributes = {'Breakpoints', 'breakpoints', 'concentration', 'aqi', 'AirQualityIndex', 'airQualityIndex'}
+
+
+def __getattr__(name: str):
+	if name not in _indexAttributes:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	value = getattr(import_module('.index', __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__():
+	return sorted(set(globals()) | _indexAttributes)
@@ -0,0 +1,257 @@
+"""
+Air quality index from pollutant concentrations.
+
+The index of each pollutant is interpolated from the US EPA breakpoint tables (2024 revision)
+after truncating the concentration to the precision of its table.  Gases are given as PartsPer
+measurements or as mass concentrations, which are converted with the molecular weight of the
+gas and the molar volume of air.  Arrays of concentrations, e.g. one per node of a sensor
+network, are looked up with a single searchsorted per pollutant.
+
+The tables expect the averaging period of each pollutant: 24 hours for PM2.5 and PM10, 8 hours
+for O₃ and CO and 1 hour for NO₂ and SO₂.  Concentrations above a table are beyond the index and
+reported as 500.
+"""
+from bisect import bisect_left
+from math import floor, isnan
+from typing import Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from . import AQI, PrimaryPollutant
+from ..array import MeasurementArray, _requireNumpy
+from ..base import Measurement
+from ..conversion import conversionCoefficients
+from ..derived import PartsPer
+from ..errors import BadConversion
+from ..mass import Mass
+
+__all__ = ['Breakpoints', 'breakpoints', 'molecularWeights', 'molarVolume', 'concentration', 'aqi', 'AirQualityIndex', 'airQualityIndex']
+
+Concentration = Union[Measurement, float, MeasurementArray, 'np.ndarray']
+
+# Litres per mole of air at 25 °C and 1 atm, the reference conditions of the EPA tables
+molarVolume = 24.45
+
+# Grams per mole
+molecularWeights: Dict[PrimaryPollutant, float] = {
+	PrimaryPollutant.O3: 47.997,
+	PrimaryPollutant.NO2: 46.0055,
+	PrimaryPollutant.CO: 28.010,
+	PrimaryPollutant.SO2: 64.066,
+}
+
+# The index reported for concentrations above a table
+_beyondIndex = 500.0
+
+
+class Breakpoints:
+	"""
+	The breakpoint table of one pollutant.
+
+	Rows are (low, high, indexLow, indexHigh) with concentrations in unit, which is a PartsPer
+	class for gases and Microgram for mass concentrations in µg/m³.
+	"""
+	__slots__ = ('pollutant', 'unit', 'digits', 'low', 'high', 'indexLow', 'indexHigh', '_arrays')
+
+	pollutant: PrimaryPollutant
+	unit: Type[Measurement]
+	digits: int
+
+	def __init__(self, pollutant: PrimaryPollutant, unit: Type[Measurement], digits: int, rows: Sequence[Tuple[float, float, int, int]]):
+		self.pollutant = pollutant
+		self.unit = unit
+		self.digits = digits
+		self.low, self.high, self.indexLow, self.indexHigh = (tuple(float(i) for i in column) for column in zip(*rows))
+		self._arrays = None
+
+	def __repr__(self):
+		return f'{type(self).__name__}({self.pollutant.name}, unit={self.unit.__name__}, rows={len(self.high)})'
+
+	@property
+	def isGas(self) -> bool:
+		return issubclass(self.unit, PartsPer)
+
+	def truncate(self, value: float) -> float:
+		"""Truncates to the precision of the table, negative sensor readings count as 0"""
+		factor = 10 ** self.digits
+		return max(floor(value * factor + 1e-6) / factor, 0.0)
+
+	def index(self, value: float) -> float:
+		"""The index of a concentration in the unit of the table, rounded to the nearest integer"""
+		if isnan(value):
+			return value
+		value = self.truncate(value)
+		if (row := bisect_left(self.high, value)) == len(self.high):
+			return _beyondIndex
+		low, indexLow = self.low[row], self.indexLow[row]
+		index = (self.indexHigh[row] - indexLow) / (self.high[row] - low) * (value - low) + indexLow
+		return floor(index + 0.5)
+
+	def indices(self, values: 'np.ndarray') -> 'np.ndarray':
+		"""The index of every concentration of an array in the unit of the table, nan stays nan"""
+		_requireNumpy()
+		if self._arrays is None:
+			self._arrays = tuple(np.array(i) for i in (self.low, self.high, self.indexLow, self.indexHigh))
+		low, high, indexLow, indexHigh = self._arrays
+
+		factor = 10 ** self.digits
+		values = np.maximum(np.floor(np.asarray(values, dtype=np.float64) * factor + 1e-6) / factor, 0.0)
+		rows = np.searchsorted(high, values, side='left')
+		beyond = rows == len(high)
+		rows = np.minimum(rows, len(high) - 1)
+		low, indexLow = low[rows], indexLow[rows]
+		index = np.floor((indexHigh[rows] - indexLow) / (high[rows] - low) * (values - low) + indexLow + 0.5)
+		return np.where(np.isnan(values), np.nan, np.where(beyond, _beyondIndex, index))
+
+
+breakpoints: Dict[PrimaryPollutant, Breakpoints] = {
+	PrimaryPollutant.PM2_5: Breakpoints(PrimaryPollutant.PM2_5, Mass.Microgram, 1, (
+		(0.0, 9.0, 0, 50),
+		(9.1, 35.4, 51, 100),
+		(35.5, 55.4, 101, 150),
+		(55.5, 125.4, 151, 200),
+		(125.5, 225.4, 201, 300),
+		(225.5, 325.4, 301, 500),
+	)),
+	PrimaryPollutant.PM10: Breakpoints(PrimaryPollutant.PM10, Mass.Microgram, 0, (
+		(0, 54, 0, 50),
+		(55, 154, 51, 100),
+		(155, 254, 101, 150),
+		(255, 354, 151, 200),
+		(355, 424, 201, 300),
+		(425, 604, 301, 500),
+	)),
+	PrimaryPollutant.O3: Breakpoints(PrimaryPollutant.O3, PartsPer.Million, 3, (
+		(0.000, 0.054, 0, 50),
+		(0.055, 0.070, 51, 100),
+		(0.071, 0.085, 101, 150),
+		(0.086, 0.105, 151, 200),
+		(0.106, 0.200, 201, 300),
+	)),
+	PrimaryPollutant.CO: Breakpoints(PrimaryPollutant.CO, PartsPer.Million, 1, (
+		(0.0, 4.4, 0, 50),
+		(4.5, 9.4, 51, 100),
+		(9.5, 12.4, 101, 150),
+		(12.5, 15.4, 151, 200),
+		(15.5, 30.4, 201, 300),
+		(30.5, 50.4, 301, 500),
+	)),
+	PrimaryPollutant.NO2: Breakpoints(PrimaryPollutant.NO2, PartsPer.Billion, 0, (
+		(0, 53, 0, 50),
+		(54, 100, 51, 100),
+		(101, 360, 101, 150),
+		(361, 649, 151, 200),
+		(650, 1249, 201, 300),
+		(1250, 2049, 301, 500),
+	)),
+	PrimaryPollutant.SO2: Breakpoints(PrimaryPollutant.SO2, PartsPer.Billion, 0, (
+		(0, 35, 0, 50),
+		(36, 75, 51, 100),
+		(76, 185, 101, 150),
+		(186, 304, 151, 200),
+		(305, 604, 201, 300),
+		(605, 1004, 301, 500),
+	)),
+}
+
+
+def _pollutant(pollutant: Union[PrimaryPollutant, str]) -> PrimaryPollutant:
+	if isinstance(pollutant, PrimaryPollutant):
+		return pollutant
+	name = pollutant.replace('.', '_')
+	return next((i for i in PrimaryPollutant if name.lower() in (i.name.lower(), i.text.lower())), None) or PrimaryPollutant[name]
+
+
+def _coefficients(pollutant: PrimaryPollutant, unitClass: Type[Measurement], molar: float) -> float:
+	"""The factor converting a concentration in unitClass into the unit of the table of pollutant"""
+	table = breakpoints[pollutant]
+	if issubclass(unitClass, PartsPer):
+		if not table.isGas:
+			raise BadConversion(unitClass.__name__, f'a mass concentration of {pollutant.text}')
+		return conversionCoefficients(unitClass, table.unit)[1]
+	if issubclass(unitClass, Mass):
+		micrograms = conversionCoefficients(unitClass, Mass.Microgram)[1]
+		if not table.isGas:
+			return micrograms
+		# µg/m³ to ppb
+		return micrograms * molar / molecularWeights[pollutant] * conversionCoefficients(PartsPer.Billion, table.unit)[1]
+	raise BadConversion(unitClass.__name__, table.unit.__name__)
+
+
+def concentration(pollutant: Union[PrimaryPollutant, str], value: Concentration, molar: float = molarVolume) -> Union[float, 'np.ndarray']:
+	"""
+	Converts a concentration into the unit of the table of pollutant.
+	:param pollutant: A PrimaryPollutant or its name, e.g. 'PM2.5' or 'O3'
+	:param value: A PartsPer measurement, a Mass measurement taken per cubic meter, a number in
+		the unit of the table or an array of any of these
+	:param molar: Litres per mole of air used to convert mass concentrations of gases
+	"""
+	pollutant = _pollutant(pollutant)
+	if isinstance(value, (list, tuple)):
+		value = MeasurementArray(value) if any(isinstance(i, Measurement) for i in value) else np.asarray(value, dtype=np.float64)
+	if isinstance(value, MeasurementArray):
+		if value.unit is breakpoints[pollutant].unit:
+			return value.values
+		return value.values * _coefficients(pollutant, value.unit, molar)
+	if isinstance(value, Measurement):
+		if type(value) is breakpoints[pollutant].unit:
+			return float(value)
+		return float(value) * _coefficients(pollutant, type(value), molar)
+	if np is not None and isinstance(value, np.ndarray):
+		return value.astype(np.float64, copy=False)
+	return float(value)
+
+
+def aqi(pollutant: Union[PrimaryPollutant, str], value: Concentration, molar: float = molarVolume) -> Union[AQI, 'np.ndarray']:
+	"""The index of a single pollutant, an AQI for a single value or an array of indices"""
+	pollutant = _pollutant(pollutant)
+	value = concentration(pollutant, value, molar)
+	if isinstance(value, float):
+		return AQI(breakpoints[pollutant].index(value))
+	return breakpoints[pollutant].indices(value)
+
+
+class AirQualityIndex(NamedTuple):
+	"""
+	The index and primary pollutant.  For arrays index is a float array with nan where no
+	concentration is known and primary holds the PrimaryPollutant values with -1 where no
+	concentration is known.
+	"""
+	index: Union[AQI, 'np.ndarray', None]
+	primary: Union[PrimaryPollutant, 'np.ndarray', None]
+
+	def pollutants(self) -> Sequence[Optional[PrimaryPollutant]]:
+		"""The primary pollutant of each node of an array result"""
+		if isinstance(self.primary, PrimaryPollutant) or self.primary is None:
+			return self.primary,
+		return [PrimaryPollutant(i) if i >= 0 else None for i in self.primary.tolist()]
+
+
+def airQualityIndex(concentrations: Mapping[Union[PrimaryPollutant, str], Optional[Concentration]], molar: float = molarVolume) -> AirQualityIndex:
+	"""
+	The overall index, the highest index of all pollutants, and the pollutant it comes from.
+	Pollutants that are None or nan are skipped.
+	:param concentrations: Concentrations by pollutant, either all single values or all arrays of the same shape
+	:param molar: Litres per mole of air used to convert mass concentrations of gases
+	"""
+	converted = {_pollutant(pollutant): concentration(pollutant, value, molar) for pollutant, value in concentrations.items() if value is not None}
+	if all(isinstance(i, float) for i in converted.values()):
+		indices = [(breakpoints[pollutant].index(value), pollutant) for pollutant, value in converted.items() if not isnan(value)]
+		if not indices:
+			return AirQualityIndex(None, None)
+		index, pollutant = max(indices, key=lambda i: i[0])
+		return AirQualityIndex(AQI(index), pollutant)
+
+	_requireNumpy()
+	pollutants = list(converted)
+	shape = np.broadcast_shapes(*(np.shape(i) for i in converted.values()))
+	indices = np.stack([np.broadcast_to(breakpoints[i].indices(converted[i]), shape) for i in pollutants])
+	known = ~np.isnan(indices)
+	rows = np.argmax(np.where(known, indices, -np.inf), axis=0)
+	index = np.take_along_axis(indices, rows[np.newaxis], axis=0)[0]
+	codes = np.array([i.value for i in pollutants])
+	primary = np.where(known.any(axis=0), codes[rows], -1)
+	return AirQualityIndex(index, primary)
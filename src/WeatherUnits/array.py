@@ -0,0 +1,263 @@
+from math import isinf
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from .base import Measurement
+from .errors import UnknownUnit
+from .conversion import conversionCoefficients
+from .formatting import BatchFormatter
+
+__all__ = ['MeasurementArray']
+
+# Integer digit counts of rounded values, exact where log10 is not
+_powersOfTen = np.array([10.0 ** i for i in range(309)]) if np is not None else None
+
+
+def _requireNumpy():
+	if np is None:
+		raise ImportError('MeasurementArray requires numpy, install it with "pip install numpy"')
+
+
+class MeasurementArray:
+	"""
+	A float64 buffer of values sharing a single unit class.
+
+	Values are only wrapped in Measurement objects when they are indexed, conversions and
+	reductions operate on the whole buffer at once.
+	"""
+	__slots__ = ('_values', '_unit')
+
+	_values: 'np.ndarray'
+	_unit: Type[Measurement]
+
+	def __init__(self, values: Iterable[float | Measurement] | 'np.ndarray', unit: Optional[Type[Measurement]] = None, copy: bool = True):
+		"""
+		:param values: Measurements, numbers in unit, a numpy array or a MeasurementArray
+		:param unit: The unit class, defaults to the unit of the first measurement
+		:param copy: Copy arrays, with False a float64 array is used as the buffer when it needs no clipping
+		"""
+		_requireNumpy()
+		if isinstance(values, MeasurementArray):
+			if unit is not None and unit is not values.unit:
+				values = values.to(unit)
+			unit, values = values.unit, values.values
+		elif not isinstance(values, np.ndarray):
+			values = list(values)
+			if unit is None:
+				unit = next((type(i) for i in values if isinstance(i, Measurement)), None)
+			values = [self.__convertValue(i, unit) for i in values]
+		if unit is None:
+			raise TypeError('MeasurementArray requires a unit when values are not measurements')
+
+		values = np.array(values, dtype=np.float64) if copy else np.asarray(values, dtype=np.float64)
+		low, high = unit.limits
+		if not (isinf(low) and isinf(high)):
+			values = np.clip(values, low, high, out=values if copy else None)
+
+		self._values = values
+		self._unit = unit
+
+	@staticmethod
+	def __convertValue(value: float | Measurement, unit: Type[Measurement]) -> float:
+		if not isinstance(value, Measurement) or type(value) is unit:
+			return value
+		_, scale, offset = conversionCoefficients(type(value), unit)
+		return float(value) * scale + offset
+
+	@classmethod
+	def _fromBuffer(cls, values: 'np.ndarray', unit: Type[Measurement]) -> 'MeasurementArray':
+		array = object.__new__(cls)
+		array._values = values
+		array._unit = unit
+		return array
+
+	@property
+	def values(self) -> 'np.ndarray':
+		return self._values
+
+	@property
+	def unit(self) -> Type[Measurement]:
+		return self._unit
+
+	@property
+	def type(self) -> Type[Measurement]:
+		return self._unit.type
+
+	def to(self, target: Union[str, Type[Measurement]]) -> 'MeasurementArray':
+		if target is self._unit:
+			return self
+		toUnit, scale, offset = conversionCoefficients(self._unit, target)
+		values = self._values * scale
+		if offset:
+			values += offset
+		return self._fromBuffer(values, toUnit)
+
+	def __getitem__(self, item):
+		if isinstance(item, (str, type)):
+			return self.to(item)
+		value = self._values[item]
+		if isinstance(value, np.ndarray):
+			return self._fromBuffer(value, self._unit)
+		return self._unit(float(value))
+
+	def __getattr__(self, item: str) -> 'MeasurementArray':
+		if item.startswith('_'):
+			raise AttributeError(item)
+		try:
+			return self.to(item)
+		except (AttributeError, KeyError, TypeError, UnknownUnit) as e:
+			raise AttributeError(f'{self._unit.__name__} has no conversion {item!r}') from e
+
+	def __len__(self) -> int:
+		return len(self._values)
+
+	def __iter__(self) -> Iterator[Measurement]:
+		unit = self._unit
+		return (unit(i) for i in self._values.tolist())
+
+	def __array__(self, dtype=None, copy=None) -> 'np.ndarray':
+		if dtype is None:
+			return self._values
+		return self._values.astype(dtype)
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({self._values.tolist()!r}, unit={self._unit!r})'
+
+	def __str__(self) -> str:
+		return f'[{", ".join(self.format())}]'
+
+	def format(self, spec: str = '', sep: Optional[str] = None) -> List[str] | str:
+		"""
+		Formats every value with the same format spec without creating a Measurement per value.
+		:param spec: The format spec given to format()
+		:param sep: When given the strings are joined with sep into a single string
+		:return: A list of strings or the joined string
+		"""
+		values = self._values.ravel().tolist()
+		if not values:
+			return [] if sep is None else ''
+		formatter = BatchFormatter(self._unit(values[0]), spec)
+		strings = [formatter.formatFloat(i) for i in values]
+		if sep is not None:
+			return sep.join(strings)
+		return strings
+
+	def _scaleTable(self):
+		from .base._ScalingMeasurement import ScalingMeasurement, ScaleTable
+		if not issubclass(self._unit, ScalingMeasurement):
+			raise TypeError(f'{self._unit.__name__} does not have scales')
+		return ScaleTable.of(self._unit)
+
+	def _fromScaleIndices(self, table, indices: 'np.ndarray') -> List[Measurement]:
+		values = (self._values.ravel() * np.asarray(table.factors)[indices]).tolist()
+		classes = table.classes
+		return [classes[i](value) for i, value in zip(indices.tolist(), values)]
+
+	def autoIndices(self) -> 'np.ndarray':
+		"""The ScaleTable index Measurement.auto picks for each value"""
+		table = self._scaleTable()
+		values = np.abs(self._values.ravel())
+		candidates = np.asarray(table.candidates)
+		factors = np.asarray(table.factors)[candidates]
+		last = len(candidates) - 1
+		with np.errstate(divide='ignore', invalid='ignore'):
+			logs = np.log10(values) + table.logs[table.current]
+		position = np.clip(np.searchsorted(table.candidateLogs, logs, side='right') - 1, 0, last)
+		# the estimate can be off by one at exact powers, settle it with the converted values
+		up = (position < last) & (values * factors[np.minimum(position + 1, last)] >= 1)
+		position = position + up
+		down = (position > 0) & (values * factors[position] < 1)
+		position = position - down
+		indices = candidates[position]
+		return np.where((values == 0) | ~np.isfinite(values), table.current, indices)
+
+	def bestFitIndices(self, maxDigits: Optional[int] = None) -> 'np.ndarray':
+		"""The ScaleTable index Measurement.bestFit picks for each value"""
+		table = self._scaleTable()
+		if maxDigits is None:
+			maxDigits = self._unit._max
+		values = self._values.ravel()
+		order = np.asarray(table.fitOrder)
+		factors = np.asarray(table.factors)[order]
+		last = len(order) - 1
+
+		def fits(position):
+			rounded = np.round(values * factors[position])
+			digits = np.maximum(np.searchsorted(_powersOfTen, np.abs(rounded), side='right'), 1) + (rounded < 0)
+			return digits <= maxDigits
+
+		with np.errstate(divide='ignore', invalid='ignore'):
+			threshold = np.log10(np.abs(values)) + table.logs[table.current] - (maxDigits - (values < 0))
+		orderLogs = np.asarray(table.logs)[order]
+		position = np.clip(np.searchsorted(orderLogs, threshold, side='right'), 1, last)
+		position = np.where(fits(np.zeros_like(position)), 0, position)
+		# digits only shrink moving up the order, step to the first fitting scale
+		while (move := (position > 1) & fits(position - 1)).any():
+			position = position - move
+		while (move := (position < last) & ~fits(position)).any():
+			position = position + move
+		return np.where(np.isfinite(values), order[position], table.current)
+
+	def splitIntoColumns(self, *into: Type[Measurement]) -> Dict[str, 'MeasurementArray']:
+		"""
+		Array version of Measurement.splitInto, e.g. the days, hours, minutes and seconds of many
+		durations.  Every unit gets a column, zeros included, and the last unit holds the rest of
+		each value including the fraction.
+		:param into: Unit classes to split into, defaults to the common units of the type
+		:return: A MeasurementArray per unit class name, largest unit first
+		"""
+		from .base._ScalingMeasurement import ScalingMeasurement, ScaleSplit
+		if not issubclass(self._unit, ScalingMeasurement):
+			raise TypeError(f'{self._unit.__name__} does not have scales')
+		split = ScaleSplit.of(self._unit, into)
+		columns, previous = {}, 0
+		last = len(split.classes) - 1
+		for index, (cls, factor, step) in enumerate(zip(split.classes, split.factors, split.steps)):
+			whole = self._values * factor
+			if index != last:
+				whole = np.trunc(whole)
+			columns[cls.name] = self._fromBuffer(whole - previous * step, cls)
+			previous = whole
+		return columns
+
+	def auto(self) -> List[Measurement]:
+		"""Every value in the scale Measurement.auto picks for it"""
+		table = self._scaleTable()
+		return self._fromScaleIndices(table, self.autoIndices())
+
+	def bestFit(self, maxDigits: Optional[int] = None) -> List[Measurement]:
+		"""Every value in the scale Measurement.bestFit picks for it"""
+		table = self._scaleTable()
+		return self._fromScaleIndices(table, self.bestFitIndices(maxDigits))
+
+	@property
+	def shape(self) -> Tuple[int, ...]:
+		return self._values.shape
+
+	def sum(self) -> Measurement:
+		return self._unit(float(np.sum(self._values)))
+
+	def mean(self) -> Measurement:
+		return self._unit(float(np.mean(self._values)))
+
+	def min(self) -> Measurement:
+		return self._unit(float(np.min(self._values)))
+
+	def max(self) -> Measurement:
+		return self._unit(float(np.max(self._values)))
+
+	def std(self) -> Measurement:
+		return self._unit(float(np.std(self._values)))
+
+	def nanmean(self) -> Measurement:
+		return self._unit(float(np.nanmean(self._values)))
+
+	def nanmin(self) -> Measurement:
+		return self._unit(float(np.nanmin(self._values)))
+
+	def nanmax(self) -> Measurement:
+		return self._unit(float(np.nanmax(self._values)))
@@ -4,21 +4,118 @@ from collections import ChainMap
 from functools import lru_cache, cached_property
 import logging
 from datetime import datetime
+from math import isinf
 from numbers import Number
 from typing import Callable, ClassVar, Dict, List, Optional, Type, Union, Final, Literal, Iterable, TypeVar, TypeAlias
 
-__all__ = ['Measurement', 'DerivedMeasurement', 'Dimension', 'metric', 'imperial', 'both', 'Dimensionless', 'Quantity', 'Index', 'NonPlural']
+__all__ = ['Measurement', 'CompactMeasurement', 'DerivedMeasurement', 'Dimension', 'metric', 'imperial', 'both', 'Dimensionless', 'Quantity', 'Index', 'NonPlural']
 
 from .. import errors
 from . import SmartFloat, FormatSpec, MetaUnitClass
+from ._SmartFloat import DisplayProfile, classRegistry, defaultDisplay, unitIndex
 from ..utils import HashSlice, Other, Self
 from ..config import config
 
 log = logging.getLogger('WeatherUnits').getChild('Measurement')
 
+# The display profile and metadata a transformed value takes over, cached properties and the unit state are not copied
+_transferredAttributes: Final = ('_display', '_title', '_key', '_category', '_timestamp', '_updateFunction', '_indoor', '_calculated')
 
 
-from math import isinf
+def _transferAttributes(source: 'Measurement', target: 'Measurement') -> None:
+	attributes, targetAttributes = source.__dict__, target.__dict__
+	for key in _transferredAttributes:
+		if (value := attributes.get(key, None)) is not None:
+			targetAttributes[key] = value
+
+
+def _restoreCompact(unitClass: Type['Measurement'], value: float, timestamp: Optional[datetime], display: DisplayProfile) -> 'CompactMeasurement':
+	return unitClass.Compact(value, timestamp, display)
+
+
+class CompactMeasurement(float):
+	"""
+	A value of a unit class stored without an instance dict.
+
+	Compact values hold only the float, the timestamp and the DisplayProfile of the value, the
+	unit class is shared by every value of the compact class which is found with Meter.Compact,
+	Temperature.Celsius.Compact, etc.  On 64-bit CPython a compact value takes 56 bytes while a
+	full Measurement takes over 300 bytes once its instance dict is counted.
+
+	Arithmetic returns plain floats, use measurement to get the value as an instance of the unit
+	class.  Formatting creates that instance for each call.
+	"""
+	__slots__ = ('_timestamp', '_display')
+	unitClass: ClassVar[Type['Measurement']]
+
+	_timestamp: Optional[datetime]
+	_display: DisplayProfile
+
+	def __new__(cls, value: Union[float, 'Measurement'], timestamp: datetime = None, display: DisplayProfile = None):
+		if isinstance(value, Measurement):
+			timestamp = timestamp or value.timestamp
+			display = display or value._display
+			if not isinstance(value, cls.unitClass):
+				value = cls.unitClass(value)
+		low, high = cls.unitClass.limits
+		compact = float.__new__(cls, sorted((low, float(value), high))[1])
+		compact._timestamp = timestamp
+		compact._display = display or defaultDisplay
+		return compact
+
+	def __reduce__(self):
+		return _restoreCompact, (self.unitClass, float(self), self._timestamp, self._display)
+
+	@property
+	def timestamp(self) -> Optional[datetime]:
+		return self._timestamp
+
+	@property
+	def display(self) -> DisplayProfile:
+		return self._display
+
+	@property
+	def unit(self) -> str:
+		return self.unitClass.unit
+
+	@property
+	def measurement(self) -> 'Measurement':
+		"""The value as an instance of its unit class"""
+		unitClass = self.unitClass
+		if unitClass.isDerived:
+			numerator, denominator = unitClass.fixedUnits
+			value = unitClass(numerator(float(self)), denominator(1))
+		else:
+			value = unitClass(float(self))
+		value._timestamp = self._timestamp
+		if self._display is not defaultDisplay:
+			value._display = self._display
+		return value
+
+	def __format__(self, formatSpec: str) -> str:
+		return format(self.measurement, formatSpec)
+
+	def __str__(self) -> str:
+		return str(self.measurement)
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({float(self)!r})'
+
+
+class _CompactClasses:
+	"""Creates the CompactMeasurement class of each unit class on first access"""
+
+	def __init__(self):
+		self.classes: Dict[Type['Measurement'], Type[CompactMeasurement]] = {}
+
+	def __get__(self, instance, owner: Type['Measurement']) -> Type[CompactMeasurement]:
+		if (compact := self.classes.get(owner, None)) is None:
+			if owner.isDerived and None in owner.fixedUnits:
+				raise AttributeError(f'{owner.__name__} does not have fixed units and can not be stored compactly')
+			attrs = {'__slots__': (), '__module__': owner.__module__, 'unitClass': owner}
+			compact = self.classes[owner] = type(f'{owner.__name__}.Compact', (CompactMeasurement,), attrs)
+		return compact
+
 
 class Measurement(SmartFloat):
 	__unitDict__ = ChainMap()
@@ -30,6 +127,7 @@ class Measurement(SmartFloat):
 	_calculated: bool
 	_category: str
 	_subTypes: ClassVar[Dict[str, Type['Measurement']]]
+	Compact: ClassVar[Type[CompactMeasurement]] = _CompactClasses()
 
 	def __init_subclass__(cls, **kwargs):
 		if kwargs.get('type', False):
@@ -51,8 +149,7 @@ class Measurement(SmartFloat):
 				return item
 			parentType = cls.type
 			name = f'{parentType.__name__}[{item.__name__}]'
-			newCls = type(name, (item, cls,), {})
-			return newCls
+			return classRegistry.synthesize(name, (item, cls))
 
 		raise TypeError(f'{cls.__name__} does not support {item}')
 
@@ -86,6 +183,11 @@ class Measurement(SmartFloat):
 	def category(self, value):
 		self._category = value
 
+	@property
+	def compact(self) -> CompactMeasurement:
+		"""The value as a CompactMeasurement of its unit class"""
+		return type(self).Compact(self)
+
 	@property
 	def localize(self):
 		if self.convertible:
@@ -157,10 +259,9 @@ class Measurement(SmartFloat):
 	def transform(self, other, transformTo: type = None):
 		if isinstance(other, type) and issubclass(other, Measurement):
 			other = other(self)
-		nonTransferred = ['_unit', '_suffix', '_scale', '_denominator', '_numerator']
 		if self.type != other.type:
 			log.warning(f'{self.withUnit} and {other.withUnit} are not identical types, this may cause issues')
-		other.__dict__.update({key: value for key, value in self.__dict__.items() if key not in nonTransferred and value is not None})
+		_transferAttributes(self, other)
 		if getattr(other, '_updateFunction', None):
 			other._updateFunction(other)
 		return other
@@ -281,7 +382,7 @@ class Measurement(SmartFloat):
 		return v
 
 	def __hash__(self):
-		return hash(round(float(self), max(self._precision, 1)))
+		return hash(round(float(self), max(self._displaySetting('precision'), 1)))
 
 
 class DimensionlessMeta(MetaUnitClass):
@@ -412,14 +513,28 @@ class DerivedMeasurementMeta(MetaUnitClass):
 	def genericBases(self):
 		return super().genericBases | self.numerator.genericBases | self.denominator.genericBases
 
-	@property
-	def compatibleUnits(cls) -> dict:
-		parentCls = cls.type
+	def __buildCompatibleUnits__(cls) -> dict:
+		parentCls = cls
 		n = parentCls.numerator.type.compatibleUnits
 		d = parentCls.denominator.type.compatibleUnits
 		specifiedUnits = {u: t for t in parentCls.subTypes if (u := getattr(t, '_unit', None))}
 		return {**specifiedUnits, **n, **d}
 
+	def __exactUnitClass__(cls, unit: str) -> Type[Measurement] | None:
+		# Same precedence as compatibleUnits: denominator, numerator then the specified units
+		parentCls = cls.type
+		if (unitClass := parentCls.denominator.type.__exactUnitClass__(unit)) is not None:
+			return unitClass
+		if (unitClass := parentCls.numerator.type.__exactUnitClass__(unit)) is not None:
+			return unitClass
+		return next(
+			(
+				i for i in unitIndex.get(unit)
+				if (u := getattr(i, '_unit', None)) and u.lower() == unit and MetaUnitClass.__isCompatibleUnitClass__(parentCls, i)
+			),
+			None
+		)
+
 	# @property
 	# def subTypes(cls):
 	# 	subs = super().subTypes
@@ -505,6 +620,8 @@ class Dimension(MetaUnitClass):
 			dimension.register(newCls)
 		else:
 			mcs.registerDimension(newCls)
+		# the dimension of the class is only known now, rebuild anything cached from the class tree
+		unitIndex.touch()
 
 		return newCls
 
@@ -607,6 +724,10 @@ class DerivedMeasurement(Measurement, metaclass=DerivedMeasurementMeta):
 			item = tuple(cls.type.__findUnitClass__(i) if isinstance(i, str) else i for i in item)
 		return cls.__getSlice__(HashSlice(item))
 
+	@classmethod
+	def __getSlice__(cls, item: HashSlice, ignoreFixed=False):
+		return classRegistry.memoize((cls, item, ignoreFixed), lambda: cls.__resolveSlice__(item, ignoreFixed))
+
 	@classmethod
 	def getClass(cls, units):
 		if isinstance(units, str):
@@ -618,8 +739,7 @@ class DerivedMeasurement(Measurement, metaclass=DerivedMeasurementMeta):
 		return cls[n:d:True]
 
 	@classmethod
-	@lru_cache(maxsize=32)
-	def __getSlice__(cls, item: HashSlice, ignoreFixed=False):
+	def __resolveSlice__(cls, item: HashSlice, ignoreFixed=False):
 		if isinstance(getattr(item, 'step', None), bool):
 			ignoreFixed = item.step
 		fixedN, fixedD = cls.fixedUnits if not ignoreFixed else (None, None)
@@ -652,7 +772,7 @@ class DerivedMeasurement(Measurement, metaclass=DerivedMeasurementMeta):
 			if exactMatch := sameDType & sameNType:
 				matchedType = exactMatch.pop()
 				if not issubclass(matchedType._type, genericType) and issubclass(cls._type, matchedType._type):
-					return type(f'{cls._type.__name__}[{matchedType.unit}]', (matchedType, cls._type), {})
+					return classRegistry.synthesize(f'{cls._type.__name__}[{matchedType.unit}]', (matchedType, cls._type))
 
 			if sameDType and (generics := {i for i in sameDType if i.numeratorClass.isGeneric}):
 				if len(generics) == 1:
@@ -670,20 +790,16 @@ class DerivedMeasurement(Measurement, metaclass=DerivedMeasurementMeta):
 						return generic[sliceDType or dType]
 
 			name = f'{genericType.__name__}[{sliceNType.id or sliceNType.__name__}/{sliceDType.id or sliceDType.__name__}]'
-			return type(name, (genericType,), {}, numerator=sliceNType, denominator=sliceDType)
+			return classRegistry.synthesize(name, (genericType,), numerator=sliceNType, denominator=sliceDType)
 		item = item.start
 		if issubclass(item, cls.numerator):
 			if not cls.denominator.isGeneric:
-				name = f'{cls.__name__}'
-				newCls = type(name, (cls,), {'_numerator': item})
-				return newCls
+				return classRegistry.synthesize(cls.__name__, (cls,), {'_numerator': item})
 			print(f'{cls.__name__} does not support {item.__name__} as numerator')
 
 		elif issubclass(item, cls.denominator):
 			if not cls.numeratorClass.isGeneric:
-				name = f'{cls.__name__}[{item.__name__}]'
-				newCls = type(name, (cls,), {'_denominator': item})
-				return newCls
+				return classRegistry.synthesize(f'{cls.__name__}[{item.__name__}]', (cls,), {'_denominator': item})
 			print(f'{cls.__name__} does not support {item.__name__} as denominator')
 
 		raise TypeError(f'{cls.__name__} does not support {item.__name__} as unit')
@@ -752,10 +868,9 @@ class DerivedMeasurement(Measurement, metaclass=DerivedMeasurementMeta):
 	def transform(self, other, transformTo: type = None):
 		if isinstance(other, type) and issubclass(other, Measurement):
 			other = other(self)
-		nonTransferred = ['_unit', '_suffix', '_scale', '_denominator', '_numerator']
 		if self.type != other.type:
 			log.warning(f'{self.withUnit} and {other.withUnit} are not identical types, this may cause issues')
-		other.__dict__.update({key: value for key, value in self.__dict__.items() if key not in nonTransferred and value is not None})
+		_transferAttributes(self, other)
 		if other._updateFunction:
 			other._updateFunction(other)
 		return other
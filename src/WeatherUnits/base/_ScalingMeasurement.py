@@ -1,26 +1,40 @@
 from abc import abstractmethod
+from bisect import bisect_right
 from enum import Enum, EnumMeta
 from itertools import groupby
-from math import prod
-from typing import Optional, Type, Tuple, Set, Dict, Union
+from math import isfinite, log10, prod, trunc
+from typing import List, Optional, Type, Tuple, Set, Dict, Union
 
 from ._Measurement import systemName
 from .. import errors
 from . import Measurement, DerivedMeasurement, MetaUnitClass
+from ._SmartFloat import _cachedForVersion
 from ..utils import Self
 
-__all__ = ['ScalingMeasurement', 'SystemVariant', 'Scale']
+__all__ = ['ScalingMeasurement', 'SystemVariant', 'Scale', 'ScaleTable', 'ScaleSplit']
+
+_crossSystemFactors: Dict[Tuple[type, type], float] = {}
+_scaleTables: Dict[type, Tuple[int, 'ScaleTable']] = {}
+_scaleSplits: Dict[tuple, Tuple[int, 'ScaleSplit']] = {}
 
 
 class AddressableEnum(EnumMeta):
 	_list: list['Scale']
+	_factors: Tuple[Tuple[float, ...], ...]
 
 	def __new__(cls, *args, **kwargs):
 		instance = super().__new__(cls, *args, **kwargs)
 		instance._list = [i for i in instance if not i.isVariant]
+		for scale in instance:
+			scale._absolute_ = scale._computeAbsoluteValue()
 		instance._sorted = sorted(instance, key=lambda x: x.absoluteValue)
 		for i, scale in enumerate(instance._sorted):
 			scale._index_ = i
+
+		# Dense conversion matrix indexed by sortedIndex: _factors[i][j] is the
+		# multiplier for converting a value from scale i to scale j
+		absoluteValues = [scale.absoluteValue for scale in instance._sorted]
+		instance._factors = tuple(tuple(a / b for b in absoluteValues) for a in absoluteValues)
 		return instance
 
 	def __getitem__(self, indexOrName):
@@ -48,6 +62,7 @@ class Indexer:
 
 class Scale(Enum, metaclass=AddressableEnum):
 	_index_: int
+	_absolute_: int | float
 
 	Base: 'Scale'
 
@@ -95,10 +110,19 @@ class Scale(Enum, metaclass=AddressableEnum):
 
 	@property
 	def absoluteValue(self) -> int | float:
+		return self._absolute_
+
+	def _computeAbsoluteValue(self) -> int | float:
 		if not self.isVariant:
 			return prod(i._mul_ for i in self._list if i.index <= self.index)
 		return self._mul_
 
+	def conversionFactor(self, other: 'Scale') -> float:
+		"""Returns the multiplier for converting a value from this scale to other"""
+		if type(other) is type(self):
+			return self._factors[self._index_][other._index_]
+		return self.absoluteValue / other.absoluteValue
+
 	def __truediv__(self, other):
 		if isinstance(other, self.__class__):
 			return self.absoluteValue / other.absoluteValue
@@ -168,6 +192,158 @@ class Scale(Enum, metaclass=AddressableEnum):
 			return self
 
 
+class ScaleTable:
+	"""
+	The scales of a unit class that have a class of their own, sorted from smallest to largest,
+	with the log10 of their absolute values for choosing a scale without converting through
+	every scale in between.
+
+	Scale selection only considers the current scale and the common scales of the class (every
+	scale when the class has none).  Indices are positions in scales and classes.
+	"""
+	__slots__ = ('scales', 'classes', 'logs', 'current', 'candidates', 'candidateLogs', 'factors')
+
+	scales: Tuple[Scale, ...]
+	classes: Tuple[Type['ScalingMeasurement'], ...]
+	logs: Tuple[float, ...]
+	current: int
+	candidates: Tuple[int, ...]
+	candidateLogs: Tuple[float, ...]
+	factors: Tuple[float, ...]
+
+	def __init__(self, unitClass: Type['ScalingMeasurement']):
+		current = unitClass.scale
+		allowed = unitClass.common or unitClass._Scale
+		scales, classes = [], []
+		for scale in unitClass._Scale._sorted:
+			cls = unitClass if scale is current else getattr(unitClass.type, scale.name, None)
+			if cls is not None:
+				scales.append(scale)
+				classes.append(cls)
+		self.scales = tuple(scales)
+		self.classes = tuple(classes)
+		self.logs = tuple(log10(i.absoluteValue) for i in scales)
+		self.current = next(i for i, scale in enumerate(scales) if scale is current)
+		self.candidates = tuple(i for i, scale in enumerate(scales) if scale is current or scale in allowed)
+		self.candidateLogs = tuple(self.logs[i] for i in self.candidates)
+		# multiplier from the current scale to each scale
+		self.factors = tuple(current.conversionFactor(i) for i in scales)
+
+	@classmethod
+	def of(cls, unitClass: Type['ScalingMeasurement']) -> 'ScaleTable':
+		"""The table of unitClass, rebuilt when unit classes are added"""
+		return _cachedForVersion(_scaleTables, unitClass, lambda: cls(unitClass))
+
+	def autoIndex(self, value: float) -> int:
+		"""The largest candidate scale in which value is at least 1, otherwise the smallest candidate"""
+		if not value or not isfinite(value):
+			return self.current
+		candidates, factors = self.candidates, self.factors
+		value = abs(value)
+		position = bisect_right(self.candidateLogs, log10(value) + self.logs[self.current]) - 1
+		# the estimate can be off by one at exact powers, settle it with the converted values
+		while position + 1 < len(candidates) and value * factors[candidates[position + 1]] >= 1:
+			position += 1
+		while position > 0 and value * factors[candidates[position]] < 1:
+			position -= 1
+		return candidates[max(position, 0)]
+
+	def bestFitIndex(self, value: float, maxDigits: int) -> int:
+		"""
+		The first scale from the current scale up, moving through the candidates and ending at the
+		largest scale, where the rounded value has at most maxDigits characters.
+		"""
+		if not isfinite(value):
+			return self.current
+		order = self.fitOrder
+		factors = self.factors
+
+		def fits(index: int) -> bool:
+			return len(str(round(value * factors[order[index]]))) <= maxDigits
+
+		if fits(0):
+			return order[0]
+		# digits grow with log10 of the value, estimate where the limit is crossed
+		logs = [self.logs[i] for i in order]
+		threshold = log10(abs(value)) + self.logs[self.current] - (maxDigits - (value < 0))
+		position = min(bisect_right(logs, threshold), len(order) - 1)
+		while position > 1 and fits(position - 1):
+			position -= 1
+		while position < len(order) - 1 and not fits(position):
+			position += 1
+		return order[position]
+
+	@property
+	def fitOrder(self) -> Tuple[int, ...]:
+		"""The scales bestFit moves through, the current scale, the larger candidates and the largest scale"""
+		order = [self.current, *(i for i in self.candidates if i > self.current)]
+		if order[-1] != len(self.scales) - 1:
+			order.append(len(self.scales) - 1)
+		return tuple(order)
+
+
+class ScaleSplit:
+	"""
+	The unit classes a value of one unit class is split into, largest first, with the factor from
+	the unit class of the value to each of them and from each to the next.
+
+	A split is a single pass of truncations, every unit except the last gets the whole units that
+	remain after the larger units and the last gets the rest including the fraction.
+	"""
+	__slots__ = ('classes', 'factors', 'steps', 'downFactor')
+
+	classes: Tuple[Type['ScalingMeasurement'], ...]
+	factors: Tuple[float, ...]
+	steps: Tuple[float, ...]
+	downFactor: float
+
+	def __init__(self, unitClass: Type['ScalingMeasurement'], into: Tuple[Type['ScalingMeasurement'], ...] = ()):
+		into = into or [getattr(unitClass.type, i.name) for i in unitClass.common if isinstance(i, Scale)] or list(unitClass.type.subTypes)
+		factors = [unitClass.getConversionFactor(unitClass, i) for i in into]
+		order = sorted(range(len(into)), key=factors.__getitem__)
+		self.classes = tuple(into[i] for i in order)
+		self.factors = tuple(factors[i] for i in order)
+		# factor from the previous unit, the first unit has no previous unit
+		self.steps = (0.0, *(unitClass.getConversionFactor(a, b) for a, b in zip(self.classes, self.classes[1:])))
+		self.downFactor = unitClass.scale.conversionFactor(unitClass.scale.down)
+
+	@classmethod
+	def of(cls, unitClass: Type['ScalingMeasurement'], into: Tuple[Type['ScalingMeasurement'], ...] = ()) -> 'ScaleSplit':
+		"""The split of unitClass into the given unit classes, rebuilt when unit classes are added"""
+		return _cachedForVersion(_scaleSplits, (unitClass, into), lambda: cls(unitClass, into))
+
+	def components(self, value: float) -> List[float]:
+		"""The value of each unit, zeros included"""
+		components, previous = [], 0
+		last = len(self.factors) - 1
+		for index, (factor, step) in enumerate(zip(self.factors, self.steps)):
+			whole = value * factor
+			if index != last:
+				whole = trunc(whole)
+			components.append(whole - previous * step)
+			previous = whole
+		return components
+
+	def split(self, value: float) -> List[Tuple[int, float]]:
+		"""
+		The (index, value) pairs of the non-zero units.  Components that round to zero are added to
+		the previous unit and units that round to zero are taken over by the next unit.
+		"""
+		components = self.components(value)
+		factors = self.factors
+		parts = [[0, components[0]]]
+		for index in range(1, len(components)):
+			component = components[index]
+			if not round(abs(component)):
+				previous = parts[-1]
+				previous[1] += component / factors[index] * factors[previous[0]]
+			elif not round(parts[-1][1]):
+				parts[-1] = [index, component]
+			else:
+				parts.append([index, component])
+		return [(index, value) for index, value in parts]
+
+
 class BaseUnit:
 
 	@abstractmethod
@@ -222,6 +398,12 @@ class ScalingMeasurement(Measurement):
 			return Measurement.__new__(cls, float(value), *args, **kwargs)
 
 		if sameSystem and sameDimension:
+			try:
+				factor = valueCls.scale.conversionFactor(cls.scale)
+			except KeyError:
+				pass
+			else:
+				return Measurement.__new__(cls, float(value) * factor, *args, **kwargs)
 			if isinstance(value, ScalingMeasurement) and not isinstance(value, value._baseUnit):
 				value = cls.changeScale(value, cls._Scale.Base)
 			if cls is cls._baseUnit:
@@ -230,8 +412,11 @@ class ScalingMeasurement(Measurement):
 				value = cls._baseUnit.changeScale(value, cls._Scale[cls.__name__], cls._Scale.Base)
 			return cls.__new__(cls, value)
 
-		# If values are cousins initiate with values base sibling causing a recursive call to __new__
 		elif sameDimension:
+			if (factor := cls._crossSystemFactor(valueCls)) is not None:
+				return Measurement.__new__(cls, float(value) * factor, *args, **kwargs)
+
+			# If values are cousins initiate with values base sibling causing a recursive call to __new__
 			if not isinstance(value, value._baseUnit):
 				value = value.toBaseUnit()
 			if (converter := getattr(value, f'_{cls._baseUnitRef.lower()}', None)) is not None:
@@ -295,26 +480,17 @@ class ScalingMeasurement(Measurement):
 		return int(self.only)
 
 	def splitInto(self: Self, *into: Type[Self]) -> Tuple[Self, ...]:
-		into = into or type(self).common or self.type.subTypes
-		into = sorted(into, key=lambda x: x(self).int)
-		if self.down == type(self)(0):
+		"""
+		Splits the value into whole units of the given unit classes, largest first, with the
+		remainder in the smallest unit, e.g. 3725 seconds into (1 hour, 2 minutes, 5 seconds).
+		Units without a whole unit are left out.  Defaults to the common units of the type.
+		"""
+		split = ScaleSplit.of(type(self), into)
+		value = float(self)
+		if round(value * split.downFactor) == 0:
 			return self,
-		top = into.pop(0)(self).typedInt
-		values = [top]
-		while into:
-			nextVal = into.pop(0)(self)
-			if into:
-				nextVal = nextVal.typedInt
-			nextVal = nextVal - top
-			top = nextVal + top
-			if abs(nextVal) < type(nextVal)(1):
-				values[-1] += nextVal
-			else:
-				if values[-1] == 0:
-					values[-1] = nextVal
-				else:
-					values.append(nextVal)
-		return tuple(values)
+		classes = split.classes
+		return tuple(classes[index](component) for index, component in split.split(value))
 
 	def splitIntoDict(self: Self, *into: Type[Self]) -> Dict[str, Self]:
 		values = self.splitInto(*into)
@@ -322,24 +498,52 @@ class ScalingMeasurement(Measurement):
 
 	def changeScale(self, newUnit: Scale, scale: Scale = None) -> Optional[float]:
 		scale = getattr(self, 'scale', scale)
-		if scale > newUnit:
-			return float(self) / (newUnit / scale)
-		else:
-			return float(self) * (scale / newUnit)
+		return float(self) * scale.conversionFactor(newUnit)
 
 	@staticmethod
 	def getConversionFactor(
 		fromUnit: Union[Type['ScalingMeasurement'], 'ScalingMeasurement'],
 		toUnit: Union[Type['ScalingMeasurement'], 'ScalingMeasurement'],
 	) -> float:
-		fromScale = fromUnit.scale
-		toScale = toUnit.scale
-		if fromScale > toScale:
-			return 1 / (toScale / fromScale)
-		elif fromScale == toScale:
-			return 1.0
+		if not isinstance(fromUnit, type):
+			fromUnit = type(fromUnit)
+		if not isinstance(toUnit, type):
+			toUnit = type(toUnit)
+		if fromUnit.system is not toUnit.system:
+			if (factor := toUnit._crossSystemFactor(fromUnit)) is not None:
+				return factor
+		return fromUnit.scale.conversionFactor(toUnit.scale)
+
+	@classmethod
+	def _crossSystemFactor(cls, fromUnit: Type['ScalingMeasurement']) -> Optional[float]:
+		"""
+		Returns the multiplier for converting fromUnit to cls when the two units belong to different
+		systems of the same dimension.  The link between the systems is found once by calling the
+		first converter method of fromUnit's base unit that targets a unit of cls's system, after
+		that every conversion between the pair is a single multiplication.
+		"""
+		key = (fromUnit, cls)
+		if (factor := _crossSystemFactors.get(key, None)) is not None:
+			return factor
+		fromBase = getattr(fromUnit, '_baseUnit', None)
+		if fromBase is None or getattr(cls, '_Scale', None) is None:
+			return None
+		try:
+			toScale = cls.scale
+			fromScale = fromUnit.scale
+		except KeyError:
+			return None
+		unit = fromBase(1.0)
+		targets = [cls._Scale.Base, *(scale for scale in cls._Scale if scale is not cls._Scale.Base)]
+		for target in targets:
+			if (converter := getattr(unit, f'_{target.name.lower()}', None)) is not None:
+				link = float(converter()) * target.conversionFactor(toScale)
+				break
 		else:
-			return fromScale / toScale
+			return None
+		factor = fromScale.conversionFactor(fromUnit._Scale.Base) * link
+		_crossSystemFactors[key] = factor
+		return factor
 
 	def toBaseUnit(self) -> Measurement:
 		return self._baseUnit(self.changeScale(self._Scale.Base))
@@ -360,31 +564,21 @@ class ScalingMeasurement(Measurement):
 
 	@property
 	def auto(self: Self) -> Self:
-		auto = self
-		if abs(auto.up) > abs((up := auto.up).one):
-			while abs(up.one) < abs(up) != abs(auto):
-				auto, up = up, up.up
-		else:
-			while not auto.int and auto.down != auto:
-				auto = auto.down
-
-		return auto
+		"""The value in the largest common scale in which it is at least 1"""
+		table = ScaleTable.of(type(self))
+		return self._toTableIndex(table, table.autoIndex(float(self)))
 
 	def bestFit(self, max_digits: int = None) -> Self:
 		"""Returns the best fit unit for the value"""
 		if max_digits is None:
 			max_digits = self.max
+		table = ScaleTable.of(type(self))
+		return self._toTableIndex(table, table.bestFitIndex(float(self), max_digits))
 
-		int_digits_count = self.intLength
-		value = self
-
-		while int_digits_count > max_digits:
-			old, value = value, value.upCommon
-			if type(old) is type(value):
-				return value
-			if (int_digits_count := value.intLength) <= max_digits:
-				return value
-		return value
+	def _toTableIndex(self: Self, table: ScaleTable, index: int) -> Self:
+		if index == table.current:
+			return self
+		return table.classes[index](float(self) * table.factors[index])
 
 
 class SystemVariant:
@@ -1,11 +1,12 @@
 import logging
 import re
+import threading
 from builtins import float, isinstance
 from collections import ChainMap, namedtuple
 from difflib import get_close_matches
 from functools import lru_cache, cached_property
 from locale import delocalize
-from typing import ClassVar, Optional, Set, Type, Union, Tuple, ForwardRef, TypeVar, Literal, Final, Mapping, Iterable
+from typing import Any, Callable, ClassVar, FrozenSet, Hashable, Dict, List, NamedTuple, Optional, Set, Type, Union, Tuple, ForwardRef, TypeVar, Literal, Final, Mapping, MutableMapping, Iterable
 from math import nan, isnan, inf
 from decimal import Decimal
 
@@ -19,7 +20,7 @@ regexType: Final = Literal['b', 'c', 'd', 'e', 'E', 'f', 'F', 'g', 'G', 'n', 'o'
 
 log = logging.getLogger('WeatherUnits').getChild('SmartFloat')
 
-__all__ = ['SmartFloat', 'FiniteField', 'MetaUnitClass', 'FormatSpec']
+__all__ = ['SmartFloat', 'FiniteField', 'MetaUnitClass', 'FormatSpec', 'DisplayProfile', 'ClassRegistry']
 
 Measurement = ForwardRef('Measurement', is_class=True, module='Measurement')
 _T = TypeVar('_T', Measurement, float)
@@ -191,6 +192,277 @@ class UnitDict(dict):
 		super().__delitem__(k)
 
 
+class UnitIndex:
+	"""
+	Registry wide case-insensitive index of every unit string and alias.
+
+	Classes are added as they are defined by MetaUnitClass so exact lookups never have to
+	rebuild compatibleUnits.  The version is bumped with every change and is used to
+	invalidate anything derived from the set of defined units.
+	"""
+	__slots__ = ('_units', '_keys', 'version')
+
+	_units: Dict[str, List[Type]]
+	_keys: Dict[Type, Set[str]]
+	version: int
+
+	def __init__(self):
+		self._units = {}
+		self._keys = {}
+		self.version = 0
+
+	@staticmethod
+	def keysFor(cls: Type) -> Set[str]:
+		keys = {
+			getattr(cls, '_unit', None),
+			getattr(cls, '_name', cls.__name__),
+			getattr(cls, '_pluralName', None),
+			getattr(cls, '_pluralUnit', None),
+			*getattr(cls, '_aliases', ()),
+		}
+		return {key.lower() for key in keys if key and isinstance(key, str)}
+
+	def add(self, cls: Type) -> None:
+		self.discard(cls)
+		keys = self._keys[cls] = self.keysFor(cls)
+		for key in keys:
+			self._units.setdefault(key, []).append(cls)
+		self.version += 1
+
+	def discard(self, cls: Type) -> None:
+		for key in self._keys.pop(cls, ()):
+			classes = self._units[key]
+			classes.remove(cls)
+			if not classes:
+				del self._units[key]
+
+	def remove(self, cls: Type) -> None:
+		"""Unregisters a class, e.g. one defined by a test, from unit lookups and the subTypes of its bases"""
+		self.discard(cls)
+		self.version += 1
+
+	def touch(self) -> None:
+		"""Bumps the version for changes to the class tree that do not change any unit strings"""
+		self.version += 1
+
+	def get(self, unit: str) -> Tuple[Type, ...]:
+		"""Returns every class matching the unit string, most recently defined first"""
+		return tuple(reversed(self._units.get(unit.lower(), ())))
+
+	def __contains__(self, unit: str) -> bool:
+		return unit.lower() in self._units
+
+	def __len__(self) -> int:
+		return len(self._units)
+
+
+unitIndex: Final = UnitIndex()
+
+# Attributes that unitIndex keys are built from
+_indexedAttributes: Final = frozenset({'_unit', '_name', '_pluralName', '_pluralUnit', '_aliases'})
+
+# subTypes and compatibleUnits of each class with the unitIndex version they were built at
+_subTypes: Dict[Type, Tuple[int, FrozenSet[Type]]] = {}
+_compatibleUnits: Dict[Type, Tuple[int, Mapping[str, Type]]] = {}
+
+
+def _cachedForVersion(cache: Dict[Hashable, Tuple[int, Any]], key: Hashable, build: Callable[[], Any]) -> Any:
+	"""Returns the value stored for key, building it again when unitIndex has changed since it was stored"""
+	version, value = cache.get(key, (None, None))
+	if version != unitIndex.version:
+		value = build()
+		cache[key] = unitIndex.version, value
+	return value
+
+
+class RegistryInfo(NamedTuple):
+	hits: int
+	misses: int
+	size: int
+
+
+class ClassRegistry:
+	"""
+	Registry of the classes created on demand by Measurement[...] and DerivedMeasurement[...].
+
+	Each class is created once for its name, bases and class arguments, e.g. the generic type,
+	numerator and denominator of a derived class, and the same class is returned from then on.
+	Created classes are never dropped, their keys only hold unit classes so they are bounded by
+	the number of unit combinations in use.  The result of each lookup, e.g. Wind['km':'hr'], is
+	stored as well so repeating a lookup returns the same class even when classes created in
+	between would change its result.  Lookup keys may hold the strings given by the caller, so at
+	most maxLookups of them are stored and further lookups are resolved each time.
+
+	Lookups of existing classes do not take the creation lock, creation is serialized with a
+	reentrant lock since creating a class may create its parts.  Hits are counted under a
+	separate lock so the statistics are exact with concurrent lookups.
+	"""
+	__slots__ = ('_classes', '_lock', '_statsLock', 'hits', 'misses', 'lookups', 'maxLookups')
+
+	_classes: Dict[tuple, Type]
+	hits: int
+	misses: int
+	lookups: int
+	maxLookups: int
+
+	def __init__(self, maxLookups: int = 4096):
+		self._classes = {}
+		self._lock = threading.RLock()
+		self._statsLock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		self.lookups = 0
+		self.maxLookups = maxLookups
+
+	def synthesize(self, name: str, bases: Tuple[Type, ...], attrs: Mapping[str, Any] = None, **kwargs) -> Type:
+		"""Returns the class created by type(name, bases, attrs, **kwargs), creating it only once"""
+		attrs = attrs or {}
+		key = (name, bases, tuple(attrs.items()), tuple(kwargs.items()))
+		return self.memoize(key, lambda: type(name, bases, dict(attrs), **kwargs), lookup=False)
+
+	def memoize(self, key: Hashable, factory: Callable[[], Type], lookup: bool = True) -> Type:
+		"""
+		Returns the class stored for key, storing the result of factory on the first call.
+		Results of lookups are only stored while fewer than maxLookups are stored.
+		"""
+		if (cls := self._classes.get(key, None)) is not None:
+			with self._statsLock:
+				self.hits += 1
+			return cls
+		with self._lock:
+			if (cls := self._classes.get(key, None)) is not None:
+				with self._statsLock:
+					self.hits += 1
+				return cls
+			cls = factory()
+			if not lookup:
+				self._classes[key] = cls
+			elif self.lookups < self.maxLookups:
+				self._classes[key] = cls
+				self.lookups += 1
+			with self._statsLock:
+				self.misses += 1
+		return cls
+
+	def info(self) -> RegistryInfo:
+		return RegistryInfo(self.hits, self.misses, len(self._classes))
+
+	def __contains__(self, cls: Type) -> bool:
+		return cls in self._classes.values()
+
+	def __len__(self) -> int:
+		return len(self._classes)
+
+
+classRegistry: Final = ClassRegistry()
+
+
+@lru_cache(maxsize=512)
+def _fuzzyFindUnitClass(cls: 'MetaUnitClass', unit: str, version: int) -> Optional[Type]:
+	# version is only part of the cache key, new unit classes invalidate previous results
+	unitDict = cls.compatibleUnits
+	closestMatch = get_close_matches(unit, (i.lower() for i in unitDict.keys()), 1, cutoff=0.7)
+	if closestMatch:
+		return unitDict[closestMatch[0]]
+	return None
+
+
+class ParsedFormatSpec(NamedTuple):
+	"""
+	A format spec string parsed for a unit class.  Items are stored as tuples so cached
+	instances can be shared, __format__ copies whatever it modifies.
+	"""
+	convertTo: Optional[str | Tuple[str, ...]]
+	attemptedUnits: Tuple[str, ...]
+	precisionSpec: Tuple[Tuple[str, str], ...]
+	specParams: Tuple[Tuple[str, Any], ...]
+
+
+class ParsedFormatTemplate(NamedTuple):
+	"""The value spec and replacement fields found in a format template"""
+	valueSpec: Tuple[Tuple[str, str], ...]
+	formatVars: Tuple[Tuple[str, Tuple[Tuple[str, Optional[str]], ...]], ...]
+
+
+@lru_cache(maxsize=1024)
+def _parseFormatSpec(cls: 'MetaUnitClass', formatSpec: str, version: int) -> ParsedFormatSpec:
+	# version is only part of the cache key, the compatible units change when new unit classes are defined
+	convertTo = None
+	unitSet = set(cls.compatibleUnits) | {'auto'}
+
+	conversionSpecMatch = FormatSpec.conversion.search(formatSpec)
+	if conversionSpecMatch:
+		conversionSpecMatch = conversionSpecMatch.groupdict()
+		parsedUnit = cls.__parse_unit__(conversionSpecMatch['convertTo'])
+		if isinstance(parsedUnit, str) and parsedUnit.lower() in unitSet:
+			formatSpec = re.sub(fr'{conversionSpecMatch["fullmatch"]}', '', formatSpec)
+			convertTo = ({parsedUnit} & unitSet).pop()
+		elif isinstance(parsedUnit, Iterable) and hasattr(cls, 'numerator') and any(i.lower() in unitSet for i in parsedUnit):
+			formatSpec = re.sub(fr'{conversionSpecMatch["fullmatch"]}', '', formatSpec)
+			convertTo = tuple(i.lower() for i in parsedUnit if i in unitSet)
+
+	if (precisionSpec := FormatSpec.precision.search(formatSpec)) and precisionSpec.group():
+		formatSpec = formatSpec[:precisionSpec.start()-1] if formatSpec.endswith(precisionSpec.group()) else formatSpec[precisionSpec.end()+1:]
+		precisionSpec = precisionSpec.groupdict()
+	else:
+		precisionSpec = {'format_spec': ''}
+
+	specParams = dict((i['key'], i['value']) for i in FormatSpec.params.finditer(formatSpec))
+	for key, value in specParams.items():
+		if number := FormatSpec.getNumber(value, strict=True):
+			specParams[key] = number
+		elif (boolValue := FormatSpec.getBool(value, strict=None)) is not None:
+			specParams[key] = boolValue if boolValue is not None else empty
+
+	paramsSpecConversionMatch = cls.__parse_unit__(specParams.get('convert', None))
+	paramsSpecConversion = next(iter({paramsSpecConversionMatch} & unitSet), None)
+	attemptedUnits = ()
+	if not (convertTo := (convertTo or paramsSpecConversion)) and paramsSpecConversionMatch:
+		attemptedUnits = tuple(i for i in (conversionSpecMatch and conversionSpecMatch['convertTo'], paramsSpecConversionMatch) if i)
+
+	return ParsedFormatSpec(
+		convertTo=convertTo,
+		attemptedUnits=attemptedUnits,
+		precisionSpec=tuple((key, value) for key, value in precisionSpec.items() if value is not None),
+		specParams=tuple(specParams.items()),
+	)
+
+
+@lru_cache(maxsize=256)
+def _parseFormatTemplate(formatString: str) -> ParsedFormatTemplate:
+	if valueSpec := FormatSpec.valueParams.search(formatString):
+		valueSpec = tuple((key, value) for key, value in valueSpec.groupdict().items() if value is not None)
+	else:
+		valueSpec = ()
+	formatVars = tuple((i['name'], tuple(i.groupdict().items())) for i in FormatSpec.formatParams.finditer(formatString))
+	return ParsedFormatTemplate(valueSpec, formatVars)
+
+
+def _applyGeneralType(params: MutableMapping, floatValue: float, large: bool, intLength: int, valuePrecision: int, shortened) -> float:
+	"""
+	Resolves the 'g' format type into a precision and type for the value, updating params in place.
+	:return: The value rounded to the resolved precision
+	"""
+	p = int(params['precision'])
+	if large:
+		max_ = int(params['max'])
+		params['value'] = floatValue = round(floatValue, min(p, valuePrecision))
+		if p:
+			totalLength = intLength + min(p, valuePrecision)
+			params['precision'] = min(totalLength, max_) or 1
+		else:
+			if shortened:
+				totalLength = min(intLength + valuePrecision, max_) - intLength
+				params['precision'] = min(valuePrecision, totalLength) or 1
+				params['type'] = 'f'
+			else:
+				params['precision'] = intLength or 1
+	else:
+		params['type'] = 'f'
+		params['precision'] = p
+	return floatValue
+
+
 class MetaUnitClass(type):
 
 	global Measurement
@@ -311,6 +583,7 @@ class MetaUnitClass(type):
 			attrs.update({key: value for key, value in config.unitDefaults.items() if value is not None})
 			# attrs['__unitDict__'] = ChainMap()
 			Measurement = super().__new__(mcs, name, bases, attrs, **kwargs)
+			unitIndex.add(Measurement)
 			return Measurement
 		# unitDict = ChainMap()
 		# for base in genericBases:
@@ -332,9 +605,19 @@ class MetaUnitClass(type):
 		attrs['__annotations__'] = ChainMap(attrs.get('__annotations__', {}), *(b.__dict__.get('__annotations__', {}) for b in bases))
 
 		mcs = super().__new__(mcs, name, bases, attrs, **kwargs)
+		unitIndex.add(mcs)
 		# mcs._addSpecials()
 		return mcs
 
+	def __setattr__(cls, key, value):
+		super().__setattr__(key, value)
+		if key in _indexedAttributes and cls in unitIndex._keys:
+			subclasses = [cls]
+			while subclasses:
+				sub = subclasses.pop()
+				unitIndex.add(sub)
+				subclasses.extend(sub.__subclasses__())
+
 	def _addSpecials(cls):
 		name = cls.__name__
 		one = cls(1)
@@ -426,13 +709,19 @@ class MetaUnitClass(type):
 		return getattr(self, '__dimension__', None)
 
 	@property
-	def subTypes(cls):
+	def subTypes(cls) -> FrozenSet[Type[Measurement]]:
+		"""Every subclass in the same dimension, rebuilt only after the class tree changes"""
+		return _cachedForVersion(_subTypes, cls, cls.__buildSubTypes__)
+
+	def __buildSubTypes__(cls) -> FrozenSet[Type[Measurement]]:
 		subs: Set[Type['Measurement']] = set()
 		for sub in cls.__subclasses__():
+			if sub not in unitIndex._keys:
+				continue
 			if sub.dimension == cls.dimension:
 				subs.add(sub)
 			subs.update(getattr(sub, 'subTypes', set()))
-		return subs
+		return frozenset(subs)
 
 	@property
 	def unit(cls) -> str:
@@ -468,8 +757,12 @@ class MetaUnitClass(type):
 
 	@property
 	def compatibleUnits(cls) -> UnitDict:
+		"""Every unit string of the type mapped to its class, shared between calls and not to be modified"""
+		return _cachedForVersion(_compatibleUnits, cls.type, cls.type.__buildCompatibleUnits__)
+
+	def __buildCompatibleUnits__(cls) -> UnitDict:
 		units = UnitDict()
-		for subtype in cls.type.subTypes:
+		for subtype in cls.subTypes:
 			units.update({alias.lower(): subtype for alias in (subtype.unit, *subtype.aliases) if alias})
 		units.pop(None, None)
 		return units
@@ -525,14 +818,24 @@ class MetaUnitClass(type):
 			return f'<{cls.__name__}>'
 		return cls.__name__
 
-	# @lru_cache(maxsize=512)
 	def __findUnitClass__(cls, unit: str) -> Type[Measurement] | None:
-		unitDict = cls.compatibleUnits
-		# unitDict.update({v.__name__.lower(): v for v in unitDict.values() if v.__name__.lower() not in unitDict})
-		closestMatch = get_close_matches(unit.lower(), (i.lower() for i in unitDict.keys()), 1, cutoff=0.7)
-		if closestMatch:
-			return unitDict[closestMatch[0]]
-		return None
+		unit = unit.lower()
+		if (unitClass := cls.__exactUnitClass__(unit)) is not None:
+			return unitClass
+		return _fuzzyFindUnitClass(cls, unit, unitIndex.version)
+
+	def __exactUnitClass__(cls, unit: str) -> Type[Measurement] | None:
+		return next((i for i in unitIndex.get(unit) if cls.__isCompatibleUnitClass__(i)), None)
+
+	def __isCompatibleUnitClass__(cls, unitClass: Type[Measurement]) -> bool:
+		"""Equivalent to unitClass in cls.type.subTypes without walking the class tree"""
+		generic = cls.type
+		dimension = unitClass.dimension
+		return any(
+			(base is generic or (isinstance(base, MetaUnitClass) and issubclass(base, generic)))
+			and base.dimension == dimension
+			for base in unitClass.__bases__
+		)
 
 	@property
 	def pluralName(self) -> Optional[str]:
@@ -552,6 +855,68 @@ class MetaUnitClass(type):
 		return cls._limitFunc(value)
 
 
+class DisplayProfile:
+	"""
+	Display settings of a value that differ from the defaults of its class.
+
+	Profiles are immutable and interned, every value with the same settings references the same
+	profile and copying a value only copies the reference.  Changing a setting of a value swaps
+	its profile for the interned profile with that setting replaced.  Settings left as None fall
+	back to the class attribute of the same name with a leading underscore, e.g. _precision.
+	"""
+	__slots__ = ('precision', 'max', 'unitSpacer', 'shorten', 'showUnit', 'decorator')
+	__interned__: ClassVar[Dict[tuple, 'DisplayProfile']] = {}
+
+	precision: Optional[int]
+	max: Optional[int]
+	unitSpacer: Optional[Union[bool, str]]
+	shorten: Optional[bool]
+	showUnit: Optional[bool]
+	decorator: Optional[str]
+
+	def __new__(
+		cls,
+		precision: int = None,
+		max: int = None,
+		unitSpacer: Union[bool, str] = None,
+		shorten: bool = None,
+		showUnit: bool = None,
+		decorator: str = None,
+	) -> 'DisplayProfile':
+		settings = (precision, max, unitSpacer, shorten, showUnit, decorator)
+		# types are part of the key so True and 1 do not share a profile
+		key = tuple((type(i), i) for i in settings)
+		if (profile := cls.__interned__.get(key, None)) is None:
+			profile = cls.__interned__[key] = object.__new__(cls)
+			for name, value in zip(cls.__slots__, settings):
+				object.__setattr__(profile, name, value)
+		return profile
+
+	def __setattr__(self, key, value):
+		raise AttributeError(f'{type(self).__name__} is immutable, use replace()')
+
+	def __delattr__(self, key):
+		raise AttributeError(f'{type(self).__name__} is immutable, use replace()')
+
+	def __reduce__(self):
+		return type(self), self.settings
+
+	def __repr__(self):
+		changes = ', '.join(f'{name}={value!r}' for name, value in zip(self.__slots__, self.settings) if value is not None)
+		return f'{type(self).__name__}({changes})'
+
+	@property
+	def settings(self) -> tuple:
+		return tuple(getattr(self, name) for name in self.__slots__)
+
+	def replace(self, **changes) -> 'DisplayProfile':
+		"""Returns the profile with the given settings replaced"""
+		return DisplayProfile(**{**dict(zip(self.__slots__, self.settings)), **changes})
+
+
+defaultDisplay: Final = DisplayProfile()
+
+
 class SmartFloat(float, metaclass=MetaUnitClass):
 	_limits = -inf, inf
 	_precision: int = 3
@@ -565,6 +930,7 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 	_showUnit: Optional[bool]
 	_shorten: Optional[bool]
 	_kSeparator: Optional[str]
+	_display: DisplayProfile = defaultDisplay
 	_key: Optional[Union[str, Set[Union[str, Tuple[str]]]]]
 	_sizeHint: Optional[str]
 	_acceptedTypes: ClassVar[tuple] = (float, int, Decimal)
@@ -634,15 +1000,15 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		formatSpec: str = None,
 	) -> str:
 		if shorten is None:
-			shorten = getattr(self, '_shorten', False)
+			shorten = self.shorten
 		if prefix is None:
 			prefix = getattr(self, '_prefix', '')
 		if suffix is None:
 			suffix = getattr(self, '_suffix', '')
 		if decorator is None:
-			decorator = getattr(self, '_decorator', '')
+			decorator = self._displaySetting('decorator', '')
 		if spacer is None:
-			spacer = getattr(self, '_unitSpacer', '')
+			spacer = self._displaySetting('unitSpacer', '')
 		elif spacer is True:
 			spacer = getattr(self, '_spacer', ' ') or ' '
 		else:
@@ -650,14 +1016,14 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		if unit is None:
 			unit = getattr(self, 'unit', True)
 		if maxLength is None:
-			maxLength = getattr(self, '_max', 4)
+			maxLength = self.max
 		if formatSpec is None:
 			formatSpec = getattr(self, '_format', 'g')
 
 		if shorten:
 			c, valueFloat = 0, float(self)
 			numberLength = len(str(int(valueFloat)))
-			while numberLength > 3 and numberLength >= self._max:
+			while numberLength > 3 and numberLength >= self.max:
 				c += 1
 				valueFloat /= 1000
 				numberLength = len(str(int(valueFloat)))
@@ -677,8 +1043,8 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		stringType = 'f'
 
 		# Max amount of precision that can be displayed while keeping string under max length
-		intAllowedPrecision = max(0, self._max - integerLength)
-		precision = min(self._precision, integerLength)
+		intAllowedPrecision = max(0, self.max - integerLength)
+		precision = min(self._displaySetting('precision'), integerLength)
 		# Allow at least on level of precision if
 		# Removed 1 if not decimal and c else decimal
 
@@ -688,43 +1054,16 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		return f'{self}'
 
 	def __format__(self, formatSpec, **extras):
-		convertTo = None
-		compatible_units = type(self).compatibleUnits
-
 		if isinstance(formatSpec, dict):
 			params, formatSpec = formatSpec, formatSpec.get('format', '')
 		else:
 			params = {}
 
-		conversionSpecMatch = FormatSpec.conversion.search(formatSpec)
-		unitSet = set(compatible_units) | {'auto'}
-		if conversionSpecMatch:
-			conversionSpecMatch = conversionSpecMatch.groupdict()
-			parsedUnit = type(self).__parse_unit__(conversionSpecMatch['convertTo'])
-			if isinstance(parsedUnit, str) and parsedUnit.lower() in unitSet:
-				formatSpec = re.sub(fr'{conversionSpecMatch["fullmatch"]}', '', formatSpec)
-				convertTo = ({parsedUnit} & unitSet).pop()
-			elif isinstance(parsedUnit, Iterable) and hasattr(self, 'numerator') and any(i.lower() in unitSet for i in parsedUnit):
-				formatSpec = re.sub(fr'{conversionSpecMatch["fullmatch"]}', '', formatSpec)
-				convertTo = tuple(i.lower() for i in parsedUnit if i in unitSet)
-
-		if (precisionSpec := FormatSpec.precision.search(formatSpec)) and precisionSpec.group():
-			formatSpec = formatSpec[:precisionSpec.start()-1] if formatSpec.endswith(precisionSpec.group()) else formatSpec[precisionSpec.end()+1:]
-			precisionSpec = precisionSpec.groupdict()
-		else:
-			precisionSpec = {'format_spec': ''}
-
-		specParams = dict((i['key'], i['value']) for i in FormatSpec.params.finditer(formatSpec))
-		for key, value in specParams.items():
-			if number := FormatSpec.getNumber(value, strict=True):
-				specParams[key] = number
-			elif (boolValue := FormatSpec.getBool(value, strict=None)) is not None:
-				specParams[key] = boolValue if boolValue is not None else empty
+		spec = _parseFormatSpec(type(self), formatSpec, unitIndex.version)
+		specParams = dict(spec.specParams)
 
 		# Conversion
-		paramsSpecConversionMatch = type(self).__parse_unit__(specParams.get('convert', None))
-		paramsSpecConversion = next(iter({paramsSpecConversionMatch} & unitSet), None)
-		if convertTo := (convertTo or paramsSpecConversion):
+		if convertTo := spec.convertTo:
 			if convertTo == 'auto':
 				if (auto := getattr(self, 'auto', None)) is not None:
 					value = auto
@@ -732,14 +1071,9 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 					raise NotImplementedError(f'No auto conversion for {self.name}')
 			else:
 				value = type(self).type.getClass(convertTo)(self)
-		elif convertTo or paramsSpecConversionMatch:
-			attemptedUnit = []
-			if conversionSpecMatch:
-				attemptedUnit.append(conversionSpecMatch['convertTo'])
-			if paramsSpecConversionMatch:
-				attemptedUnit.append(paramsSpecConversionMatch)
+		elif spec.attemptedUnits:
 			compatibleUnits = sorted(i.unit for i in type(self).type.subTypes)
-			raise NotImplementedError(f'{" or ".join(repr(u) for u in attemptedUnit)} is not a valid conversion for {self.name}.  Valid conversions are: {compatibleUnits!r}')
+			raise NotImplementedError(f'{" or ".join(repr(u) for u in spec.attemptedUnits)} is not a valid conversion for {self.name}.  Valid conversions are: {compatibleUnits!r}')
 		else:
 			value = self
 
@@ -752,7 +1086,7 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		params.maps.insert(2, params.default)
 
 		intLength, valuePrecision = value.intFloatLength(floatValue)
-		max_len = params.get('max', value._max)
+		max_len = params.get('max', value.max)
 		shortened = False
 		if params.get('shorten', False):
 			starting_len = len(str(int(floatValue)))
@@ -794,23 +1128,20 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		params.formatString = formatString
 
 		# get format specs from inside the param formatSpec
-		if formatStringParams := FormatSpec.valueParams.search(formatString):
-			formatStringParams = formatStringParams.groupdict()
-			formatStringParams = {key: value for key, value in formatStringParams.items() if value is not None}
-		else:
-			formatStringParams = {}
+		template = _parseFormatTemplate(formatString)
+		formatStringParams = dict(template.valueSpec)
 
 		params.maps.insert(0, formatStringParams)
 		params.formatStringParams = formatStringParams
 
 		# get format specs from formatSpec
 
-		precisionSpec = {key: value for key, value in precisionSpec.items() if value is not None}
+		precisionSpec = dict(spec.precisionSpec)
 		params.maps.insert(0, precisionSpec)
 		params.precisionSpec = precisionSpec
 
 		# find all sub format spect
-		formatVarsSpecs = {i['name']: i.groupdict() for i in FormatSpec.formatParams.finditer(formatString)}
+		formatVarsSpecs = {name: dict(groups) for name, groups in template.formatVars}
 		params.formatVars = formatVarsSpecs
 
 		params['value'] = floatValue
@@ -822,23 +1153,7 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		# params.maps.insert(0, formatVarsSpecs)
 
 		if params['type'] == 'g':
-			p = int(params['precision'])
-			if float(value) > 1:
-				max_ = int(params['max'])
-				params['value'] = floatValue = round(floatValue, min(p, valuePrecision))
-				if p:
-					totalLength = intLength + min(p, valuePrecision)
-					params['precision'] = min(totalLength, max_) or 1
-				else:
-					if shortened:
-						totalLength = min(intLength + valuePrecision, max_) - intLength
-						params['precision'] = min(valuePrecision, totalLength) or 1
-						params['type'] = 'f'
-					else:
-						params['precision'] = intLength or 1
-			else:
-				params['type'] = 'f'
-				params['precision'] = p
+			floatValue = _applyGeneralType(params, floatValue, float(value) > 1, intLength, valuePrecision, shortened)
 
 		# determine if a plural unit should be used
 		if params.get('unit_type', 'unit') == 'name':
@@ -979,7 +1294,7 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 			attrs['decorator'] = decorator
 		if maxLength := getattr(self, 'max', None):
 			attrs['maxLength'] = maxLength
-		if precision := getattr(self, '_precision', None):
+		if precision := self._displaySetting('precision'):
 			attrs['precision'] = precision
 		if showUnit := getattr(self, 'showUnit', None):
 			attrs['showUnit'] = showUnit
@@ -1023,7 +1338,7 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 		return value
 
 	def __hash__(self):
-		return hash(round(self, max(self._precision, 1)))
+		return hash(round(self, max(self._displaySetting('precision'), 1)))
 
 	def __dir__(self):
 		return list(self.properties) + ['__class__', '__module__', '__doc__', 'defaultFormat', 'defaultFormatParams']
@@ -1109,26 +1424,43 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 	def key(self, value: str):
 		self._key = value
 
+	def _displaySetting(self, name: str, default: Any = None) -> Any:
+		"""The display setting from the profile of the value or the class default"""
+		if (value := getattr(self._display, name)) is None:
+			return getattr(type(self), f'_{name}', default)
+		return value
+
+	def _setDisplay(self, **changes) -> None:
+		self._display = self._display.replace(**changes)
+
+	@property
+	def display(self) -> DisplayProfile:
+		return self._display
+
 	@property
 	def showUnit(self) -> bool:
-		return getattr(self, '_showUnit', True)
+		return self._displaySetting('showUnit', True)
 
 	@showUnit.setter
 	def showUnit(self, value):
-		self._showUnit = value
+		self._setDisplay(showUnit=value)
 
 	@property
 	def decorator(self) -> str:
-		return getattr(self, '_decorator', empty)
+		return self._displaySetting('decorator', empty)
+
+	@decorator.setter
+	def decorator(self, value: str):
+		self._setDisplay(decorator=value)
 
 	@property
 	def precision(self) -> int:
 		_, valuePrecision = self.intFloatLength(self)
-		return min(valuePrecision, getattr(self, '_precision', inf))
+		return min(valuePrecision, self._displaySetting('precision', inf))
 
 	@precision.setter
 	def precision(self, value):
-		self._precision = value
+		self._setDisplay(precision=value)
 
 	@property
 	def formatType(self) -> str:
@@ -1136,27 +1468,27 @@ class SmartFloat(float, metaclass=MetaUnitClass):
 
 	@property
 	def max(self) -> int:
-		return self._max
+		return self._displaySetting('max')
 
 	@max.setter
 	def max(self, value: int):
-		self._max = value
+		self._setDisplay(max=value)
 
 	@property
 	def shorten(self) -> bool:
-		return getattr(self, '_shorten', False)
+		return self._displaySetting('shorten', False)
 
 	@shorten.setter
 	def shorten(self, value):
-		self._shorten = value
+		self._setDisplay(shorten=value)
 
 	@property
 	def unitSpacer(self):
-		spacer = getattr(self, '_unitSpacer', False)
+		spacer = self._displaySetting('unitSpacer', False)
 		if isinstance(spacer, str):
 			return spacer
 		return " " if spacer else ""
 
 	@unitSpacer.setter
 	def unitSpacer(self, value):
-		self._unitSpacer = value
+		self._setDisplay(unitSpacer=value)
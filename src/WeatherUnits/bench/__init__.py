@@ -0,0 +1,30 @@
+"""
+Benchmarks for WeatherUnits.
+
+Run with ``python -m WeatherUnits.bench <suite>``, results are printed or written as JSON and can be
+compared against a stored baseline with ``--baseline`` to flag regressions.
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+__all__ = ['writeResults', 'readBaseline', 'report']
+
+
+def writeResults(results: Dict, path: Optional[str] = None) -> None:
+	text = json.dumps(results, indent=2)
+	if path is None:
+		print(text)
+	else:
+		Path(path).write_text(text + '\n')
+
+
+def readBaseline(path: str) -> Dict:
+	return json.loads(Path(path).read_text())
+
+
+def report(regressions: List[str]) -> int:
+	"""Prints regressions found against a baseline and returns the exit status for the command line"""
+	for regression in regressions:
+		print(f'REGRESSION: {regression}')
+	return 1 if regressions else 0
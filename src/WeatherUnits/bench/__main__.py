@@ -0,0 +1,17 @@
+import sys
+from argparse import ArgumentParser
+
+from . import imports, hotpaths
+
+
+def main(argv=None) -> int:
+	parser = ArgumentParser(prog='python -m WeatherUnits.bench', description='WeatherUnits benchmarks')
+	suites = parser.add_subparsers(dest='suite', required=True)
+	imports.addArguments(suites.add_parser('import', help='cold import time and class creation costs'))
+	hotpaths.addArguments(suites.add_parser('hot', help='operations per second of conversion, arithmetic, comparison, formatting and parsing'))
+	args = parser.parse_args(argv)
+	return args.run(args)
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Microbenchmarks for the hot paths of WeatherUnits.
+
+Each case is timed with timeit in the current interpreter.  The number of loops per run is
+calibrated with Timer.autorange unless given, warmup runs are discarded and the best and median of
+the remaining runs are reported as operations per second.
+"""
+from argparse import ArgumentParser, Namespace
+from fnmatch import fnmatch
+from platform import python_version
+from statistics import median
+from timeit import Timer
+from typing import Dict, Iterable, List, Optional
+
+from . import writeResults, readBaseline, report
+
+__all__ = ['cases', 'run', 'compare']
+
+cases = {
+	'construct.scalar': 'Length.Meter(1500.5)',
+	'construct.limited': 'Humidity(0.5)',
+	'convert.sameSystem': 'meter.kilometer',
+	'convert.crossSystem': 'meter.foot',
+	'convert.affine': 'celsius.fahrenheit',
+	'derived.construct': 'Wind(meter, second)',
+	'derived.getSlice': 'Wind[Length.Mile, Time.Hour]',
+	'derived.convert': 'wind.mph',
+	'compare.eq': 'meter == foot',
+	'compare.lt': 'meter < foot',
+	'arith.add': 'meter + foot',
+	'arith.addSameUnit': 'meter + meter',
+	'arith.mul': 'meter * 2',
+	'format.default': 'format(meter, "")',
+	'format.convert': 'format(meter, "km")',
+	'format.time.timestamp': 'format(seconds, "timestamp")',
+	'format.time.clock': 'format(seconds, "%H:%MM:%SS")',
+	'format.time.ago': 'format(seconds, "ago")',
+	'parse.auto': 'auto("12 mph")',
+}
+
+
+def _namespace() -> Dict:
+	from .. import Length, Time, Temperature, Humidity, Wind, auto
+	meter = Length.Meter(1500.5)
+	return {
+		'Length': Length,
+		'Time': Time,
+		'Humidity': Humidity,
+		'Wind': Wind,
+		'auto': auto,
+		'meter': meter,
+		'foot': Length.Foot(3),
+		'second': Time.Second(1),
+		'seconds': Time.Second(3725),
+		'celsius': Temperature.Celsius(20),
+		'wind': Wind(Length.Meter(5), Time.Second(1)),
+	}
+
+
+def measure(statement: str, namespace: Dict, warmup: int = 1, repeat: int = 5, number: Optional[int] = None) -> Dict:
+	"""
+	Times a single statement.
+	:param statement: The statement to time
+	:param namespace: Globals for the statement
+	:param warmup: Runs discarded before timing
+	:param repeat: Timed runs
+	:param number: Loops per run, calibrated to at least 0.2 seconds per run by default
+	:return: Loops per run, best and median operations per second and the spread between runs
+	"""
+	timer = Timer(statement, globals=namespace)
+	if number is None:
+		number, _ = timer.autorange()
+	for _ in range(warmup):
+		timer.timeit(number)
+	times = timer.repeat(repeat, number)
+	best, middle = min(times), median(times)
+	return {
+		'number': number,
+		'opsPerSec': number / best,
+		'medianOpsPerSec': number / middle,
+		'spread': (max(times) - best) / best,
+	}
+
+
+def run(patterns: Iterable[str] = None, warmup: int = 1, repeat: int = 5, number: Optional[int] = None) -> Dict:
+	"""
+	Benchmarks every case matching any of patterns (shell style, e.g. 'format.*'), all cases by default.
+	"""
+	patterns = list(patterns or ['*'])
+	namespace = _namespace()
+	results = {
+		name: measure(statement, namespace, warmup, repeat, number)
+		for name, statement in cases.items()
+		if any(fnmatch(name, pattern) for pattern in patterns)
+	}
+	return {'suite': 'hot', 'python': python_version(), 'warmup': warmup, 'repeat': repeat, 'results': results}
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float = 0.15) -> List[str]:
+	"""Flags cases whose best operations per second dropped by more than tolerance"""
+	regressions = []
+	for name, result in results['results'].items():
+		if (previous := baseline['results'].get(name)) is None:
+			continue
+		if result['opsPerSec'] < previous['opsPerSec'] * (1 - tolerance):
+			regressions.append(f'{name} ran at {result["opsPerSec"]:,.0f} ops/s, baseline {previous["opsPerSec"]:,.0f} ops/s')
+	return regressions
+
+
+def addArguments(parser: ArgumentParser) -> None:
+	parser.add_argument('cases', nargs='*', metavar='case', help=f'case names or patterns, all by default: {", ".join(cases)}')
+	parser.add_argument('-w', '--warmup', type=int, default=1, help='runs discarded before timing')
+	parser.add_argument('-r', '--repeat', type=int, default=5, help='timed runs per case')
+	parser.add_argument('-n', '--number', type=int, help='loops per run, calibrated by default')
+	parser.add_argument('-o', '--output', help='write the JSON results to a file instead of stdout')
+	parser.add_argument('-b', '--baseline', help='JSON results to compare against')
+	parser.add_argument('-t', '--tolerance', type=float, default=0.15, help='allowed relative slowdown, 0.15 by default')
+	parser.set_defaults(run=main)
+
+
+def main(args: Namespace) -> int:
+	results = run(args.cases, args.warmup, args.repeat, args.number)
+	if not results['results']:
+		raise SystemExit(f'No cases match {", ".join(args.cases)}')
+	writeResults(results, args.output)
+	if args.baseline:
+		return report(compare(results, readBaseline(args.baseline), args.tolerance))
+	return 0
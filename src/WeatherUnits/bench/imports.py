@@ -0,0 +1,124 @@
+"""
+Cold import benchmark.
+
+Every target is imported in a fresh interpreter, once per repeat for wall time and once more under
+cProfile to count and time the calls that make up most of the import cost.
+"""
+import json
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from platform import python_version
+from statistics import median
+from typing import Dict, Iterable, List
+
+from . import writeResults, readBaseline, report
+
+__all__ = ['targets', 'run', 'compare']
+
+package = __name__.rsplit('.', 2)[0]
+root = Path(sys.modules[package].__file__).parents[package.count('.') + 1]
+
+targets = {
+	package: f'import {package}',
+	f'{package}[units]': f'import {package}; {package}._loadUnits()',
+	**{
+		f'{package}.{name}': f'import {package}.{name}'
+		for name in ('config', 'base', 'others', 'temperature', 'length', 'mass', 'time_', 'pressure', 'airQuality', 'digital', 'derived')
+	},
+}
+
+# Functions reported by name, resolved in the child after the import has finished
+profiled = {
+	'MetaUnitClass.__new__': f'{package}.base._SmartFloat:MetaUnitClass.__new__',
+	'Dimension.register': f'{package}.base._Measurement:Dimension.register',
+	'Config.read': f'{package}.config:Config.read',
+}
+
+_timeSource = '''
+from time import perf_counter
+start = perf_counter()
+{statement}
+print(perf_counter() - start)
+'''
+
+_profileSource = '''
+import cProfile, json, pstats
+from importlib import import_module
+profiler = cProfile.Profile()
+profiler.enable()
+{statement}
+profiler.disable()
+stats = pstats.Stats(profiler).stats
+result = {{}}
+for name, path in {profiled!r}.items():
+	module, qualname = path.split(':')
+	function = import_module(module)
+	for attribute in qualname.split('.'):
+		function = getattr(function, attribute)
+	code = getattr(function, '__func__', function).__code__
+	_, calls, _, cumulative, _ = stats.get((code.co_filename, code.co_firstlineno, code.co_name), (0, 0, 0, 0.0, None))
+	result[name] = {{'count': calls, 'time': cumulative}}
+print(json.dumps(result))
+'''
+
+
+def _runChild(source: str) -> str:
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(root), os.environ.get('PYTHONPATH')))))
+	return subprocess.run([sys.executable, '-c', source], cwd=root, env=env, capture_output=True, text=True, check=True).stdout
+
+
+def run(names: Iterable[str] = None, repeat: int = 5) -> Dict:
+	"""
+	Benchmarks the import of each target.
+	:param names: The targets to run, all targets by default
+	:param repeat: Number of fresh interpreters used to time each target
+	:return: JSON serializable results
+	"""
+	results = {}
+	for name in names or targets:
+		statement = targets[name]
+		times = [float(_runChild(_timeSource.format(statement=statement))) for _ in range(repeat)]
+		calls = json.loads(_runChild(_profileSource.format(statement=statement, profiled=profiled)))
+		results[name] = {'median': median(times), 'min': min(times), 'calls': calls}
+	return {'suite': 'import', 'python': python_version(), 'repeat': repeat, 'results': results}
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float = 0.25, floor: float = 0.002) -> List[str]:
+	"""
+	Compares results with a baseline.  A target regresses when its median import time grows by more
+	than tolerance and at least floor seconds, or when any profiled function is called more often.
+	"""
+	regressions = []
+	for name, result in results['results'].items():
+		if (previous := baseline['results'].get(name)) is None:
+			continue
+		limit = max(previous['median'] * (1 + tolerance), previous['median'] + floor)
+		if result['median'] > limit:
+			regressions.append(f'{name} import took {result["median"] * 1000:.1f}ms, baseline {previous["median"] * 1000:.1f}ms')
+		for function, calls in result['calls'].items():
+			previousCount = previous['calls'].get(function, {}).get('count', 0)
+			if calls['count'] > previousCount:
+				regressions.append(f'{name} called {function} {calls["count"]} times, baseline {previousCount}')
+	return regressions
+
+
+def addArguments(parser: ArgumentParser) -> None:
+	parser.add_argument('targets', nargs='*', metavar='target', help=f'targets to benchmark, all by default: {", ".join(targets)}')
+	parser.add_argument('-r', '--repeat', type=int, default=5, help='fresh interpreters per target')
+	parser.add_argument('-o', '--output', help='write the JSON results to a file instead of stdout')
+	parser.add_argument('-b', '--baseline', help='JSON results to compare against')
+	parser.add_argument('-t', '--tolerance', type=float, default=0.25, help='allowed relative slowdown, 0.25 by default')
+	parser.set_defaults(run=main)
+
+
+def main(args: Namespace) -> int:
+	if unknown := [i for i in args.targets if i not in targets]:
+		raise SystemExit(f'Unknown import targets: {", ".join(unknown)}')
+	results = run(args.targets, args.repeat)
+	writeResults(results, args.output)
+	if args.baseline:
+		return report(compare(results, readBaseline(args.baseline), args.tolerance))
+	return 0
@@ -97,7 +97,7 @@ class Config(ConfigParser):
 
 	@property
 	def unitDefaults(self):
-		return {f'_{prop}': convertString(value) for prop, value in config['UnitDefaults'].items()}
+		return {f'_{prop}': convertString(value) for prop, value in self['UnitDefaults'].items()}
 
 	@property
 	def localUnits(self) -> SectionProxy:
@@ -176,14 +176,31 @@ class Config(ConfigParser):
 		)
 
 
-config = Config()
-
-# search = config.search('locale', fuzzy=True, default=locale.getlocale()[0], accept=locale.locale_alias)
-locale.setlocale(locale.LC_ALL, '')
-
-try:
-	RADIX_CHAR = locale.nl_langinfo(locale.RADIXCHAR)
-	GROUPING_CHAR = locale.nl_langinfo(locale.THOUSEP)
-except AttributeError:
-	RADIX_CHAR = '.'
-	GROUPING_CHAR = ','
+def _setLocale():
+	global RADIX_CHAR, GROUPING_CHAR
+	# search = config.search('locale', fuzzy=True, default=locale.getlocale()[0], accept=locale.locale_alias)
+	locale.setlocale(locale.LC_ALL, '')
+
+	try:
+		RADIX_CHAR = locale.nl_langinfo(locale.RADIXCHAR)
+		GROUPING_CHAR = locale.nl_langinfo(locale.THOUSEP)
+	except AttributeError:
+		RADIX_CHAR = '.'
+		GROUPING_CHAR = ','
+
+
+def __getattr__(name: str):
+	"""
+	Loads the default config and the locale on first access of config, RADIX_CHAR or
+	GROUPING_CHAR rather than when the module is imported.
+	"""
+	global config
+	if name == 'config':
+		config = Config()
+		if 'RADIX_CHAR' not in globals():
+			_setLocale()
+		return config
+	if name in ('RADIX_CHAR', 'GROUPING_CHAR'):
+		_setLocale()
+		return globals()[name]
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,214 @@
+import re
+from decimal import Decimal
+from functools import lru_cache
+from math import isinf, prod
+from numbers import Real
+from typing import Iterable, List, Optional, Tuple, Type, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from . import _loadUnits
+from .base import Measurement, DerivedMeasurement, ScalingMeasurement
+from .errors import BadConversion, UnknownUnit
+
+__all__ = ['converter', 'Converter', 'conversionCoefficients']
+
+UnitExpression = Union[str, Type[Measurement]]
+Term = Tuple[Type[Measurement], int]
+
+_probeValues = (0.0, 100.0, 10.0, 1.0, 0.5, 0.25)
+_power = re.compile(r'^(?P<unit>.*?\D)\s*(?:\^?(?P<power>\d)|(?P<superscript>[²³]))$')
+_superscripts = {'²': 2, '³': 3}
+
+
+def _convertScalar(value: Measurement, target: UnitExpression) -> Measurement:
+	if isinstance(target, type):
+		return target(value)
+	if target.isidentifier() and (converted := getattr(value, target, None)) is not None and isinstance(converted, Measurement):
+		return converted
+	return value[target]
+
+
+@lru_cache(maxsize=256)
+def conversionCoefficients(unit: Type[Measurement], target: UnitExpression) -> Tuple[Type[Measurement], float, float]:
+	"""
+	Resolves a conversion from unit to target into the form y = x * scale + offset.
+
+	The coefficients are found by converting a few probe values inside the limits of unit, the
+	widest pair sets the coefficients and the rest are checked against them so non-affine
+	conversions are rejected.
+	:param unit: The unit class being converted from
+	:param target: A unit class or any string accepted by Measurement.__getitem__
+	:return: The class of the converted values, scale and offset
+	"""
+	low, high = unit.limits
+	probes = [i for i in _probeValues if low <= i <= high][:3]
+	if len(probes) < 2:
+		probes = [low, high] if not (isinf(low) or isinf(high)) else probes
+	if len(probes) < 2:
+		raise ValueError(f'Unable to find values within the limits of {unit!r} to resolve a conversion')
+
+	results = [_convertScalar(unit(x), target) for x in probes]
+	toUnit = type(results[0])
+	if any(type(i) is not toUnit for i in results):
+		raise UnknownUnit(unit.__name__, str(target))
+	(x0, y0), *checks, (x1, y1) = sorted(zip(probes, (float(i) for i in results)))
+	scale = (y1 - y0) / (x1 - x0)
+	offset = y0 - scale * x0
+	for x, y in checks:
+		if abs(x * scale + offset - float(y)) > 1e-9 * max(1.0, abs(float(y))):
+			raise ValueError(f'Conversion from {unit!r} to {target!r} is not affine and can not be vectorized')
+	return toUnit, scale, offset
+
+
+def _sameDimension(a: Type[Measurement], b: Type[Measurement]) -> bool:
+	if a.dimension is not None:
+		return a.dimension is b.dimension
+	return a.type is b.type
+
+
+def _unitCoefficients(fromUnit: Type[Measurement], toUnit: Type[Measurement]) -> Tuple[float, float]:
+	if fromUnit is toUnit:
+		return 1.0, 0.0
+	if not _sameDimension(fromUnit, toUnit):
+		raise BadConversion(fromUnit.__name__, toUnit.__name__)
+	if issubclass(fromUnit, ScalingMeasurement) and issubclass(toUnit, ScalingMeasurement):
+		return ScalingMeasurement.getConversionFactor(fromUnit, toUnit), 0.0
+	_, scale, offset = conversionCoefficients(fromUnit, toUnit)
+	return scale, offset
+
+
+def _findTerm(unit: str, scope: Type[Measurement]) -> Term:
+	power = 1
+	if (match := _power.match(unit)) is not None:
+		unit = match['unit']
+		power = int(match['power']) if match['power'] else _superscripts[match['superscript']]
+	if (unitClass := scope.__findUnitClass__(unit)) is None:
+		raise UnknownUnit(scope.__name__, unit)
+	return unitClass, power
+
+
+def _expandTerm(unitClass: Type[Measurement], power: int) -> Tuple[List[Term], List[Term]]:
+	if not issubclass(unitClass, DerivedMeasurement):
+		return [(unitClass, power)], []
+	numerator, denominator = unitClass.fixedUnits
+	if numerator is None or denominator is None:
+		raise UnknownUnit(repr(unitClass), 'a fixed numerator and denominator')
+	n, d = _expandTerm(numerator, power)
+	dn, dd = _expandTerm(denominator, power)
+	return n + dd, d + dn
+
+
+def _resolve(unit: UnitExpression, scope: Optional[Tuple[List[Term], List[Term]]] = None) -> Tuple[List[Term], List[Term]]:
+	"""
+	Resolves a unit expression into lists of numerator and denominator terms.  When scope is
+	given and has the same shape as the expression, each part is looked up within the
+	dimension of the matching single term of scope.
+	"""
+	if isinstance(unit, type):
+		return _expandTerm(unit, 1)
+	parts = DerivedMeasurement.__parse_unit__(unit)
+	if len(parts) > 2:
+		raise UnknownUnit(unit, 'a unit expression with a single denominator')
+
+	scopes = [Measurement] * len(parts)
+	if scope is not None and bool(scope[1]) == (len(parts) == 2):
+		for index, terms in enumerate(scope[:len(parts)]):
+			if len(terms) == 1:
+				scopes[index] = terms[0][0].dimension or terms[0][0].type
+
+	numerator, denominator = [], []
+	for index, (part, partScope) in enumerate(zip(parts, scopes)):
+		n, d = _expandTerm(*_findTerm(part, partScope))
+		if index:
+			n, d = d, n
+		numerator.extend(n)
+		denominator.extend(d)
+	return numerator, denominator
+
+
+def _pairTerms(fromTerms: List[Term], toTerms: List[Term], expression: Tuple[str, str]) -> List[Tuple[Term, Term]]:
+	if len(fromTerms) != len(toTerms):
+		raise BadConversion(*expression)
+	remaining = list(toTerms)
+	pairs = []
+	for term in fromTerms:
+		match = next((i for i in remaining if i[1] == term[1] and _sameDimension(term[0], i[0])), None)
+		if match is None:
+			raise BadConversion(*expression)
+		remaining.remove(match)
+		pairs.append((term, match))
+	return pairs
+
+
+class Converter:
+	"""
+	A conversion between two units resolved ahead of time into y = x * scale + offset.
+
+	Calling a converter with a number (numpy scalars and Decimal included), an iterable or a
+	numpy array returns plain floats in the same shape without creating any Measurement objects.
+	"""
+	__slots__ = ('fromUnit', 'toUnit', 'scale', 'offset')
+
+	fromUnit: UnitExpression
+	toUnit: UnitExpression
+	scale: float
+	offset: float
+
+	def __init__(self, fromUnit: UnitExpression, toUnit: UnitExpression, scale: float, offset: float = 0.0):
+		self.fromUnit = fromUnit
+		self.toUnit = toUnit
+		self.scale = scale
+		self.offset = offset
+
+	def __call__(self, value):
+		scale, offset = self.scale, self.offset
+		if isinstance(value, (Real, Decimal)):
+			return float(value) * scale + offset
+		if np is not None and isinstance(value, np.ndarray):
+			return value * scale + offset
+		if isinstance(value, Iterable):
+			return [float(i) * scale + offset for i in value]
+		raise TypeError(f'Unable to convert {value!r}')
+
+	def __repr__(self):
+		return f'{type(self).__name__}({self.fromUnit!r} -> {self.toUnit!r}, scale={self.scale:g}, offset={self.offset:g})'
+
+	@property
+	def inverse(self) -> 'Converter':
+		return Converter(self.toUnit, self.fromUnit, 1 / self.scale, -self.offset / self.scale)
+
+
+@lru_cache(maxsize=256)
+def converter(fromUnit: UnitExpression, toUnit: UnitExpression) -> Converter:
+	"""
+	Returns a reusable converter between two unit expressions.
+
+	Expressions may be unit classes, unit strings or aliases ('hPa', 'mph'), fractions of units
+	('m/s', 'mm/hr') and powers of units ('kg/m³', 'lbs/ft^3').  Affine conversions such as
+	temperature are only supported between single units.
+	:param fromUnit: The unit values are given in
+	:param toUnit: The unit values are converted to
+	:return: A cached Converter
+	"""
+	_loadUnits()
+	expression = (str(fromUnit), str(toUnit))
+	fromNumerator, fromDenominator = _resolve(fromUnit)
+	toNumerator, toDenominator = _resolve(toUnit, (fromNumerator, fromDenominator))
+
+	if len(fromNumerator) == len(toNumerator) == 1 and not fromDenominator and not toDenominator:
+		(fromClass, fromPower), (toClass, toPower) = fromNumerator[0], toNumerator[0]
+		if fromPower == toPower == 1:
+			return Converter(fromUnit, toUnit, *_unitCoefficients(fromClass, toClass))
+
+	factors = []
+	for pairs, sign in ((_pairTerms(fromNumerator, toNumerator, expression), 1), (_pairTerms(fromDenominator, toDenominator, expression), -1)):
+		for (fromClass, power), (toClass, _) in pairs:
+			scale, offset = _unitCoefficients(fromClass, toClass)
+			if offset:
+				raise BadConversion(f'{fromClass.__name__} in {expression[0]}', f'{toClass.__name__} in {expression[1]} without an offset')
+			factors.append(scale ** (power * sign))
+	return Converter(fromUnit, toUnit, prod(factors))
@@ -7,7 +7,7 @@ from ...derived import Wind, Precipitation
 from ...derived.precipitation import Daily as PrecipitationDaily, Hourly as PrecipitationHourly, Minutely as PrecipitationMinutely
 from ...temperature import Celsius
 from ...length import Kilometer, Meter, Millimeter
-from ...various import RSSI
+from ...digital import RSSI
 from enum import Flag as _Flag
 
 
@@ -30,13 +30,21 @@ class Debug(_Flag):
 
 
 class ResetFlags(_Flag):
-	BOR = 'Brownout'
-	PIN = 'PIN'
-	POR = 'Power'
-	SFT = 'Software'
-	WDG = 'Watchdog'
-	WWD = 'WindowWatchdog'
-	LPW = 'LowPower'
+	BOR = 0b0000001  # Brownout
+	PIN = 0b0000010  # PIN
+	POR = 0b0000100  # Power
+	SFT = 0b0001000  # Software
+	WDG = 0b0010000  # Watchdog
+	WWD = 0b0100000  # Window Watchdog
+	LPW = 0b1000000  # Low Power
+
+	@classmethod
+	def fromString(cls, value: str) -> 'ResetFlags':
+		"""Parses the comma separated reset_flags of a hub status message, e.g. 'BOR,PIN,POR'"""
+		flags = cls(0)
+		for flag in filter(None, (i.strip() for i in value.split(','))):
+			flags |= cls[flag]
+		return flags
 
 
 UDPClasses = {
@@ -59,12 +67,14 @@ UDPClasses = {
 
 	'precipitationRate':       'Precipitation',
 	'precipitationDaily':      'PrecipitationDaily',
+	'precipitationHourlyRaw':  'Precipitation',
 	'precipitationType':       Precipitation.Type,
 
 	'distance':                Kilometer,
 	'lightningLastDistance':   Kilometer,
 	'lightning':               LightningStrike,
 	'lightningEnergy':         int,
+	'energy':                  'lightningEnergy',
 
 	'battery':                 Voltage,
 	'reportInterval':          Time.Minute,
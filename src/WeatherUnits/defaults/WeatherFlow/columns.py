@@ -0,0 +1,85 @@
+"""
+Columnar decoding of WeatherFlow observation rows.
+
+Rows are read into a single float64 matrix and each field becomes one column, a MeasurementArray
+for fields with a unit class in UDPClasses and a plain float array for everything else (time,
+counts and enum codes).  Null values become nan.  No Measurement is created per value.
+Requires numpy.
+"""
+from typing import Dict, Sequence, Type, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from ...array import MeasurementArray, _requireNumpy
+from ...base import Measurement
+from . import UDP
+from .udp import _fieldType
+
+__all__ = ['ColumnDecoder', 'decodeColumns']
+
+Column = Union[MeasurementArray, 'np.ndarray']
+
+
+class ColumnDecoder:
+	"""
+	Decodes batches of rows of one message type into columns.
+
+	The unit class of each field and the factor between the raw value and that unit are resolved
+	once from UDPClasses, e.g. the per minute rain of obs_st is stored as mm/hr.
+	"""
+	__slots__ = ('messageType', 'fields', 'units', '_coefficients')
+
+	messageType: str
+	fields: Sequence[str]
+	units: Dict[str, Type[Measurement]]
+
+	def __init__(self, messageType: str = 'obs_st'):
+		self.messageType = messageType
+		self.fields = tuple(UDP.messageTypes[messageType])
+		self.units = {}
+		self._coefficients = {}
+		for name in self.fields:
+			try:
+				low, high = _fieldType(name)(10.0), _fieldType(name)(100.0)
+			except (ValueError, TypeError):
+				continue
+			if isinstance(low, Measurement):
+				scale = (float(high) - float(low)) / 90
+				self.units[name] = type(low)
+				self._coefficients[name] = (scale, float(low) - 10 * scale)
+
+	def decode(self, rows: Union[Sequence[Sequence[float | None]], 'np.ndarray']) -> Dict[str, Column]:
+		"""
+		:param rows: The rows of one or more messages, e.g. the 'obs' list of obs_st messages
+		:return: A column for every field of the message type
+		"""
+		_requireNumpy()
+		width = len(self.fields)
+		try:
+			matrix = np.asarray(rows, dtype=np.float64) if len(rows) else np.empty((0, width))
+		except ValueError:
+			# rows of different lengths, older firmware sends fewer fields
+			matrix = np.array([[*row, *(None,) * (width - len(row))][:width] for row in rows], dtype=np.float64)
+		if matrix.ndim != 2:
+			raise ValueError(f'Expected rows of {self.messageType} values')
+		if matrix.shape[1] < width:
+			matrix = np.pad(matrix, ((0, 0), (0, width - matrix.shape[1])), constant_values=np.nan)
+
+		columns = {}
+		for index, name in enumerate(self.fields):
+			values = np.ascontiguousarray(matrix[:, index])
+			if (unit := self.units.get(name, None)) is None:
+				columns[name] = values
+				continue
+			scale, offset = self._coefficients[name]
+			if scale != 1 or offset:
+				values = values * scale + offset
+			columns[name] = MeasurementArray(values, unit)
+		return columns
+
+
+def decodeColumns(rows: Union[Sequence[Sequence[float | None]], 'np.ndarray'], messageType: str = 'obs_st') -> Dict[str, Column]:
+	return ColumnDecoder(messageType).decode(rows)
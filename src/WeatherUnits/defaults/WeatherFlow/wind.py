@@ -0,0 +1,204 @@
+"""
+Sliding window statistics of rapid_wind samples.
+
+Hubs send a rapid_wind event every 3 seconds for each device.  WindBuffer keeps the samples of one
+device in fixed size arrays and updates the lull, average, gust and vector averaged direction as
+samples arrive and expire, so none of them requires a pass over the window.
+"""
+from array import array
+from collections import deque
+from math import atan2, cos, degrees, fsum, hypot, radians, sin
+from typing import Deque, Dict, Optional, Tuple, Union
+
+from ...base import Measurement
+from ...conversion import converter
+from ...derived import Wind
+from ...others import Direction
+from .udp import Observation, _fieldType
+
+__all__ = ['WindBuffer', 'WindBuffers']
+
+_wind = _fieldType('speed')
+
+# Running sums are recomputed from the arrays once every this many expired samples to bound float drift
+_resumEvery = 4096
+
+
+class WindBuffer:
+	"""
+	A ring buffer of wind samples covering the last window seconds.
+
+	Speeds are stored in m/s.  Lull and gust are tracked with monotonic deques of
+	(sequence, speed) pairs and the average speed and direction with running sums, making every
+	add and every statistic O(1) amortized.  The direction is the average of the wind vectors
+	so stronger samples weigh more and calm samples do not pull the direction towards north.
+	"""
+	__slots__ = ('window', 'capacity', '_times', '_speeds', '_x', '_y', '_start', '_end', '_lull', '_gust', '_sums', '_expired')
+
+	window: float
+	capacity: int
+
+	_lull: Deque[Tuple[int, float]]
+	_gust: Deque[Tuple[int, float]]
+
+	def __init__(self, window: float = 600, capacity: Optional[int] = None, interval: float = 3):
+		"""
+		:param window: Length of the window in seconds
+		:param capacity: Maximum number of samples kept, defaults to one window of samples sent every interval seconds
+		:param interval: Expected seconds between samples, only used for the default capacity
+		"""
+		if capacity is None:
+			capacity = int(window // interval) + 1
+		if capacity < 1:
+			raise ValueError('capacity must be at least 1')
+		self.window = window
+		self.capacity = capacity
+		self._times = array('d', bytes(8 * capacity))
+		self._speeds = array('d', bytes(8 * capacity))
+		self._x = array('d', bytes(8 * capacity))
+		self._y = array('d', bytes(8 * capacity))
+		self.clear()
+
+	def clear(self) -> None:
+		self._start = self._end = 0
+		self._lull = deque()
+		self._gust = deque()
+		self._sums = [0.0, 0.0, 0.0]
+		self._expired = 0
+
+	def __len__(self) -> int:
+		return self._end - self._start
+
+	def __repr__(self):
+		return f'{type(self).__name__}(window={self.window}, samples={len(self)}/{self.capacity})'
+
+	def add(self, time: float, speed: Union[float, Measurement, None], direction: Union[float, Measurement, None]) -> None:
+		"""
+		Adds a sample, expiring samples older than the window and the oldest sample when full.
+		Samples without a speed are ignored and samples without a direction only count towards the speed.
+		:param time: Epoch seconds of the sample, samples are expected in order
+		:param speed: m/s or a wind measurement
+		:param direction: Degrees or a Direction
+		"""
+		if speed is None:
+			return
+		if isinstance(speed, Measurement):
+			speed = converter(type(speed), 'm/s')(float(speed))
+		speed = float(speed)
+		self.expire(time)
+		if len(self) == self.capacity:
+			self._pop()
+
+		if direction is None:
+			x = y = 0.0
+		else:
+			angle = radians(float(direction))
+			x, y = speed * sin(angle), speed * cos(angle)
+
+		sequence = self._end
+		slot = sequence % self.capacity
+		self._times[slot], self._speeds[slot], self._x[slot], self._y[slot] = time, speed, x, y
+		self._end += 1
+
+		sums = self._sums
+		sums[0] += speed
+		sums[1] += x
+		sums[2] += y
+
+		lull, gust = self._lull, self._gust
+		while lull and lull[-1][1] >= speed:
+			lull.pop()
+		lull.append((sequence, speed))
+		while gust and gust[-1][1] <= speed:
+			gust.pop()
+		gust.append((sequence, speed))
+
+	def addObservation(self, observation: Observation) -> None:
+		"""Adds a decoded rapid_wind observation"""
+		self.add(observation.raw('time'), observation.raw('speed'), observation.raw('direction'))
+
+	def expire(self, now: float) -> None:
+		"""Removes the samples that are older than the window at now"""
+		cutoff = now - self.window
+		times, capacity = self._times, self.capacity
+		while self._start < self._end and times[self._start % capacity] <= cutoff:
+			self._pop()
+
+	def _pop(self) -> None:
+		sequence = self._start
+		slot = sequence % self.capacity
+		sums = self._sums
+		sums[0] -= self._speeds[slot]
+		sums[1] -= self._x[slot]
+		sums[2] -= self._y[slot]
+		self._start += 1
+
+		if self._lull[0][0] == sequence:
+			self._lull.popleft()
+		if self._gust[0][0] == sequence:
+			self._gust.popleft()
+
+		self._expired += 1
+		if self._expired >= _resumEvery:
+			self._resum()
+
+	def _resum(self) -> None:
+		slots = [i % self.capacity for i in range(self._start, self._end)]
+		self._sums = [fsum(values[i] for i in slots) for values in (self._speeds, self._x, self._y)]
+		self._expired = 0
+
+	@property
+	def lull(self) -> Optional[Wind]:
+		"""The slowest sample of the window"""
+		return _wind(self._lull[0][1]) if self._lull else None
+
+	@property
+	def gust(self) -> Optional[Wind]:
+		"""The fastest sample of the window"""
+		return _wind(self._gust[0][1]) if self._gust else None
+
+	@property
+	def average(self) -> Optional[Wind]:
+		"""The mean speed of the window"""
+		if not len(self):
+			return None
+		return _wind(max(self._sums[0] / len(self), 0.0))
+
+	@property
+	def direction(self) -> Optional[Direction]:
+		"""The direction of the average wind vector, None when empty or calm"""
+		_, x, y = self._sums
+		if not len(self) or hypot(x, y) <= 1e-9 * max(self._sums[0], 1.0):
+			return None
+		return Direction(degrees(atan2(x, y)) % 360)
+
+	@property
+	def vectorSpeed(self) -> Optional[Wind]:
+		"""The magnitude of the average wind vector, equal to average when the direction is steady"""
+		if not len(self):
+			return None
+		return _wind(hypot(self._sums[1], self._sums[2]) / len(self))
+
+	@property
+	def summary(self) -> Dict[str, Optional[Measurement]]:
+		return {'lull': self.lull, 'average': self.average, 'gust': self.gust, 'direction': self.direction}
+
+
+class WindBuffers(dict):
+	"""A WindBuffer for every device, created when the first sample of a device arrives"""
+
+	def __init__(self, window: float = 600, capacity: Optional[int] = None, interval: float = 3):
+		super().__init__()
+		self.window = window
+		self.capacity = capacity
+		self.interval = interval
+
+	def __missing__(self, serial: str) -> WindBuffer:
+		buffer = self[serial] = WindBuffer(self.window, self.capacity, self.interval)
+		return buffer
+
+	def addObservation(self, observation: Observation) -> WindBuffer:
+		"""Adds a rapid_wind observation to the buffer of its device and returns the buffer"""
+		buffer = self[observation.serial]
+		buffer.addObservation(observation)
+		return buffer
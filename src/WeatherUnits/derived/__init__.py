@@ -1,5 +1,6 @@
 from ..length import Length
 from ..mass import Mass
+from ..pressure import Pressure
 from .. import Time
 from .. import DerivedMeasurement
 from .. import Direction
@@ -12,5 +13,6 @@ from .precipitation import Precipitation
 from .volume import Volume
 from .density import Density
 from .partsPer import PartsPer
+from .tendency import PressureTendency
 
-__all__ = ['Volume', 'DistanceOverTime', 'Precipitation', 'Density', 'PartsPer', 'Wind']
+__all__ = ['Volume', 'DistanceOverTime', 'Precipitation', 'Density', 'PartsPer', 'PressureTendency', 'Wind']
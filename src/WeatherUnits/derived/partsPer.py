@@ -6,19 +6,18 @@ __all__ = ['PartsPer']
 
 
 @UnitType
-class PartsPer(ScalingMeasurement, baseClass='Hundred'):
+class PartsPer(ScalingMeasurement, baseUnit='Hundred'):
 	_precision = 0
 
 	class _Scale(Scale):
-		Hundred = 100
-		Thousand = 10
-		TenThousand = 10
-		HundredThousand = 10
-		Million = 10
+		Trillion = 1
 		Billion = 1000
-		Trillion = 1000
+		Million = 1000
+		HundredThousand = 10
+		TenThousand = 10
+		Thousand = 10
+		Hundred = 10
 		Base = 'Hundred'
-		Precent = 100.
 
 	@property
 	def hundred(self):
@@ -86,7 +85,7 @@ class Trillion(PartsPer):
 	_unit = 'ppt'
 
 
-PartsPer.Hunderd = Hundred
+PartsPer.Hundred = PartsPer.Hunderd = Hundred
 PartsPer.Precent = Hundred
 PartsPer.Thousand = Thousand
 PartsPer.TenThousand = TenThousand
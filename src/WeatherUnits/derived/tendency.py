@@ -0,0 +1,25 @@
+from ..base.Decorators import UnitType
+from . import Time, DerivedMeasurement, Pressure
+
+__all__ = ['PressureTendency']
+
+
+@UnitType
+class PressureTendency(DerivedMeasurement, numerator=Pressure, denominator=Time):
+	"""The rate a pressure changes at, e.g. hPa/hr"""
+
+	@property
+	def hPah(self):
+		return PressureTendency(self._numerator.hPa, self._denominator.hr)
+
+	@property
+	def inHgh(self):
+		return PressureTendency(self._numerator.inHg, self._denominator.hr)
+
+	@property
+	def mmHgh(self):
+		return PressureTendency(self._numerator.mmHg, self._denominator.hr)
+
+	@property
+	def Pas(self):
+		return PressureTendency(self._numerator.pascal, self._denominator.s)
@@ -0,0 +1,134 @@
+import re
+from math import inf
+from collections import ChainMap
+from typing import Dict, Iterable, List, Optional, Type, Union
+
+from .base import Measurement, SmartFloat
+from .base._SmartFloat import _applyGeneralType, _parseFormatSpec, _parseFormatTemplate, unitIndex
+from .conversion import converter
+from .errors import BadConversion, UnknownUnit
+
+__all__ = ['format_many', 'BatchFormatter']
+
+# Instance attributes that do not change how a value is formatted
+_neutralAttributes = frozenset({'_category', '_timestamp', '_title', '_key', '_numerator', '_denominator', 'intLength', 'floatLength'})
+_attributeFields = re.compile(r'{\w+\.[\w.]+\w')
+_valueTemplate = '{value:{fill}{align}{sign}{minwidth}.{precision}{type}}'
+
+
+class BatchFormatter:
+	"""
+	Formats many values of one unit class with a single format spec.
+
+	The spec, conversion, default format params and template are resolved once from a prototype
+	value, after that each value only goes through the precision rules and two str.format calls.
+	Output matches format(value, spec); classes that customize formatting, shortened or
+	automatically converted output and templates using attributes of the value are formatted
+	value by value instead.
+	"""
+	__slots__ = ('unitClass', 'spec', '_fallback', '_scale', '_offset', '_limits', '_params', '_template', '_precision', '_plural', '_pluralUnit')
+
+	def __init__(self, prototype: Measurement, spec: str = ''):
+		self.unitClass = type(prototype)
+		self.spec = spec
+		self._fallback = True
+		try:
+			self._compile(prototype)
+		except (BadConversion, UnknownUnit, ValueError):
+			pass
+
+	def _compile(self, prototype: Measurement) -> None:
+		cls = self.unitClass
+		if (
+			cls.__format__ is not SmartFloat.__format__
+			or cls.__format_value__ is not SmartFloat.__format_value__
+			or getattr(prototype, 'formatValue', None) is not None
+			or (cls.isDerived and None in cls.fixedUnits)
+			or not vars(prototype).keys() <= _neutralAttributes
+		):
+			return
+
+		spec = _parseFormatSpec(cls, self.spec, unitIndex.version)
+		if spec.attemptedUnits or spec.convertTo == 'auto':
+			return
+		if spec.convertTo:
+			targetClass = cls.type.getClass(spec.convertTo)
+			target = targetClass(prototype)
+			if type(target).__format_value__ is not SmartFloat.__format_value__:
+				return
+			conversion = converter(cls, type(target))
+			self._scale, self._offset, self._limits = conversion.scale, conversion.offset, type(target).limits
+		else:
+			target = prototype
+			self._scale, self._offset, self._limits = 1.0, 0.0, None
+
+		params = ChainMap({}, dict(spec.specParams), target.defaultFormatParams)
+		if params.get('shorten', False):
+			return
+		formatString = params.get('format', target.__format_template__(params))
+		if _attributeFields.search(formatString):
+			return
+		template = _parseFormatTemplate(formatString)
+		params.maps.insert(0, dict(template.valueSpec))
+		params.maps.insert(0, dict(spec.precisionSpec))
+		if any(name not in params for name, _ in template.formatVars if name != 'value'):
+			return
+
+		unitType = params.get('unit_type', 'unit')
+		unit = params.get('name', target.name) if unitType == 'name' else params.get('unit', target.unit)
+		self._plural = bool(params.get('plural', False) or unit == 'plural')
+		self._pluralUnit = target.pluralUnit if unitType != 'name' else type(target).pluralName
+
+		# The default precision depends on the value itself so it is resolved per value unless the spec sets it
+		self._precision = None if any('precision' in i for i in params.maps[:-1]) else target._displaySetting('precision', inf)
+		self._params = dict(params)
+		self._template = formatString
+		self._fallback = False
+
+	def formatFloat(self, value: float) -> str:
+		"""Formats a plain float given in the unit of the formatter"""
+		if self._fallback:
+			return format(self.unitClass(value), self.spec)
+		return self._format(value)
+
+	def _format(self, floatValue: float) -> str:
+		if self._scale != 1.0 or self._offset:
+			floatValue = floatValue * self._scale + self._offset
+			if self._limits is not None:
+				floatValue = sorted((*self._limits, floatValue))[1]
+		params = self._params.copy()
+		intLength, valuePrecision = SmartFloat.intFloatLength(floatValue)
+		params['value'] = floatValue
+		if self._precision is not None:
+			params['precision'] = min(valuePrecision, self._precision)
+		if params['type'] == 'g':
+			floatValue = _applyGeneralType(params, floatValue, floatValue > 1, intLength, valuePrecision, False)
+		if self._plural and round(floatValue, int(params['precision'])) != 1:
+			params['unit'] = self._pluralUnit
+		params['value'] = _valueTemplate.format(**params)
+		return self._template.format(**params)
+
+	def __call__(self, value: Measurement) -> str:
+		if self._fallback or not vars(value).keys() <= _neutralAttributes:
+			return format(value, self.spec)
+		return self._format(float(value))
+
+
+def format_many(values: Iterable[Measurement], spec: str = '', sep: Optional[str] = None) -> Union[List[str], str]:
+	"""
+	Formats every value with the same format spec, resolving the spec and format settings once per
+	unit class instead of once per value.
+	:param values: Measurements, mixed unit classes are allowed
+	:param spec: The format spec given to format()
+	:param sep: When given the strings are joined with sep into a single string, e.g. ',' or '</td><td>'
+	:return: A list of strings or the joined string
+	"""
+	formatters: Dict[Type[Measurement], BatchFormatter] = {}
+	strings = []
+	for value in values:
+		if (formatter := formatters.get(type(value))) is None:
+			formatter = formatters[type(value)] = BatchFormatter(value, spec)
+		strings.append(formatter(value))
+	if sep is not None:
+		return sep.join(strings)
+	return strings
@@ -0,0 +1,327 @@
+"""
+Time series of measurements.
+
+MeasurementSeries stores epoch second timestamps and float64 values of a single unit class and
+resamples them into time buckets or rolling windows with numpy, no Measurement is created per
+value.  Buckets are aligned to the local time of the [Location] timezone of the config so daily
+buckets start at local midnight.  Requires numpy.
+"""
+from datetime import datetime, timezone, tzinfo
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from .array import MeasurementArray, _requireNumpy
+from .base import Measurement
+from .time_ import Interval, Time, durationSeconds
+
+__all__ = ['MeasurementSeries', 'aggregations']
+
+UnitExpression = Union[str, Type[Measurement]]
+
+# Timezone offsets are looked up once per quarter hour, every timezone changes offsets on a quarter hour
+_offsetResolution = 900
+
+
+def _epochSeconds(timestamps) -> 'np.ndarray':
+	if isinstance(timestamps, np.ndarray) and np.issubdtype(timestamps.dtype, np.datetime64):
+		return timestamps.astype('datetime64[ns]').astype(np.int64) / 1e9
+	timestamps = list(timestamps)
+	if timestamps and isinstance(timestamps[0], datetime):
+		return np.array([i.timestamp() for i in timestamps], dtype=np.float64)
+	return np.asarray(timestamps, dtype=np.float64)
+
+
+def configTimezone() -> tzinfo:
+	"""The timezone of the [Location] section of the config, UTC when not set"""
+	from zoneinfo import ZoneInfo
+	from .config import config
+	name = config['Location'].get('timezone', None) if config.has_section('Location') else None
+	return ZoneInfo(name) if name else timezone.utc
+
+
+def _utcOffsets(times: 'np.ndarray', tz: tzinfo) -> 'np.ndarray':
+	"""The utc offset in seconds of tz at each time"""
+	if not len(times):
+		return np.zeros(0)
+	slots, inverse = np.unique(np.floor(times / _offsetResolution), return_inverse=True)
+	offsets = np.array([
+		datetime.fromtimestamp(slot * _offsetResolution, tz).utcoffset().total_seconds()
+		for slot in slots.tolist()
+	])
+	return offsets[inverse]
+
+
+def _concreteUnit(unit: Optional[UnitExpression], like: Optional[Type[Measurement]] = None) -> Optional[UnitExpression]:
+	"""
+	Resolves the generic numerator or denominator of a derived unit class such as
+	Precipitation.Minutely, using the units of like when given and the local units of the config
+	otherwise, e.g. Precipitation.Minutely becomes Minutely[mm/min].
+	"""
+	if not (isinstance(unit, type) and unit.isDerived and unit.isGeneric):
+		return unit
+	numerator, denominator = unit.numeratorClass, unit.denominatorClass
+	if like is not None and like.isDerived:
+		numerator = like.numeratorClass if numerator.isGeneric else numerator
+		denominator = like.denominatorClass if denominator.isGeneric else denominator
+	if numerator.isGeneric or denominator.isGeneric:
+		local = unit.localizedUnit
+		if len(local) == 2:
+			numerator = local[0] if numerator.isGeneric else numerator
+			denominator = local[1] if denominator.isGeneric else denominator
+	if numerator.isGeneric or denominator.isGeneric:
+		raise TypeError(f'{unit.__name__} is generic, use a unit class such as {unit.__name__}[Length.Millimeter]')
+	return unit[numerator:denominator:True]
+
+
+def _bucketMean(values: 'np.ndarray', starts: 'np.ndarray', counts: 'np.ndarray') -> 'np.ndarray':
+	with np.errstate(invalid='ignore', divide='ignore'):
+		return np.add.reduceat(np.nan_to_num(values), starts) / counts
+
+
+def _bucketFirst(values: 'np.ndarray', starts: 'np.ndarray', counts: 'np.ndarray') -> 'np.ndarray':
+	positions = np.where(np.isnan(values), len(values), np.arange(len(values)))
+	first = np.minimum.reduceat(positions, starts)
+	return np.where(counts > 0, values[np.minimum(first, len(values) - 1)], np.nan)
+
+
+def _bucketLast(values: 'np.ndarray', starts: 'np.ndarray', counts: 'np.ndarray') -> 'np.ndarray':
+	positions = np.where(np.isnan(values), -1, np.arange(len(values)))
+	last = np.maximum.reduceat(positions, starts)
+	return np.where(counts > 0, values[last], np.nan)
+
+
+# Reductions of the values of each bucket, starts are the index of the first value of each bucket
+# and counts the number of values that are not nan.  Nan values are skipped by every reduction.
+aggregations: Dict[str, Callable[['np.ndarray', 'np.ndarray', 'np.ndarray'], 'np.ndarray']] = {
+	'mean':  _bucketMean,
+	'sum':   lambda values, starts, counts: np.add.reduceat(np.nan_to_num(values), starts),
+	'min':   lambda values, starts, counts: np.fmin.reduceat(values, starts),
+	'max':   lambda values, starts, counts: np.fmax.reduceat(values, starts),
+	'first': _bucketFirst,
+	'last':  _bucketLast,
+	'count': lambda values, starts, counts: counts.astype(np.float64),
+}
+
+
+class MeasurementSeries:
+	"""
+	Timestamps and values of one unit class, sorted by time.
+
+	Timestamps are stored as epoch seconds, values as a float64 buffer like MeasurementArray.
+	interval is the nominal time between samples, it defaults to the median spacing and is
+	used by the 'total' aggregation to turn rates into amounts.
+	"""
+	__slots__ = ('_times', '_values', '_unit', '_interval')
+
+	_times: 'np.ndarray'
+	_values: 'np.ndarray'
+	_unit: Type[Measurement]
+
+	def __init__(
+		self,
+		timestamps: Optional[Iterable[Union[datetime, float]]],
+		values: Union[MeasurementArray, Iterable[Union[Measurement, float]], 'np.ndarray'],
+		unit: Optional[Type[Measurement]] = None,
+		interval: Optional[Interval] = None,
+	):
+		"""
+		:param timestamps: Datetimes, epoch seconds or datetime64, when None the timestamps of the measurements are used
+		:param values: Measurements, a MeasurementArray or numbers in unit
+		:param unit: The unit class of the values, defaults to the unit of the measurements.  Generic
+			classes such as Precipitation.Minutely take the unit of the measurements or the local units of the config
+		:param interval: Nominal time between samples in seconds, a timedelta or a Time
+		"""
+		_requireNumpy()
+		if timestamps is None:
+			values = list(values)
+			timestamps = [i.timestamp for i in values]
+			if any(i is None for i in timestamps):
+				raise ValueError('Every measurement requires a timestamp when no timestamps are given')
+		if isinstance(values, MeasurementArray):
+			like = values.unit
+		else:
+			values = values if isinstance(values, np.ndarray) else list(values)
+			like = next((type(i) for i in values if isinstance(i, Measurement)), None) if isinstance(values, list) else None
+		values = MeasurementArray(values, _concreteUnit(unit, like))
+		times = _epochSeconds(timestamps)
+		if times.shape != values.values.shape:
+			raise ValueError(f'Expected a timestamp for each of the {len(values)} values, got {len(times)}')
+
+		order = np.argsort(times, kind='stable')
+		self._times = times[order]
+		self._values = values.values[order]
+		self._unit = values.unit
+		self._interval = None if interval is None else durationSeconds(interval)
+
+	@classmethod
+	def _fromBuffers(cls, times: 'np.ndarray', values: 'np.ndarray', unit: Type[Measurement], interval: Optional[float]) -> 'MeasurementSeries':
+		series = object.__new__(cls)
+		series._times = times
+		series._values = values
+		series._unit = unit
+		series._interval = interval
+		return series
+
+	@property
+	def times(self) -> 'np.ndarray':
+		"""Epoch seconds"""
+		return self._times
+
+	@property
+	def values(self) -> 'np.ndarray':
+		return self._values
+
+	@property
+	def unit(self) -> Type[Measurement]:
+		return self._unit
+
+	@property
+	def array(self) -> MeasurementArray:
+		return MeasurementArray._fromBuffer(self._values, self._unit)
+
+	@property
+	def interval(self) -> Optional[float]:
+		if self._interval is None and len(self._times) > 1:
+			return float(np.median(np.diff(self._times)))
+		return self._interval
+
+	def timestamps(self, tz: Optional[tzinfo] = None) -> List[datetime]:
+		"""The timestamps as datetimes in tz, defaults to the timezone of the config"""
+		tz = tz or configTimezone()
+		return [datetime.fromtimestamp(i, tz) for i in self._times.tolist()]
+
+	def __len__(self) -> int:
+		return len(self._values)
+
+	def __iter__(self) -> Iterator[Tuple[float, Measurement]]:
+		unit = self._unit
+		return ((time, unit(value)) for time, value in zip(self._times.tolist(), self._values.tolist()))
+
+	def __getitem__(self, item):
+		if isinstance(item, (str, type)):
+			return self.to(item)
+		if isinstance(item, slice):
+			return self._fromBuffers(self._times[item], self._values[item], self._unit, self._interval)
+		value = self._unit(float(self._values[item]))
+		value._timestamp = datetime.fromtimestamp(float(self._times[item]), timezone.utc)
+		return value
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({len(self)} values, unit={self._unit!r})'
+
+	def to(self, unit: UnitExpression) -> 'MeasurementSeries':
+		"""Converts every value with a single scale and offset"""
+		unit = _concreteUnit(unit, self._unit)
+		if unit is self._unit:
+			return self
+		array = self.array.to(unit)
+		return self._fromBuffers(self._times, array.values, array.unit, self._interval)
+
+	def between(self, start: Union[datetime, float], end: Union[datetime, float]) -> 'MeasurementSeries':
+		"""The values from start up to but not including end"""
+		start, end = (i.timestamp() if isinstance(i, datetime) else i for i in (start, end))
+		low, high = np.searchsorted(self._times, (start, end), side='left')
+		return self[low:high]
+
+	def _groups(self, seconds: float, tz: Optional[tzinfo]) -> Tuple['np.ndarray', 'np.ndarray']:
+		"""The index of the first value of each bucket and the start of the bucket in epoch seconds"""
+		offsets = _utcOffsets(self._times, tz or configTimezone())
+		local = np.floor((self._times + offsets) / seconds)
+		changed = np.diff(local) != 0
+		if seconds < 86400:
+			# the hour repeated when clocks fall back is a separate bucket
+			changed |= np.diff(offsets) != 0
+		starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+		return starts, local[starts] * seconds - offsets[starts]
+
+	def buckets(self, interval: Interval, tz: Optional[tzinfo] = None) -> 'np.ndarray':
+		"""
+		The start of the bucket of every value in epoch seconds.  Buckets are aligned to the local
+		time of tz, defaults to the timezone of the config, so daily buckets start at local midnight.
+		"""
+		starts, labels = self._groups(durationSeconds(interval), tz)
+		return np.repeat(labels, np.diff(np.append(starts, len(self._times))))
+
+	def resample(self, interval: Interval, how: str = 'mean', unit: Optional[UnitExpression] = None, tz: Optional[tzinfo] = None) -> 'MeasurementSeries':
+		"""
+		Aggregates the values of each time bucket, empty buckets are left out.
+		:param interval: Length of the buckets in seconds, a timedelta or a Time, e.g. Time.Hour(1)
+		:param how: One of aggregations or 'total'.  'total' adds up rates as amounts, each sample
+			covering the interval of the series, and returns the amount of each bucket as a rate
+			per bucket length, e.g. minutely rain into hourly or daily totals.
+		:param unit: Unit of the result, values are converted before they are aggregated.  Generic
+			classes such as Precipitation.Hourly keep the units of the series, e.g. mm/min becomes mm/hr
+		:param tz: Timezone the buckets are aligned to, defaults to the timezone of the config
+		"""
+		series = self.to(unit) if unit is not None else self
+		if not len(series):
+			return series
+		seconds = durationSeconds(interval)
+		starts, labels = series._groups(seconds, tz)
+		counts = np.add.reduceat((~np.isnan(series._values)).astype(np.int64), starts)
+
+		if how == 'total':
+			values = aggregations['sum'](series._values, starts, counts) * series._totalFactor(seconds)
+		elif (aggregate := aggregations.get(how, None)) is not None:
+			values = aggregate(series._values, starts, counts)
+		else:
+			raise ValueError(f'Unknown aggregation {how!r}, expected one of {", ".join([*aggregations, "total"])}')
+		return self._fromBuffers(labels, values, series._unit, seconds)
+
+	def _totalFactor(self, bucketSeconds: float) -> float:
+		denominator = getattr(self._unit, 'denominatorClass', None)
+		if not (isinstance(denominator, type) and issubclass(denominator, Time)):
+			return 1.0
+		if (interval := self.interval) is None:
+			raise ValueError('The interval of a series with a single value is required for totals')
+		# each sample is a rate held for one interval, the bucket total is the amount over the bucket length
+		return interval / bucketSeconds
+
+	def rolling(self, window: Interval, how: str = 'mean') -> 'MeasurementSeries':
+		"""
+		Aggregates the values of the window ending at each value, (time - window, time].
+		:param window: Length of the window in seconds, a timedelta or a Time
+		:param how: 'mean', 'sum', 'count', 'min' or 'max'
+		"""
+		seconds = durationSeconds(window)
+		times, values = self._times, self._values
+		starts = np.searchsorted(times, times - seconds, side='right')
+		ends = np.arange(1, len(values) + 1)
+
+		if how in ('mean', 'sum', 'count'):
+			valid = ~np.isnan(values)
+			totals = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+			counts = np.concatenate(([0], np.cumsum(valid)))
+			count = counts[ends] - counts[starts]
+			if how == 'count':
+				result = count.astype(np.float64)
+			else:
+				result = totals[ends] - totals[starts]
+				if how == 'mean':
+					with np.errstate(invalid='ignore', divide='ignore'):
+						result = result / count
+		elif how in ('min', 'max'):
+			result = self._rollingExtreme(starts, how == 'max')
+		else:
+			raise ValueError(f'Unknown rolling aggregation {how!r}')
+		return self._fromBuffers(times, result, self._unit, self._interval)
+
+	def _rollingExtreme(self, starts: 'np.ndarray', maximum: bool) -> 'np.ndarray':
+		# monotonic deque of indices, O(n) over the whole series
+		values = self._values.tolist()
+		result = np.empty(len(values))
+		window = []
+		head = 0
+		for index, (value, start) in enumerate(zip(values, starts.tolist())):
+			if value == value:
+				while len(window) > head and (values[window[-1]] <= value if maximum else values[window[-1]] >= value):
+					window.pop()
+				window.append(index)
+			while head < len(window) and window[head] < start:
+				head += 1
+			result[index] = values[window[head]] if head < len(window) else np.nan
+		return result
@@ -0,0 +1,246 @@
+"""
+Streaming statistics of measurements.
+
+RunningStats keeps the count, mean and variance (Welford), a compensated sum and the extremes
+with their timestamps of a stream of measurements without storing the values.  Values in any
+compatible unit are converted into the unit of the accumulator with a scale and offset resolved
+once per source unit class, so adding a value is a few float operations.
+"""
+from math import fsum, isnan, sqrt
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from .array import MeasurementArray
+from .base import Measurement
+from .base._Measurement import CompactMeasurement
+from .conversion import conversionCoefficients
+
+__all__ = ['RunningStats']
+
+UnitExpression = Union[str, Type[Measurement]]
+
+
+class RunningStats:
+	"""
+	Count, mean, variance, sum, min and max of a stream of measurements of one dimension.
+
+	The unit is fixed by the first value when not given, strings such as 'mm' or 'f' are resolved
+	against the first value.  Plain numbers are taken as values in the unit of the accumulator.
+	Nan values are skipped.  The sum is a Neumaier compensated sum so long totals, e.g. a year of
+	per minute rain amounts, do not drift.
+	"""
+	__slots__ = ('unit', 'count', '_mean', '_m2', '_sum', '_compensation', '_min', '_max', 'minTimestamp', 'maxTimestamp', '_coefficients', '_target')
+
+	unit: Optional[Type[Measurement]]
+	count: int
+	minTimestamp: Any
+	maxTimestamp: Any
+
+	_coefficients: Dict[type, Tuple[float, float]]
+
+	def __init__(self, unit: Optional[UnitExpression] = None):
+		self._target = unit
+		self.unit = unit if isinstance(unit, type) else None
+		self._coefficients = {}
+		self.clear()
+
+	def clear(self) -> None:
+		self.count = 0
+		self._mean = self._m2 = self._sum = self._compensation = 0.0
+		self._min = self._max = None
+		self.minTimestamp = self.maxTimestamp = None
+
+	@classmethod
+	def of(cls, values: Iterable[Union[Measurement, float]], unit: Optional[UnitExpression] = None) -> 'RunningStats':
+		stats = cls(unit)
+		stats.update(values)
+		return stats
+
+	def __len__(self) -> int:
+		return self.count
+
+	def __repr__(self):
+		unit = self.unit.__name__ if self.unit is not None else None
+		return f'{type(self).__name__}(unit={unit}, count={self.count}, mean={self._mean:g})'
+
+	def _coefficientsOf(self, unitClass: Type[Measurement]) -> Tuple[float, float]:
+		if (coefficients := self._coefficients.get(unitClass, None)) is None:
+			if self.unit is None:
+				self.unit = unitClass if self._target is None else conversionCoefficients(unitClass, self._target)[0]
+			if unitClass is self.unit:
+				coefficients = 1.0, 0.0
+			else:
+				_, scale, offset = conversionCoefficients(unitClass, self.unit)
+				coefficients = scale, offset
+			self._coefficients[unitClass] = coefficients
+		return coefficients
+
+	def _convert(self, value: Union[Measurement, float]) -> float:
+		if isinstance(value, CompactMeasurement):
+			unitClass = value.unitClass
+		elif isinstance(value, Measurement):
+			unitClass = type(value)
+		else:
+			if self.unit is None:
+				raise TypeError(f'{type(self).__name__} requires a unit when values are not measurements')
+			return float(value)
+		scale, offset = self._coefficientsOf(unitClass)
+		return float(value) * scale + offset
+
+	def add(self, value: Union[Measurement, float], timestamp: Any = None) -> None:
+		"""
+		Adds a single value.
+		:param value: A measurement in any compatible unit or a number in the unit of the accumulator
+		:param timestamp: Recorded with a new min or max, defaults to the timestamp of the measurement
+		"""
+		x = self._convert(value)
+		if isnan(x):
+			return
+		if timestamp is None:
+			timestamp = getattr(value, '_timestamp', None)
+
+		self.count += 1
+		delta = x - self._mean
+		self._mean += delta / self.count
+		self._m2 += delta * (x - self._mean)
+		self._addToSum(x)
+
+		if self._min is None or x < self._min:
+			self._min, self.minTimestamp = x, timestamp
+		if self._max is None or x > self._max:
+			self._max, self.maxTimestamp = x, timestamp
+
+	def _addToSum(self, x: float) -> None:
+		total = self._sum + x
+		if abs(self._sum) >= abs(x):
+			self._compensation += (self._sum - total) + x
+		else:
+			self._compensation += (x - total) + self._sum
+		self._sum = total
+
+	def update(self, values: Union[Iterable[Union[Measurement, float]], MeasurementArray, 'np.ndarray'], timestamps: Optional[Iterable[Any]] = None) -> None:
+		"""
+		Adds many values, arrays are reduced with numpy in a single pass.
+		:param values: Measurements, numbers in the unit of the accumulator, a MeasurementArray or a numpy array
+		:param timestamps: A timestamp for each value
+		"""
+		if isinstance(values, MeasurementArray) or (np is not None and isinstance(values, np.ndarray)):
+			self._updateArray(values, timestamps)
+			return
+		if timestamps is None:
+			for value in values:
+				self.add(value)
+		else:
+			for value, timestamp in zip(values, timestamps):
+				self.add(value, timestamp)
+
+	def _updateArray(self, values: Union[MeasurementArray, 'np.ndarray'], timestamps: Optional[Iterable[Any]]) -> None:
+		if isinstance(values, MeasurementArray):
+			scale, offset = self._coefficientsOf(values.unit)
+			values = values.values.ravel()
+			if scale != 1.0 or offset:
+				values = values * scale + offset
+		elif self.unit is None:
+			raise TypeError(f'{type(self).__name__} requires a unit when values are not measurements')
+		else:
+			values = np.asarray(values, dtype=np.float64).ravel()
+
+		valid = ~np.isnan(values)
+		if timestamps is not None:
+			timestamps = np.asarray(timestamps, dtype=object).ravel()[valid]
+		values = values[valid]
+		if not len(values):
+			return
+
+		low, high = int(np.argmin(values)), int(np.argmax(values))
+		batch = RunningStats(self.unit)
+		batch.count = len(values)
+		batch._mean = float(np.mean(values))
+		batch._m2 = float(np.sum((values - batch._mean) ** 2))
+		batch._sum = fsum(values.tolist())
+		batch._min, batch._max = float(values[low]), float(values[high])
+		if timestamps is not None:
+			batch.minTimestamp, batch.maxTimestamp = timestamps[low], timestamps[high]
+		self.merge(batch)
+
+	def merge(self, other: 'RunningStats') -> 'RunningStats':
+		"""
+		Adds the values of another accumulator, e.g. one per thread or per day, using the
+		parallel form of Welford's algorithm.  Returns self.
+		"""
+		if not other.count:
+			return self
+		scale, offset = self._coefficientsOf(other.unit) if other.unit is not None else (1.0, 0.0)
+
+		count = self.count + other.count
+		otherMean = other._mean * scale + offset
+		delta = otherMean - self._mean
+		self._mean += delta * other.count / count
+		self._m2 += other._m2 * scale * scale + delta * delta * self.count * other.count / count
+		self._addToSum(other._sum * scale + other.count * offset)
+		self._addToSum(other._compensation * scale)
+		self.count = count
+
+		low, high = sorted((other._min * scale + offset, other._max * scale + offset))
+		lowTimestamp, highTimestamp = (other.minTimestamp, other.maxTimestamp) if scale >= 0 else (other.maxTimestamp, other.minTimestamp)
+		if self._min is None or low < self._min:
+			self._min, self.minTimestamp = low, lowTimestamp
+		if self._max is None or high > self._max:
+			self._max, self.maxTimestamp = high, highTimestamp
+		return self
+
+	def to(self, unit: UnitExpression) -> 'RunningStats':
+		"""A copy of the statistics converted to another unit"""
+		converted = RunningStats(unit)
+		if self.unit is None:
+			return converted
+		converted._coefficientsOf(self.unit)
+		return converted.merge(self)
+
+	def _measurement(self, value: Optional[float], timestamp: Any = None) -> Optional[Measurement]:
+		if value is None:
+			return None
+		measurement = self.unit(value)
+		if timestamp is not None:
+			measurement._timestamp = timestamp
+		return measurement
+
+	@property
+	def mean(self) -> Optional[Measurement]:
+		return self._measurement(self._mean) if self.count else None
+
+	@property
+	def sum(self) -> Optional[Measurement]:
+		return self._measurement(self._sum + self._compensation) if self.unit is not None else None
+
+	@property
+	def variance(self) -> Optional[float]:
+		"""The population variance in the square of the unit"""
+		return self._m2 / self.count if self.count else None
+
+	@property
+	def sampleVariance(self) -> Optional[float]:
+		return self._m2 / (self.count - 1) if self.count > 1 else None
+
+	@property
+	def stdev(self) -> Optional[Measurement]:
+		"""The population standard deviation"""
+		return self._measurement(sqrt(max(self._m2, 0.0) / self.count)) if self.count else None
+
+	@property
+	def min(self) -> Optional[Measurement]:
+		"""The smallest value, its timestamp is the one the value was added with"""
+		return self._measurement(self._min, self.minTimestamp)
+
+	@property
+	def max(self) -> Optional[Measurement]:
+		"""The largest value, its timestamp is the one the value was added with"""
+		return self._measurement(self._max, self.maxTimestamp)
+
+	@property
+	def summary(self) -> Dict[str, Optional[Measurement]]:
+		return {'count': self.count, 'mean': self.mean, 'min': self.min, 'max': self.max, 'stdev': self.stdev, 'sum': self.sum}
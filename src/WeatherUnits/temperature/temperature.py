@@ -98,8 +98,9 @@ class Temperature(Measurement, metaclass=Dimension, symbol='Θ'):
 			w = float(wind.kmh)
 			t = float(self.c)
 			value = 13.12 + (0.6215*t) - (11.37*pow(w, 0.16)) + (0.3965*t*pow(w, 0.16))
+			value = value if self._unit != 'k' else value + 273.15
 
-		value = self.transform(self.__class__(round(value, self._precision)))
+		value = self.transform(self.__class__(round(value, self._displaySetting('precision'))))
 		value.title = 'Wind Chill'
 		value.calculated = True
 		return value
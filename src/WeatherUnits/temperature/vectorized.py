@@ -0,0 +1,99 @@
+"""
+Array versions of Temperature.dewpoint, Temperature.heatIndex and Temperature.windChill.
+
+Each function takes a MeasurementArray (or an iterable of measurements) of temperatures and returns
+a MeasurementArray in the same unit, using the same formulas as the scalar methods.  Requires numpy.
+"""
+from typing import Iterable, Union
+
+try:
+	import numpy as np
+except ImportError:  # numpy is an optional dependency
+	np = None
+
+from ..array import MeasurementArray
+from ..base import Measurement
+from ..others import Humidity
+from .temperature import Temperature
+from .celsius import Celsius
+
+__all__ = ['dewpoint', 'heatIndex', 'windChill', 'normalizeRh']
+
+ArrayLike = Union[MeasurementArray, Iterable[Measurement], Iterable[float], 'np.ndarray']
+
+_fahrenheitCoefficients = (-42.379, 2.04901523, 10.14333427, -0.22477541, -0.00683783, -0.05481717, 0.00122874, 0.00085282, -0.00000199)
+_celsiusCoefficients = (-8.78469475556, 1.61139411, 2.33854883889, -0.14611605, -0.012308094, -0.0164248277778, 0.002211732, 0.00072546, -0.000003582)
+
+
+def _temperatures(temperature: ArrayLike) -> MeasurementArray:
+	if not isinstance(temperature, MeasurementArray):
+		temperature = MeasurementArray(temperature)
+	if not issubclass(temperature.unit, Temperature):
+		raise TypeError(f'Expected temperatures, got {temperature.unit!r}')
+	return temperature
+
+
+def normalizeRh(rh: ArrayLike) -> 'np.ndarray':
+	"""Array version of Temperature.normalizeRh, returns whole percentages"""
+	if isinstance(rh, MeasurementArray):
+		values = rh.values
+	elif isinstance(rh, np.ndarray):
+		values = rh.astype(np.float64)
+	else:
+		values = np.array([float(Humidity(i)) for i in rh], dtype=np.float64)
+	values = np.where(values > Humidity._limits[1], values / 100, values)
+	return np.trunc(np.clip(values, *Humidity._limits) * 100)
+
+
+def dewpoint(temperature: ArrayLike, rh: ArrayLike) -> MeasurementArray:
+	temperature = _temperatures(temperature)
+	rh = normalizeRh(rh)
+
+	T = temperature[Celsius].values
+
+	with np.errstate(divide='ignore', invalid='ignore'):
+		logRH = np.log(rh / 100)
+	A = 243.04
+	B = 17.625
+	value = A * (logRH + ((B * T) / (A + T))) / (B - logRH - ((B * T) / (A + T)))
+
+	return MeasurementArray(np.minimum(value, T), Celsius, copy=False)[temperature.unit]
+
+
+def heatIndex(temperature: ArrayLike, rh: ArrayLike) -> MeasurementArray:
+	temperature = _temperatures(temperature)
+	R = normalizeRh(rh)
+	unit = temperature.unit._unit
+
+	c = _fahrenheitCoefficients if unit == 'f' else _celsiusCoefficients
+	T = temperature.values if unit == 'f' else temperature[Celsius].values
+	T2 = T ** 2
+	R2 = R ** 2
+
+	hi = c[0] + (c[1] * T) + (c[2] * R) + (c[3] * T * R) + (c[4] * T2) + (c[5] * R2) + (c[6] * T2 * R) + (c[7] * T * R2) + (c[8] * T2 * R2)
+
+	hi = hi if unit != 'k' else hi + 273.15
+	kelvin = temperature.kelvin.values
+	return MeasurementArray(np.where((kelvin < 300) | (R < 13), temperature.values, hi), temperature.unit, copy=False)
+
+
+def windChill(temperature: ArrayLike, wind: ArrayLike) -> MeasurementArray:
+	temperature = _temperatures(temperature)
+	if not isinstance(wind, MeasurementArray):
+		wind = MeasurementArray(wind)
+	unit = temperature.unit._unit
+	mph = wind['mph'].values
+
+	if unit == 'f':
+		w = mph
+		t = temperature.values
+		value = 35.74 + (0.6215 * t) - (35.75 * w ** 0.16) + (0.4275 * t * w ** 0.16)
+	else:
+		w = wind['kmh'].values
+		t = temperature[Celsius].values
+		value = 13.12 + (0.6215 * t) - (11.37 * w ** 0.16) + (0.3965 * t * w ** 0.16)
+		if unit == 'k':
+			value += 273.15
+
+	value = np.round(value, temperature.unit._precision)
+	return MeasurementArray(np.where(mph < 3, temperature.values, value), temperature.unit, copy=False)
@@ -1,16 +1,104 @@
 import re
 from datetime import timedelta, datetime
-from uuid import uuid4
+from functools import lru_cache
+from string import Formatter
 
 from math import inf
 
-__all__ = ['Time']
+__all__ = ['Time', 'CompiledTimeFormat', 'Interval', 'durationSeconds']
 
-from typing import Mapping
+from typing import Mapping, NamedTuple, Optional, Tuple, Union
 
 from ..base.Decorators import UnitType
 from ..base import Dimension, both
-from ..base import ScalingMeasurement, Scale, FormatSpec
+from ..base import ScalingMeasurement, Scale, ScaleSplit, FormatSpec
+
+
+_componentNames = {'y': 'Year', 'm': 'Month', 'w': 'Week', 'd': 'Day', 'H': 'Hour', 'M': 'Minute', 'S': 'Second'}
+_componentPattern = re.compile(r'%(?P<full>(?P<leading>[-#])?(?P<char>[ymwdHMS])(?P=char)*)')
+# Instance attributes that do not change how a value is formatted
+_neutralAttributes = frozenset({'_category', '_timestamp', '_title', '_key', '_numerator', '_denominator', '_display', 'intLength', 'floatLength', 'valuePrecision'})
+
+
+class CompiledTimeFormat(NamedTuple):
+	"""
+	A Time format spec resolved into its mode.  For %H:%MM:%SS style specs spec is the str.format
+	template and fields the (param, component) of each placeholder.  Components are formatted from
+	the absolute value and negative values are prefixed with a single '-'.
+	"""
+	mode: str
+	spec: str
+	fields: Tuple[Tuple[str, str], ...] = ()
+	names: bool = False
+
+
+@lru_cache(maxsize=256)
+def _compileFormat(format_spec: str) -> CompiledTimeFormat:
+	if precisionSpec := FormatSpec.precision.search(format_spec):
+		format_spec = format_spec[:precisionSpec.start()-1] if format_spec.endswith(precisionSpec.group()) else format_spec[precisionSpec.end()+1:]
+
+	if format_spec == 'timestamp':
+		return CompiledTimeFormat('timestamp', format_spec)
+	if format_spec.startswith('simple'):
+		return CompiledTimeFormat('simple', format_spec, names=format_spec[-1] == '+')
+	if format_spec.startswith('ago'):
+		return CompiledTimeFormat('ago', format_spec, names=format_spec[-1] == '+')
+
+	matches = list(i.groupdict() for i in _componentPattern.finditer(format_spec))
+	if not matches:
+		return CompiledTimeFormat('generic', format_spec)
+	fields = {}
+	for group in sorted(matches, key=lambda x: format_spec.index(x['full'])):
+		padding = len(group['full'].strip('-#')) if not group['leading'] else 0
+		name = _componentNames[group['char']]
+		paramID = f'{name.lower()}Component'
+		fields[paramID] = (paramID, name)
+		format_spec = format_spec.replace(f'%{group["full"]}', f'{{{paramID}:0{padding}}}')
+	fields = tuple(fields.values())
+	# without other fields the template is formatted directly instead of going through SmartFloat
+	paramIDs = {i[0] for i in fields}
+	try:
+		direct = all(name is None or name in paramIDs for _, name, _, _ in Formatter().parse(format_spec))
+	except ValueError:
+		direct = False
+	return CompiledTimeFormat('components' if direct else 'template', format_spec, fields)
+
+
+def _formatSimple(value: 'Time', extras: Mapping) -> Optional[str]:
+	"""
+	The shortened and pluralized value produced by SmartFloat.__format__ for the simple spec,
+	without building the format param chain.  Returns None when the value has custom display
+	attributes so the full formatter is used instead.
+	"""
+	if not vars(value).keys() <= _neutralAttributes or not extras.keys() <= {'unitSpacer', 'unit_type'}:
+		return None
+	floatValue = float(value)
+	intLength, valuePrecision = value.intFloatLength(floatValue)
+	precision = value.precision
+	maxLength = value.max
+	startingLength = len(str(int(floatValue)))
+	shortened = value.bestFit(maxLength)
+	if shortened.decorator or not shortened.showUnit or shortened.suffix or vars(shortened).keys() - _neutralAttributes:
+		return None
+	floatValue = float(shortened)
+	intLength = shortened.intLength
+	precision += startingLength - intLength
+	valuePrecision += startingLength - intLength
+	if float(shortened) > 1:
+		floatValue = round(floatValue, min(precision, valuePrecision))
+		formatType = 'g'
+		if precision:
+			precision = min(intLength + min(precision, valuePrecision), maxLength) or 1
+		else:
+			precision = intLength or 1
+	elif precision < 0:
+		return None
+	else:
+		formatType = 'f'
+	unit = shortened.unit
+	if round(floatValue, precision) != 1:
+		unit = shortened.pluralUnit if extras.get('unit_type', 'unit') != 'name' else type(shortened).pluralName
+	return f'{floatValue:.{precision}{formatType}}{extras["unitSpacer"]}{unit}'
 
 
 @UnitType
@@ -64,84 +152,54 @@ class Time(ScalingMeasurement, metaclass=Dimension, system=both, symbol='T', bas
 		return super().__new__(cls, value, scale)
 
 	def __format__(self, format_spec: str, **extras) -> str:
-
-		original_spec = format_spec
-
-		if precisionSpec := FormatSpec.precision.search(format_spec):
-			format_spec = format_spec[:precisionSpec.start()-1] if format_spec.endswith(precisionSpec.group()) else format_spec[precisionSpec.end()+1:]
-			precisionSpec = precisionSpec.groupdict()
-		else:
-			precisionSpec = {'format_spec': ''}
-
-		if format_spec == 'timestamp':
-			if type(self) < Time.Minute:
-				if self < Time.anHour:
-					format_spec = '%MM:%SS'
-				else:
-					format_spec = '%H:%MM:%SS'
+		compiled = _compileFormat(format_spec)
+		match compiled.mode:
+			case 'components' | 'template':
+				return self.__formatComponents(compiled)
+			case 'timestamp':
+				return self.__formatComponents(_compileFormat(self.__timestampSpec()))
+			case 'simple':
+				extras['unitSpacer'] = ' '
+				if compiled.names:
+					extras['unit_type'] = 'name'
+				if (formatted := _formatSimple(self, extras)) is not None:
+					return formatted
+				return super().__format__("shorten=True, plural=True", **extras)
+			case 'ago':
+				if compiled.names:
+					extras['unit_type'] = 'name'
+				if self < 0:
+					return f'in {abs(self).__format__("simple", **extras)}'
+				return f'{self.__format__("simple", **extras)} ago'
+		return super().__format__(compiled.spec)
+
+	def __timestampSpec(self) -> str:
+		scale = self.scale
+		seconds = abs(float(self)) * scale.conversionFactor(scale.Second)
+		if type(self) < Time.Minute:
+			if round(seconds) < round(scale.Hour.conversionFactor(scale.Second)):
+				format_spec = '%MM:%SS'
 			else:
-				format_spec = '%H:%MM'
-			if self.hour > 100:
-				format_spec = f'{{day}} {format_spec}'
-			if self.day > 100:
-				format_spec = f'{{year}} {format_spec}'
-		elif format_spec.startswith('simple'):
-			extras['unitSpacer'] = ' '
-			if format_spec[-1] == '+':
-				extras['unit_type'] = 'name'
-			if format_spec := precisionSpec['format_spec']:
-				format_spec += ':'
-			format_spec = "shorten=True, plural=True"
-			return super().__format__(format_spec, **extras)
-		elif format_spec.startswith('ago'):
-			if format_spec[-1] == '+':
-				extras['unit_type'] = 'name'
-			if self < 0:
-				return f'in {abs(self).__format__("simple", **extras)}'
-			return f'{self.__format__("simple", **extras)} ago'
-
-
-		units = 'ymwdHMS'
-		matches = list(i.groupdict() for i in re.finditer(rf'%(?P<full>(?P<leading>[-#])?(?P<char>[{units}])(?P=char)*)', format_spec))
-		params = {}
-		trailingID = str(uuid4())
-		for group in sorted(matches, key=lambda x: format_spec.index(x['full'])):
-			padding = len(group['full'].strip('-#')) if not group['leading'] else 0
-			match group['char']:
-				case 'y':
-					paramID = f'year_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.year if not params else abs(self.year)).onlyInt
-				case 'm':
-					paramID = f'month_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.month if not params else abs(self.month)).onlyInt
-				case 'w':
-					paramID = f'week_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.week if not params else abs(self.week)).onlyInt
-				case 'd':
-					paramID = f'day_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.day if not params else abs(self.day)).onlyInt
-				case 'H':
-					paramID = f'hour_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.hour if not params else abs(self.hour)).onlyInt
-				case 'M':
-					paramID = f'minute_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.minute if not params else abs(self.minute)).onlyInt
-				case 'S':
-					paramID = f'second_{trailingID}'
-					newValue = f'{{{paramID}:0{padding}}}'
-					params[paramID] = (self.second if not params else abs(self.second)).onlyInt
-				case _:
-					newValue = f'%{group["full"]}'
-			format_spec = format_spec.replace(f'%{group["full"]}', newValue)
-		if matches:
-			format_spec = {'format': format_spec, **params}
-		return super().__format__(format_spec)
+				format_spec = '%H:%MM:%SS'
+		else:
+			format_spec = '%H:%MM'
+		if seconds >= scale.Day.conversionFactor(scale.Second):
+			format_spec = f'%d {format_spec}'
+		if seconds >= scale.Year.conversionFactor(scale.Second):
+			format_spec = f'%y {format_spec}'
+		return format_spec
+
+	def __formatComponents(self, compiled: 'CompiledTimeFormat') -> str:
+		split = ScaleSplit.of(Second, _componentClasses)
+		seconds = float(self) * self.scale.conversionFactor(self.scale.Second)
+		components = {split.classes[index].name: int(component) for index, component in split.split(abs(seconds))}
+		params = {paramID: components.get(name, 0) for paramID, name in compiled.fields}
+		spec = compiled.spec
+		if seconds < 0 and any(params.values()):
+			spec = f'-{spec}'
+		if compiled.mode == 'components':
+			return spec.format(**params)
+		return super().__format__({'format': spec, **params})
 
 	def __format_value__(self, params: Mapping) -> str:
 
@@ -302,6 +360,23 @@ Time.Decade = Decade
 Time.Century = Century
 Time.Millennia = Millennia
 
+# the units of format components, larger units are folded into years
+_componentClasses = (Year, Day, Hour, Minute, Second)
+
+# a duration given as seconds, a timedelta or a Time measurement
+Interval = Union[float, timedelta, Time]
+
+
+def durationSeconds(interval: Interval) -> float:
+	"""The seconds of a duration, other measurements with a scale are rejected"""
+	if isinstance(interval, timedelta):
+		return interval.total_seconds()
+	if isinstance(interval, Time):
+		return float(interval.second)
+	if isinstance(interval, ScalingMeasurement):
+		raise TypeError(f'Expected a duration, got {interval!r}')
+	return float(interval)
+
 Time.aMillisecond = Time.oneMillisecond = Millisecond.one = Millisecond(1)
 Time.aSecond = Time.oneSecond = Second.one = Second(1)
 Time.aMinute = Time.oneMinute = Minute.one = Minute(1)
@@ -0,0 +1,194 @@
+"""
+Pressure tendency of a stream of pressure readings.
+
+PressureTrend fits a least-squares line through the readings of a sliding window, typically
+three hours, and classifies its slope as a Pressure.Trend.  The sums of the fit are updated as
+readings arrive and expire, so adding a reading and reading the trend take constant time.
+"""
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Optional, Tuple, Type, Union
+
+from .base import Measurement
+from .conversion import conversionCoefficients
+from .derived import PressureTendency
+from .pressure import Pressure
+from .time_ import Interval, Time, durationSeconds
+
+__all__ = ['PressureTrend']
+
+UnitExpression = Union[str, Type[Measurement]]
+Threshold = Union[Pressure, PressureTendency, float]
+
+
+class PressureTrend:
+	"""
+	Least-squares slope of the pressure readings of the last window seconds.
+
+	Readings are kept in Pascal relative to an origin time and pressure, the origin is moved to
+	the oldest reading and the sums are recomputed once the oldest reading is a window past it,
+	which bounds both cancellation and float drift at amortized O(1) per reading.
+
+	The trend is Steady while the slope is within the threshold, given as a pressure change
+	over the window, a PressureTendency or a number in the rate unit.  A pair of thresholds sets
+	the falling and rising thresholds separately.  No trend is reported until the readings span
+	minSpan seconds, half the window by default, as a slope fitted over a few minutes mostly
+	follows sensor noise.
+	"""
+	__slots__ = ('window', 'minSpan', 'unit', 'rateUnit', '_readings', '_sums', '_origin', '_falling', '_rising', '_rateScale', '_coefficients')
+
+	window: float
+	minSpan: float
+	unit: Type[Pressure]
+	rateUnit: Type[PressureTendency]
+
+	_readings: Deque[Tuple[float, float]]
+	_coefficients: Dict[type, Tuple[float, float]]
+
+	def __init__(
+		self,
+		window: Interval = timedelta(hours=3),
+		threshold: Union[Threshold, Tuple[Threshold, Threshold]] = Pressure.Hectopascal(1),
+		unit: UnitExpression = Pressure.Hectopascal,
+		rateUnit: UnitExpression = 'hPa/hr',
+		minSpan: Optional[Interval] = None,
+	):
+		"""
+		:param window: Length of the window, seconds or a duration
+		:param threshold: Largest change over the window, or rate, that is still Steady, or a (falling, rising) pair
+		:param unit: Unit of readings given as plain numbers
+		:param rateUnit: Unit of the rate
+		:param minSpan: Shortest span of readings a trend is reported for, defaults to half the window
+		"""
+		self.window = durationSeconds(window)
+		if self.window <= 0:
+			raise ValueError('window must be positive')
+		self.minSpan = self.window / 2 if minSpan is None else durationSeconds(minSpan)
+		self.unit = conversionCoefficients(Pressure.Pascal, unit)[0]
+		self._coefficients = {}
+		self.rateUnit, self._rateScale, _ = conversionCoefficients(PressureTendency[Pressure.Pascal:Time.Second], rateUnit)
+		falling, rising = threshold if isinstance(threshold, tuple) else (threshold, threshold)
+		self._falling, self._rising = self._thresholdRate(falling), self._thresholdRate(rising)
+		self.clear()
+
+	def clear(self) -> None:
+		self._readings = deque()
+		self._origin = (0.0, 0.0)
+		self._sums = [0.0, 0.0, 0.0, 0.0, 0.0]
+
+	def _thresholdRate(self, threshold: Threshold) -> float:
+		"""A threshold in Pa/s"""
+		if isinstance(threshold, PressureTendency):
+			return abs(float(threshold.Pas))
+		if isinstance(threshold, Pressure):
+			return abs(self._pascal(threshold)) / self.window
+		return abs(float(threshold)) / self._rateScale
+
+	def _pascal(self, value: Union[Pressure, float]) -> float:
+		unitClass = type(value) if isinstance(value, Measurement) else self.unit
+		if (coefficients := self._coefficients.get(unitClass, None)) is None:
+			_, scale, offset = conversionCoefficients(unitClass, Pressure.Pascal)
+			coefficients = self._coefficients[unitClass] = scale, offset
+		scale, offset = coefficients
+		return float(value) * scale + offset
+
+	def __len__(self) -> int:
+		return len(self._readings)
+
+	def __repr__(self):
+		return f'{type(self).__name__}(window={self.window:g}, readings={len(self)}, trend={self.trend})'
+
+	def add(self, pressure: Union[Pressure, float, None], time: Union[datetime, float, None] = None) -> None:
+		"""
+		Adds a reading, expiring readings older than the window.  Readings are expected in order.
+		:param pressure: A pressure in any unit or a number in the unit of the estimator, None is ignored
+		:param time: Epoch seconds or a datetime, defaults to the timestamp of the measurement
+		"""
+		if pressure is None:
+			return
+		if time is None:
+			time = getattr(pressure, '_timestamp', None)
+			if time is None:
+				raise TypeError(f'{type(self).__name__} requires a time for readings without a timestamp')
+		if isinstance(time, datetime):
+			time = time.timestamp()
+		value = self._pascal(pressure)
+
+		self.expire(time)
+		readings = self._readings
+		if not readings:
+			self._origin = (time, value)
+		readings.append((time, value))
+		self._include(time, value, 1.0)
+
+	def _include(self, time: float, value: float, sign: float) -> None:
+		originTime, originValue = self._origin
+		t, p = time - originTime, value - originValue
+		sums = self._sums
+		sums[0] += sign
+		sums[1] += sign * t
+		sums[2] += sign * p
+		sums[3] += sign * t * t
+		sums[4] += sign * t * p
+
+	def expire(self, now: Union[datetime, float]) -> None:
+		"""Removes the readings that are older than the window at now"""
+		if isinstance(now, datetime):
+			now = now.timestamp()
+		cutoff = now - self.window
+		readings = self._readings
+		while readings and readings[0][0] <= cutoff:
+			self._include(*readings.popleft(), -1.0)
+		if not readings:
+			self._sums = [0.0, 0.0, 0.0, 0.0, 0.0]
+		elif readings[0][0] - self._origin[0] > self.window:
+			self._resum()
+
+	def _resum(self) -> None:
+		self._origin = self._readings[0]
+		self._sums = [0.0, 0.0, 0.0, 0.0, 0.0]
+		for time, value in self._readings:
+			self._include(time, value, 1.0)
+
+	@property
+	def span(self) -> float:
+		"""Seconds between the oldest and the newest reading"""
+		return self._readings[-1][0] - self._readings[0][0] if self._readings else 0.0
+
+	def _slope(self) -> Optional[float]:
+		"""The fitted slope in Pa/s"""
+		if len(self._readings) < 2 or self.span < self.minSpan:
+			return None
+		n, t, p, tt, tp = self._sums
+		denominator = n * tt - t * t
+		if denominator <= 0:
+			return None
+		return (n * tp - t * p) / denominator
+
+	@property
+	def rate(self) -> Optional[PressureTendency]:
+		"""The fitted rate of change in the rate unit"""
+		if (slope := self._slope()) is None:
+			return None
+		return self.rateUnit(slope * self._rateScale)
+
+	@property
+	def change(self) -> Optional[Pressure]:
+		"""The fitted change over a whole window"""
+		if (slope := self._slope()) is None:
+			return None
+		return self.unit(Pressure.Pascal(slope * self.window))
+
+	@property
+	def trend(self) -> Optional[Pressure.Trend]:
+		if (slope := self._slope()) is None:
+			return None
+		if slope < -self._falling:
+			return Pressure.Trend.Falling
+		if slope > self._rising:
+			return Pressure.Trend.Rising
+		return Pressure.Trend.Steady
+
+	@property
+	def summary(self) -> Dict[str, Any]:
+		return {'trend': self.trend, 'rate': self.rate, 'change': self.change}
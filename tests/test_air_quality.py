@@ -0,0 +1,61 @@
+from unittest import TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import AirQuality, Mass, MeasurementArray, PartsPer
+from src.WeatherUnits.errors import BadConversion
+
+PrimaryPollutant = AirQuality.PrimaryPollutant
+
+
+class TestPartsPer(TestCase):
+
+	def test_scale(self):
+		self.assertEqual(float(PartsPer.Million(1).ppb), 1000)
+		self.assertEqual(float(PartsPer.Hundred(1).ppm), 10000)
+		self.assertEqual(float(PartsPer.Billion(1000).ppm), 1)
+		self.assertAlmostEqual(float(PartsPer.Thousand(1).hundred), 0.1)
+
+
+class TestAQI(TestCase):
+
+	def test_breakpoints(self):
+		self.assertEqual(AirQuality.aqi('PM2.5', 35.0), 99)
+		self.assertEqual(AirQuality.aqi('PM2.5', 9.05), 50)
+		self.assertEqual(AirQuality.aqi('PM10', 100), 73)
+		self.assertEqual(AirQuality.aqi('SO2', 2000), 500)
+		self.assertEqual(AirQuality.aqi('PM2.5', 35.0).enum, AirQuality.HeathConcern.Moderate)
+		self.assertEqual(AirQuality.aqi('PM2.5', 200.0).enum, AirQuality.HeathConcern.VeryUnhealthy)
+
+	def test_units(self):
+		self.assertEqual(AirQuality.aqi('O3', PartsPer.Billion(62)), AirQuality.aqi('O3', 0.062))
+		self.assertEqual(AirQuality.aqi('NO2', PartsPer.Million(0.2)), AirQuality.aqi('NO2', 200))
+		self.assertAlmostEqual(AirQuality.concentration('CO', Mass.Milligram(10)), 10000 * 24.45 / 28.010 / 1000)
+		with self.assertRaises(BadConversion):
+			AirQuality.aqi('PM2.5', PartsPer.Million(1))
+
+	def test_primary(self):
+		index, primary = AirQuality.airQualityIndex({'PM2.5': 20.0, 'O3': PartsPer.Million(0.08), 'NO2': None, 'CO': float('nan')})
+		self.assertEqual(index, 133)
+		self.assertIs(primary, PrimaryPollutant.O3)
+		self.assertEqual(AirQuality.airQualityIndex({}), (None, None))
+
+	@skipIf(np is None, 'numpy is not installed')
+	def test_arrays(self):
+		rng = np.random.default_rng(0)
+		pm = rng.uniform(0, 300, 500)
+		pm[::7] = np.nan
+		o3 = MeasurementArray(rng.uniform(0, 120, 500), PartsPer.Billion)
+		result = AirQuality.airQualityIndex({'PM2.5': pm, 'O3': o3, 'CO': 1.0})
+		pollutants = result.pollutants()
+		for i in range(len(pm)):
+			expected = AirQuality.airQualityIndex({'PM2.5': None if np.isnan(pm[i]) else float(pm[i]), 'O3': PartsPer.Billion(o3.values[i]), 'CO': 1.0})
+			self.assertEqual(result.index[i], float(expected.index))
+			self.assertEqual(pollutants[i], expected.primary)
+
+		result = AirQuality.airQualityIndex({'PM2.5': [np.nan, 5.0]})
+		self.assertTrue(np.isnan(result.index[0]))
+		self.assertEqual(result.primary.tolist(), [-1, PrimaryPollutant.PM2_5.value])
@@ -0,0 +1,82 @@
+from unittest import TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Length, Pressure, Temperature, Time, Wind, MeasurementArray
+
+
+@skipIf(np is None, 'numpy is not installed')
+class TestMeasurementArray(TestCase):
+
+	def setUp(self):
+		self.celsius = MeasurementArray([0.0, 20.0, 100.0], Temperature.Celsius)
+
+	def test_affine_conversion(self):
+		fahrenheit = self.celsius['f']
+		self.assertIs(fahrenheit.unit, Temperature.Fahrenheit)
+		np.testing.assert_allclose(fahrenheit.values, [32.0, 68.0, 212.0])
+		np.testing.assert_allclose(self.celsius.kelvin.values, [273.15, 293.15, 373.15])
+
+	def test_scaling_conversion(self):
+		pressure = MeasurementArray(np.array([1000.0, 1013.25]), Pressure.Hectopascal)
+		np.testing.assert_allclose(pressure[Pressure.Pascal].values, [100000.0, 101325.0])
+
+	def test_derived_conversion(self):
+		wind = Wind(Length.Meter(5), Time.Second(1))
+		speeds = MeasurementArray([wind, wind * 2])
+		np.testing.assert_allclose(speeds.kmh.values, [18.0, 36.0])
+
+	def test_indexing(self):
+		value = self.celsius[1]
+		self.assertIsInstance(value, Temperature.Celsius)
+		self.assertEqual(value, Temperature.Celsius(20))
+		self.assertIsInstance(self.celsius[1:], MeasurementArray)
+		self.assertEqual(len(self.celsius[1:]), 2)
+
+	def test_reductions(self):
+		self.assertEqual(self.celsius.max(), Temperature.Celsius(100))
+		self.assertIsInstance(self.celsius.mean(), Temperature.Celsius)
+
+	def test_mixed_units(self):
+		lengths = MeasurementArray([Length.Meter(1), Length.Foot(1)])
+		np.testing.assert_allclose(lengths.values, [1.0, 0.3048])
+
+	def test_limits(self):
+		self.assertEqual(MeasurementArray([-300.0], Temperature.Celsius).values[0], -273.15)
+
+	def test_copies_arrays(self):
+		source = np.array([1.0, 2.0])
+		lengths = MeasurementArray(source, Length.Meter)
+		source[0] = 5.0
+		lengths.values[1] = 7.0
+		self.assertEqual(lengths.values.tolist(), [1.0, 7.0])
+		self.assertEqual(source.tolist(), [5.0, 2.0])
+		self.assertIsNot(MeasurementArray(lengths).values, lengths.values)
+		self.assertIs(MeasurementArray(source, Length.Meter, copy=False).values, source)
+		clipped = np.array([-300.0, 20.0])
+		MeasurementArray(clipped, Temperature.Celsius)
+		self.assertEqual(clipped[0], -300.0)
+
+	def test_format(self):
+		self.assertEqual(self.celsius.format('f'), [format(i, 'f') for i in self.celsius])
+		self.assertEqual(self.celsius.format(sep=';'), ';'.join(format(i, '') for i in self.celsius))
+
+	def test_scale_selection(self):
+		values = [0.0, 0.05, 999.0, 999.5, -12345.0, 1e7]
+		lengths = MeasurementArray(values, Length.Meter)
+		for scalar, array in zip((Length.Meter(i).bestFit(3) for i in values), lengths.bestFit(3)):
+			self.assertIs(type(array), type(scalar))
+			self.assertAlmostEqual(float(array), float(scalar))
+		self.assertEqual([type(i) for i in lengths.auto()], [type(Length.Meter(i).auto) for i in values])
+
+	def test_split_into_columns(self):
+		durations = MeasurementArray([3725.0, 90061.5], Time.Second)
+		columns = durations.splitIntoColumns(Time.Day, Time.Hour, Time.Minute, Time.Second)
+		self.assertEqual(list(columns), ['Day', 'Hour', 'Minute', 'Second'])
+		self.assertIs(columns['Hour'].unit, Time.Hour)
+		np.testing.assert_allclose(columns['Day'].values, [0, 1])
+		np.testing.assert_allclose(columns['Hour'].values, [1, 1])
+		np.testing.assert_allclose(columns['Second'].values, [5, 1.5])
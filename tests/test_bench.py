@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from src.WeatherUnits.bench import imports, hotpaths
+
+
+class TestImportBenchmark(TestCase):
+
+	def test_run(self):
+		results = imports.run(['src.WeatherUnits.temperature'], repeat=1)
+		result = results['results']['src.WeatherUnits.temperature']
+		self.assertGreater(result['median'], 0)
+		self.assertGreater(result['calls']['MetaUnitClass.__new__']['count'], 0)
+		self.assertEqual(result['calls']['Config.read']['count'], 1)
+
+	def test_compare(self):
+		calls = {'MetaUnitClass.__new__': {'count': 10, 'time': 0.01}}
+		baseline = {'results': {'a': {'median': 0.1, 'calls': calls}}}
+		self.assertEqual(imports.compare({'results': {'a': {'median': 0.11, 'calls': calls}}}, baseline), [])
+		slower = {'results': {'a': {'median': 0.2, 'calls': calls}}}
+		self.assertEqual(len(imports.compare(slower, baseline)), 1)
+		moreClasses = {'results': {'a': {'median': 0.1, 'calls': {'MetaUnitClass.__new__': {'count': 11, 'time': 0.01}}}}}
+		self.assertIn('MetaUnitClass.__new__', imports.compare(moreClasses, baseline)[0])
+
+
+class TestHotPathBenchmark(TestCase):
+
+	def test_run(self):
+		results = hotpaths.run(['compare.*', 'format.time.timestamp'], warmup=0, repeat=2, number=10)['results']
+		self.assertEqual(set(results), {'compare.eq', 'compare.lt', 'format.time.timestamp'})
+		for result in results.values():
+			self.assertEqual(result['number'], 10)
+			self.assertGreater(result['opsPerSec'], 0)
+
+	def test_compare(self):
+		baseline = {'results': {'a': {'opsPerSec': 1000.0}}}
+		self.assertEqual(hotpaths.compare({'results': {'a': {'opsPerSec': 900.0}}}, baseline), [])
+		self.assertEqual(len(hotpaths.compare({'results': {'a': {'opsPerSec': 500.0}}}, baseline)), 1)
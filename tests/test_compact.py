@@ -0,0 +1,40 @@
+import pickle
+import sys
+from datetime import datetime
+from unittest import TestCase
+
+from src.WeatherUnits import Length, Temperature, Time, Wind, CompactMeasurement
+
+
+class TestCompactMeasurement(TestCase):
+
+	def test_size(self):
+		value = Length.Meter(12.5)
+		compact = value.compact
+		self.assertFalse(hasattr(compact, '__dict__'))
+		# float (24) + two slots + gc header on 64-bit CPython
+		self.assertLessEqual(sys.getsizeof(compact), 56)
+		self.assertLess(sys.getsizeof(compact) * 4, sys.getsizeof(value) + sys.getsizeof(vars(value)))
+
+	def test_round_trip(self):
+		timestamp = datetime(2024, 1, 1)
+		value = Length.Meter(12.3456, timestamp=timestamp)
+		value.precision = 2
+		compact = value.compact
+		self.assertIsInstance(compact, CompactMeasurement)
+		self.assertIs(type(compact), Length.Meter.Compact)
+		self.assertEqual(str(compact), str(value))
+		self.assertEqual(compact.measurement.timestamp, timestamp)
+		self.assertIs(compact.display, value.display)
+		self.assertEqual(pickle.loads(pickle.dumps(compact)), compact)
+
+	def test_conversion(self):
+		self.assertAlmostEqual(Temperature.Celsius.Compact(Temperature.Fahrenheit(50)), 10)
+		self.assertEqual(Length.Meter.Compact(5) + 1, 6)
+		self.assertIs(type(Length.Meter.Compact(5) + 1), float)
+
+	def test_derived(self):
+		compact = Wind(Length.Mile(10), Time.Hour(1)).compact
+		self.assertEqual(compact.measurement, Wind(Length.Mile(10), Time.Hour(1)))
+		with self.assertRaises(AttributeError):
+			Wind.Compact
@@ -0,0 +1,52 @@
+from decimal import Decimal
+from unittest import TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Temperature, Length, converter
+from src.WeatherUnits.errors import BadConversion
+
+
+class TestConverter(TestCase):
+
+	def test_affine(self):
+		toFahrenheit = converter('c', 'f')
+		self.assertAlmostEqual(toFahrenheit(100), 212)
+		self.assertAlmostEqual(toFahrenheit.inverse(212), 100)
+		self.assertAlmostEqual(converter(Temperature.Celsius, 'k')(0), 273.15)
+
+	def test_scaling(self):
+		self.assertAlmostEqual(converter('mi', 'km')(1), 1.609344)
+		self.assertAlmostEqual(converter(Length.Foot, Length.Inch)(2), 24)
+		self.assertAlmostEqual(converter('hPa', 'inHg')(1013.25), 29.92, places=2)
+
+	def test_derived(self):
+		self.assertAlmostEqual(converter('m/s', 'mi/hr')(10), 22.369, places=3)
+		self.assertAlmostEqual(converter('m/s', 'mph')(10), 22.369, places=3)
+		self.assertAlmostEqual(converter('mm/hr', 'in/d')(1), 0.945, places=3)
+		self.assertAlmostEqual(converter('kg/m³', 'lbs/ft^3')(1000), 62.428, places=3)
+
+	def test_iterable(self):
+		self.assertEqual(converter('ft', 'in')([1, 2]), [12.0, 24.0])
+
+	def test_scalars(self):
+		self.assertAlmostEqual(converter(Length.Meter, Length.Foot)(Decimal('1')), 3.28084, places=5)
+
+	@skipIf(np is None, 'numpy is not installed')
+	def test_numpy_scalars(self):
+		toFeet = converter(Length.Meter, Length.Foot)
+		self.assertAlmostEqual(toFeet(np.float32(1)), 3.28084, places=5)
+		self.assertAlmostEqual(toFeet(np.int64(3)), 9.84252, places=5)
+		self.assertAlmostEqual(toFeet(np.arange(3.0))[2], 6.56168, places=5)
+
+	def test_cached(self):
+		self.assertIs(converter('c', 'f'), converter('c', 'f'))
+
+	def test_incompatible(self):
+		with self.assertRaises(BadConversion):
+			converter('m/s', 'c')
+		with self.assertRaises(BadConversion):
+			converter('c/s', 'f/s')
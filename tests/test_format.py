@@ -0,0 +1,110 @@
+from datetime import timedelta
+from unittest import TestCase
+
+from src.WeatherUnits import Length, Temperature, Time
+from src.WeatherUnits.base import DisplayProfile
+from src.WeatherUnits.base import SmartFloat
+from src.WeatherUnits.base._SmartFloat import _parseFormatSpec, ParsedFormatSpec, unitIndex
+from src.WeatherUnits.time_ import durationSeconds
+from src.WeatherUnits.time_.time import _compileFormat
+
+
+class TestFormatSpecCache(TestCase):
+
+	def test_cached_per_class_and_spec(self):
+		format(Length.Meter(1500.5), 'km')
+		hits = _parseFormatSpec.cache_info().hits
+		self.assertEqual(format(Length.Meter(20), 'km'), format(Length.Kilometer(0.02), ''))
+		self.assertEqual(_parseFormatSpec.cache_info().hits, hits + 1)
+
+	def test_parsed_spec(self):
+		spec = _parseFormatSpec(Length.Meter, 'km:.2f', unitIndex.version)
+		self.assertIsInstance(spec, ParsedFormatSpec)
+		self.assertEqual(spec.convertTo, 'km')
+		self.assertIn(('precision', '2'), spec.precisionSpec)
+		self.assertEqual(dict(_parseFormatSpec(Length.Meter, 'max=6, shorten=true', unitIndex.version).specParams), {'max': 6, 'shorten': True})
+
+	def test_cached_spec_is_not_modified(self):
+		first = format(Temperature.Celsius(21.456), 'plural=True')
+		self.assertEqual(format(Temperature.Celsius(21.456), 'plural=True'), first)
+
+	def test_invalid_conversion(self):
+		with self.assertRaises(NotImplementedError):
+			format(Length.Meter(3), 'convert=bogus')
+
+
+class TestDisplayProfile(TestCase):
+
+	def test_interned(self):
+		self.assertIs(DisplayProfile(precision=2), DisplayProfile().replace(precision=2))
+		self.assertIsNot(DisplayProfile(precision=1), DisplayProfile(precision=True))
+		with self.assertRaises(AttributeError):
+			DisplayProfile().precision = 1
+
+	def test_copy_on_write(self):
+		a, b = Temperature.Celsius(21.456), Temperature.Celsius(3.14159)
+		a.precision = b.precision = 2
+		self.assertIs(a.display, b.display)
+		self.assertNotIn('_precision', vars(a))
+		self.assertEqual(str(a), '21.5º')
+		b.showUnit = False
+		self.assertIsNot(a.display, b.display)
+		self.assertIsNone(a.display.showUnit)
+		self.assertIs(round(a).display, a.display)
+		self.assertIs(Temperature.Celsius(1).display, DisplayProfile())
+
+	def test_transform_copies_profile_and_metadata(self):
+		a = Temperature.Celsius(21.456)
+		a.precision = 2
+		a._timestamp = 1700000000.0
+		a.valuePrecision
+		b = a.transform(Temperature.Fahrenheit)
+		self.assertIs(b.display, a.display)
+		self.assertEqual(b.timestamp, a.timestamp)
+		self.assertNotIn('valuePrecision', vars(b))
+
+
+class TestTimeFormat(TestCase):
+
+	def test_compiled_once(self):
+		self.assertIs(_compileFormat('%H:%MM:%SS'), _compileFormat('%H:%MM:%SS'))
+		self.assertEqual(_compileFormat('%H:%MM:%SS').mode, 'components')
+		self.assertEqual(_compileFormat('%H:%MM {unit}').mode, 'template')
+
+	def test_components(self):
+		self.assertEqual(format(Time.Second(90061.5), '%d days %H:%MM:%SS'), '1 days 1:01:01')
+		self.assertEqual(format(Time.Minute(62), '%H:%MM {unit}'), '1:02 min')
+		self.assertEqual(format(Time.Second(42), 'timestamp'), '00:42')
+		self.assertEqual(format(Time.Second(3725), 'timestamp'), '1:02:05')
+		self.assertEqual(format(Time.Hour(150), 'timestamp'), '6 6:00')
+		self.assertEqual(format(Time.Second(-3725), 'timestamp'), '-1:02:05')
+		self.assertEqual(format(Time.Second(-42), 'timestamp'), '-00:42')
+		self.assertEqual(format(Time.Second(98765.43), 'timestamp'), '1 3:26:05')
+		self.assertEqual(format(Time.Second(86399), 'timestamp'), '23:59:59')
+		self.assertEqual(format(Time.Day(400), 'timestamp'), '1 35 0:00')
+
+	def test_decades(self):
+		self.assertEqual(format(Time.Day(3725), 'timestamp'), '10 75 0:00')
+		self.assertEqual(format(Time.Minute(78840000), 'timestamp'), '150 0 0:00')
+		self.assertEqual(format(Time.Hour(78840000), 'timestamp'), '9000 0 0:00')
+		self.assertEqual(format(Time.Day(-3725), '%y years %d days'), '-10 years 75 days')
+
+	def test_duration_seconds(self):
+		self.assertEqual(durationSeconds(timedelta(hours=3)), 10800.0)
+		self.assertEqual(durationSeconds(Time.Minute(2)), 120.0)
+		self.assertEqual(durationSeconds(90), 90.0)
+		with self.assertRaises(TypeError):
+			durationSeconds(Length.Meter(3))
+
+	def test_negative_components(self):
+		self.assertEqual(format(Time.Second(-30), '%MM:%SS'), '-00:30')
+		self.assertEqual(format(Time.Second(-90), '%H:%MM:%SS'), '-0:01:30')
+		self.assertEqual(format(Time.Second(-3725), '%H:%MM:%SS'), '-1:02:05')
+		self.assertEqual(format(Time.Minute(-62), '%H:%MM {unit}'), '-1:02 min')
+
+	def test_simple_matches_full_formatter(self):
+		for value in (Time.Second(0), Time.Second(0.5), Time.Second(42), Time.Second(3725), Time.Minute(4000), Time.Second(-300), Time.Day(400)):
+			self.assertEqual(format(value, 'simple'), SmartFloat.__format__(value, 'shorten=True, plural=True', unitSpacer=' '))
+			self.assertEqual(format(value, 'simple+'), SmartFloat.__format__(value, 'shorten=True, plural=True', unitSpacer=' ', unit_type='name'))
+		self.assertEqual(format(Time.Second(3725), 'ago'), '62.1 mins ago')
+		self.assertEqual(format(Time.Second(-300), 'ago+'), 'in 300 Seconds')
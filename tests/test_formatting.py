@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from src.WeatherUnits import Length, Temperature, Time, Humidity, format_many
+
+
+class TestFormatMany(TestCase):
+
+	def setUp(self):
+		self.values = [Length.Meter(i) for i in (0, 0.5, 1, 2.5, 12.345, 999.99, 1500.5, 123456.789)]
+
+	def assertMatchesFormat(self, values, spec):
+		self.assertEqual(format_many(values, spec), [format(i, spec) for i in values])
+
+	def test_matches_format(self):
+		for spec in ('', '.3f', 'unit=km', 'plural=True', 'max=6', 'showUnit=False', 'unit_type=name', '>10'):
+			with self.subTest(spec=spec):
+				self.assertMatchesFormat(self.values, spec)
+
+	def test_conversion(self):
+		self.assertMatchesFormat(self.values, 'km')
+		self.assertMatchesFormat(self.values, 'ft')
+		self.assertMatchesFormat([Temperature.Celsius(i) for i in (-40, 0, 21.456, 100)], 'f')
+
+	def test_mixed_and_fallback_classes(self):
+		values = [*self.values, Time.Second(3725), Humidity(0.5), Temperature.Celsius(20)]
+		self.assertMatchesFormat(values, '')
+		self.assertMatchesFormat(values, 'shorten=True')
+
+	def test_joined(self):
+		self.assertEqual(format_many(self.values[:3], '', sep=','), ','.join(format(i, '') for i in self.values[:3]))
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+root = Path(__file__).parent.parent
+
+
+def run(code: str) -> str:
+	return subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestLazyImports(TestCase):
+
+	def test_import_is_lazy(self):
+		loaded = run("import sys, src.WeatherUnits; print(sorted(m for m in sys.modules if m.startswith('src.WeatherUnits.')))")
+		self.assertEqual(loaded, '[]')
+
+	def test_attribute_loads_subpackage(self):
+		loaded = run("import sys, src.WeatherUnits as wu; wu.Temperature; print('src.WeatherUnits.temperature' in sys.modules, 'src.WeatherUnits.pressure' in sys.modules)")
+		self.assertEqual(loaded, 'True False')
+
+	def test_air_quality_index_is_lazy(self):
+		loaded = run("import sys, src.WeatherUnits as wu; wu.AirQuality; print('src.WeatherUnits.airQuality.index' in sys.modules, 'src.WeatherUnits.array' in sys.modules); wu.AirQuality.aqi; print('src.WeatherUnits.airQuality.index' in sys.modules)")
+		self.assertEqual(loaded, 'False False\nTrue')
+
+	def test_config_is_instance(self):
+		self.assertEqual(run("import src.WeatherUnits as wu; wu.Pressure; print(type(wu.config).__name__)"), 'Config')
+
+	def test_auto_loads_all_units(self):
+		self.assertEqual(run("import src.WeatherUnits as wu; print(wu.auto('12 mph'))"), '12 mph')
+
+	def test_star_exports(self):
+		exported = run("from src.WeatherUnits import *; print(' '.join(sorted(k for k in ('BatchFormatter', 'CompactMeasurement', 'MeasurementSeries', 'PressureTendency', 'PressureTrend', 'RunningStats') if k in globals())))")
+		self.assertEqual(exported, 'BatchFormatter CompactMeasurement MeasurementSeries PressureTendency PressureTrend RunningStats')
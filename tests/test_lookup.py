@@ -0,0 +1,57 @@
+from unittest import TestCase
+from src.WeatherUnits import Length, Pressure, Time, Wind, Measurement
+from src.WeatherUnits.base import Dimension, both
+from src.WeatherUnits.base._SmartFloat import unitIndex
+
+
+class TestUnitLookup(TestCase):
+
+	def test_exact(self):
+		self.assertIs(Pressure.__findUnitClass__('inHg'), Pressure.InchOfMercury)
+		self.assertIs(Pressure.__findUnitClass__('INHG'), Pressure.InchOfMercury)
+		self.assertIs(Time.__findUnitClass__('sec'), Time.Second)
+		self.assertIs(Measurement.__findUnitClass__('hPa'), Pressure.Hectopascal)
+
+	def test_derived(self):
+		self.assertIs(Wind.__findUnitClass__('km'), Length.Kilometer)
+		self.assertIs(Wind.__findUnitClass__('hr'), Time.Hour)
+
+	def test_scope(self):
+		self.assertIsNone(Length.Meter.__findUnitClass__('mi'))
+		self.assertIsNone(Pressure.__exactUnitClass__('km'))
+
+	def test_fuzzy(self):
+		self.assertIs(Pressure.__findUnitClass__('hectopascals'), Pressure.Hectopascal)
+		self.assertIsNone(Pressure.__findUnitClass__('xyz'))
+
+	def test_index_updates(self):
+		version = unitIndex.version
+
+		# a throwaway dimension no other test looks up, its classes are unregistered after the test
+		class Span(Measurement, metaclass=Dimension, system=both, symbol='S'):
+			pass
+
+		class Furlong(Span):
+			_unit = 'fur'
+
+		self.addCleanup(unitIndex.remove, Span)
+		self.addCleanup(unitIndex.remove, Furlong)
+		self.assertGreater(unitIndex.version, version)
+		self.assertIn(Furlong, unitIndex.get('FUR'))
+		Furlong._unit = 'furl'
+		self.assertNotIn(Furlong, unitIndex.get('fur'))
+		self.assertIn(Furlong, unitIndex.get('furl'))
+
+	def test_remove(self):
+		class Span(Measurement, metaclass=Dimension, system=both, symbol='S'):
+			pass
+
+		class Furlong(Span):
+			_unit = 'fur'
+
+		self.assertIs(Measurement.__findUnitClass__('fur'), Furlong)
+		unitIndex.remove(Furlong)
+		unitIndex.remove(Span)
+		self.assertEqual(unitIndex.get('fur'), ())
+		self.assertNotIn(Furlong, Measurement.subTypes)
+		self.assertIsNone(Measurement.__findUnitClass__('furs'))
@@ -0,0 +1,88 @@
+import threading
+from unittest import TestCase
+
+from src.WeatherUnits import Length, Measurement, Time, Wind
+from src.WeatherUnits.base import Dimension, both
+from src.WeatherUnits.base._SmartFloat import ClassRegistry, classRegistry, unitIndex
+
+
+class TestClassRegistry(TestCase):
+
+	def test_identity(self):
+		self.assertIs(Wind['km':'hr'], Wind['km':'hr'])
+		self.assertIs(Wind[Length.Foot:Time.Second], Wind[Length.Foot:Time.Second])
+
+	def test_no_new_subclasses(self):
+		Wind['mi':'min']
+		subclasses = len(Wind.__subclasses__())
+		hits = classRegistry.info().hits
+		for _ in range(10):
+			Wind['mi':'min']
+		self.assertEqual(len(Wind.__subclasses__()), subclasses)
+		self.assertEqual(classRegistry.info().hits, hits + 10)
+
+	def test_threads(self):
+		registry = ClassRegistry()
+		barrier = threading.Barrier(8)
+		results = []
+
+		def synthesize():
+			barrier.wait()
+			results.append(registry.synthesize('Synthesized', (object,)))
+
+		threads = [threading.Thread(target=synthesize) for _ in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(len(set(results)), 1)
+		self.assertEqual(registry.info(), (7, 1, 1))
+
+	def test_concurrent_hits(self):
+		registry = ClassRegistry()
+		registry.synthesize('Synthesized', (object,))
+		barrier = threading.Barrier(8)
+
+		def lookup():
+			barrier.wait()
+			for _ in range(5000):
+				registry.synthesize('Synthesized', (object,))
+
+		threads = [threading.Thread(target=lookup) for _ in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(registry.info(), (40000, 1, 1))
+
+	def test_bounded_lookups(self):
+		registry = ClassRegistry(maxLookups=2)
+		for key in ('a', 'b', 'c', 'c'):
+			registry.memoize(key, lambda: int)
+		self.assertEqual(registry.info(), (0, 4, 2))
+		registry.synthesize('Synthesized', (object,))
+		self.assertEqual(len(registry), 3)
+
+
+class TestCachedSubTypes(TestCase):
+
+	def test_cached(self):
+		self.assertIs(Length.subTypes, Length.subTypes)
+		self.assertIs(Wind.compatibleUnits, Wind.compatibleUnits)
+		self.assertIn(Length.Meter, Length.subTypes)
+
+	def test_invalidated_by_new_class(self):
+		# a throwaway dimension no other test looks up, its classes are unregistered after the test
+		class Span(Measurement, metaclass=Dimension, system=both, symbol='S'):
+			pass
+
+		self.addCleanup(unitIndex.remove, Span)
+		before = Span.subTypes
+
+		class Furlong(Span):
+			_unit = 'fur'
+
+		self.addCleanup(unitIndex.remove, Furlong)
+		self.assertIn(Furlong, Span.subTypes)
+		self.assertNotIn(Furlong, before)
+		self.assertIs(Span.compatibleUnits['fur'], Furlong)
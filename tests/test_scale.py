@@ -0,0 +1,55 @@
+from unittest import TestCase
+from src.WeatherUnits import Length, Mass, Pressure, Time, ScalingMeasurement
+
+
+class TestScale(TestCase):
+
+	def test_factor_matrix(self):
+		scale = Length.Meter.Scale
+		for fromScale in scale:
+			for toScale in scale:
+				self.assertAlmostEqual(fromScale.conversionFactor(toScale), fromScale.absoluteValue / toScale.absoluteValue)
+		self.assertEqual(scale.Kilometer.conversionFactor(scale.Millimeter), 1e6)
+
+	def test_same_system(self):
+		self.assertEqual(Length.Centimeter(250).m, Length.Meter(2.5))
+		self.assertEqual(Time.Week(1).day, Time.Day(7))
+		self.assertEqual(Time.Millisecond(5000).second, Time.Second(5))
+		self.assertAlmostEqual(float(Pressure.InchOfMercury(29.92).hPa), 1013.2, places=1)
+
+	def test_cross_system(self):
+		self.assertAlmostEqual(float(Length.Mile(1).km), 1.609344)
+		self.assertAlmostEqual(float(Length.Millimeter(25.4).inch), 1)
+		self.assertAlmostEqual(float(Mass.Ounce(1).g), 28.349523125)
+		self.assertAlmostEqual(float(Mass.Kilogram(1).pound), 2.2046226218)
+
+	def test_get_conversion_factor(self):
+		self.assertEqual(ScalingMeasurement.getConversionFactor(Length.Meter, Length.Kilometer), 0.001)
+		self.assertAlmostEqual(ScalingMeasurement.getConversionFactor(Length.Foot, Length.Meter), 0.3048)
+
+	def test_split_into_common(self):
+		self.assertEqual(Time.Second(3725).splitInto(), (Time.Hour(1), Time.Minute(2), Time.Second(5)))
+
+	def test_auto(self):
+		self.assertIs(type(Length.Meter(12345).auto), Length.Kilometer)
+		self.assertIs(type(Length.Meter(0.05).auto), Length.Centimeter)
+		self.assertIs(type(Time.Second(-7200).auto), Time.Hour)
+		self.assertAlmostEqual(float(Length.Meter(1000).auto), 1)
+		zero = Length.Meter(0)
+		self.assertIs(zero.auto, zero)
+
+	def test_best_fit(self):
+		self.assertEqual(Length.Meter(12345).bestFit(3), Length.Kilometer(12.345))
+		self.assertIs(type(Length.Meter(999).bestFit(3)), Length.Meter)
+		self.assertIs(type(Length.Meter(999.5).bestFit(3)), Length.Kilometer)
+		self.assertIs(type(Length.Meter(-99.5).bestFit(3)), Length.Kilometer)
+		# scales without a class of their own are skipped instead of raising
+		self.assertIs(type(Pressure.Pascal(1e9).bestFit(3)), Pressure.Gigapascal)
+
+	def test_split_into_units(self):
+		self.assertEqual(Time.Second(90061.5).splitIntoDict(Time.Hour, Time.Minute, Time.Second), {
+			'Hour': Time.Hour(25), 'Minute': Time.Minute(1), 'Second': Time.Second(1.5)
+		})
+		self.assertEqual(Time.Second(-3725).splitInto(), (Time.Hour(-1), Time.Minute(-2), Time.Second(-5)))
+		self.assertEqual(Length.Meter(3725).splitInto(), (Length.Kilometer(3), Length.Meter(725)))
+		self.assertEqual(format(Time.Second(-3725), '%H:%MM:%SS'), '-1:02:05')
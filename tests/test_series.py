@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from unittest import TestCase, skipIf
+from zoneinfo import ZoneInfo
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Length, Precipitation, Temperature, Time, MeasurementSeries
+from src.WeatherUnits.derived.precipitation import Daily, Hourly, Minutely
+
+newYork = ZoneInfo('America/New_York')
+
+
+@skipIf(np is None, 'numpy is not installed')
+class TestMeasurementSeries(TestCase):
+
+	def minutelyRain(self, start: datetime, days: int) -> MeasurementSeries:
+		times = start.timestamp() + np.arange(0, days * 86400, 60.0)
+		return MeasurementSeries(times, np.full(len(times), 0.1), Minutely[Length.Millimeter])
+
+	def test_construction(self):
+		start = datetime(2024, 6, 1, tzinfo=newYork)
+		series = MeasurementSeries([start, start + timedelta(minutes=1)], [Temperature.Celsius(10), Temperature.Fahrenheit(68)])
+		self.assertIs(series.unit, Temperature.Celsius)
+		self.assertEqual(series.values.tolist(), [10.0, 20.0])
+		self.assertEqual(series.interval, 60.0)
+		self.assertEqual(series[1].timestamp, start + timedelta(minutes=1))
+		self.assertEqual(series.to('f').values.tolist(), [50.0, 68.0])
+
+	def test_hourly_totals(self):
+		rain = self.minutelyRain(datetime(2024, 6, 1, tzinfo=newYork), 1)
+		hourly = rain.resample(Time.Hour(1), 'total', Hourly[Length.Millimeter])
+		self.assertEqual(len(hourly), 24)
+		self.assertTrue(np.allclose(hourly.values, 6.0))
+
+	def test_daily_buckets_follow_dst(self):
+		rain = self.minutelyRain(datetime(2024, 11, 2, tzinfo=newYork), 3)
+		daily = rain.resample(Time.Day(1), 'total', Daily[Length.Millimeter], tz=newYork)
+		self.assertTrue(np.allclose(daily.values, [144.0, 150.0, 138.0]))
+		self.assertEqual([i.hour for i in daily.timestamps(newYork)], [0, 0, 0])
+
+	def test_generic_precipitation_units(self):
+		start = datetime(2024, 6, 1, tzinfo=newYork)
+		times = start.timestamp() + np.arange(0, 86400, 60.0)
+		rain = MeasurementSeries(times, np.full(len(times), 0.01), Precipitation.Minutely)
+		self.assertFalse(rain.unit.isGeneric)
+		hourly = rain.resample(Time.Hour(1), 'total', Precipitation.Hourly)
+		self.assertIs(hourly.unit.numeratorClass, rain.unit.numeratorClass)
+		self.assertIs(hourly.unit.denominatorClass, Time.Hour)
+		self.assertTrue(np.allclose(hourly.values, 0.6))
+		daily = rain.resample(Time.Day(1), 'total', Precipitation.Daily, tz=newYork)
+		self.assertTrue(np.allclose(daily.values, [14.4]))
+
+		rain = MeasurementSeries(times[:3], [Minutely[Length.Millimeter](0.1)] * 3, Precipitation.Minutely)
+		self.assertIs(rain.unit, Minutely[Length.Millimeter])
+		self.assertIs(rain.to(Precipitation.Hourly).unit, Hourly[Length.Millimeter])
+
+	def test_first_last_skip_nan(self):
+		values = np.array([np.nan, 1.0, 2.0, np.nan, np.nan, np.nan, 5.0, 6.0])
+		series = MeasurementSeries(np.arange(len(values)) * 60.0, values, Length.Meter)
+		utc = ZoneInfo('UTC')
+		self.assertEqual(np.nan_to_num(series.resample(120, 'first', tz=utc).values, nan=-1).tolist(), [1.0, 2.0, -1, 5.0])
+		self.assertEqual(np.nan_to_num(series.resample(120, 'last', tz=utc).values, nan=-1).tolist(), [1.0, 2.0, -1, 6.0])
+
+	def test_resample_aggregations(self):
+		series = MeasurementSeries(np.arange(0, 600, 60.0), np.arange(10.0), Temperature.Celsius)
+		self.assertEqual(series.resample(300, 'mean', tz=ZoneInfo('UTC')).values.tolist(), [2.0, 7.0])
+		self.assertEqual(series.resample(300, 'max', tz=ZoneInfo('UTC')).values.tolist(), [4.0, 9.0])
+		self.assertEqual(series.resample(300, 'last', tz=ZoneInfo('UTC')).values.tolist(), [4.0, 9.0])
+
+	def test_rolling(self):
+		values = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0])
+		series = MeasurementSeries(np.arange(len(values)) * 60.0, values, Temperature.Celsius)
+		window = 3
+		expectedMax = [values[max(0, i - window + 1):i + 1].max() for i in range(len(values))]
+		expectedMean = [values[max(0, i - window + 1):i + 1].mean() for i in range(len(values))]
+		self.assertEqual(series.rolling(Time.Minute(3), 'max').values.tolist(), expectedMax)
+		self.assertTrue(np.allclose(series.rolling(180, 'mean').values, expectedMean))
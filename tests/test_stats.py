@@ -0,0 +1,79 @@
+from datetime import datetime
+from math import fsum
+from statistics import pstdev, pvariance
+from unittest import TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Length, Temperature, Wind, MeasurementArray, RunningStats
+
+
+class TestRunningStats(TestCase):
+
+	def test_moments(self):
+		values = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+		stats = RunningStats.of([Length.Meter(i) for i in values])
+		self.assertIs(stats.unit, Length.Meter)
+		self.assertEqual(stats.count, 8)
+		self.assertAlmostEqual(float(stats.mean), 5.0)
+		self.assertAlmostEqual(stats.variance, pvariance(values))
+		self.assertAlmostEqual(float(stats.stdev), pstdev(values))
+		self.assertEqual(float(stats.sum), 40.0)
+
+	def test_mixed_units(self):
+		stats = RunningStats('mm')
+		stats.update([Length.Millimeter(1), Length.Centimeter(1), Length.Inch(1)])
+		self.assertIs(stats.unit, Length.Millimeter)
+		self.assertAlmostEqual(float(stats.sum), 36.4)
+		self.assertAlmostEqual(float(stats.max), 25.4)
+		self.assertAlmostEqual(float(stats.to('inch').sum), 36.4 / 25.4)
+
+	def test_affine_units(self):
+		stats = RunningStats(Temperature.Fahrenheit)
+		stats.add(Temperature.Celsius(20), datetime(2024, 1, 1))
+		stats.add(Temperature.Celsius(30), datetime(2024, 1, 2))
+		stats.add(50.0, datetime(2024, 1, 3))
+		self.assertAlmostEqual(float(stats.mean), 68.0)
+		self.assertEqual(stats.max.timestamp, datetime(2024, 1, 2))
+		self.assertEqual(stats.min.timestamp, datetime(2024, 1, 3))
+		self.assertAlmostEqual(float(stats.to('c').mean), 20.0)
+		self.assertAlmostEqual(float(stats.to('c').stdev), pstdev([20.0, 30.0, 10.0]))
+
+	def test_compensated_sum(self):
+		values = [0.1] * 100000 + [1e10, -1e10]
+		stats = RunningStats.of(values, Length.Millimeter)
+		self.assertEqual(float(stats.sum), fsum(values))
+
+	def test_merge(self):
+		values = [float(i) for i in range(1, 101)]
+		left, right = RunningStats.of(values[:30], Length.Meter), RunningStats.of(values[30:], Length.Meter)
+		merged = left.merge(right)
+		self.assertAlmostEqual(merged.variance, pvariance(values))
+		self.assertEqual((float(merged.min), float(merged.max)), (1.0, 100.0))
+
+	def test_merge_into_empty(self):
+		celsius = RunningStats.of([Temperature.Celsius(20), Temperature.Celsius(30)])
+		merged = RunningStats('f').merge(celsius)
+		self.assertIs(merged.unit, Temperature.Fahrenheit)
+		self.assertAlmostEqual(float(merged.mean), 77.0)
+		self.assertAlmostEqual(float(merged.min), 68.0)
+
+	def test_skips_nan(self):
+		stats = RunningStats.of([1.0, float('nan'), 3.0], Length.Meter)
+		self.assertEqual(stats.count, 2)
+		self.assertEqual(float(stats.mean), 2.0)
+
+	@skipIf(np is None, 'numpy is not installed')
+	def test_arrays(self):
+		speeds = np.array([1.0, 5.0, np.nan, 3.0])
+		stats = RunningStats(Wind['km', 'hr'])
+		stats.update(MeasurementArray(speeds, Wind['m', 's']), timestamps=[10, 20, 30, 40])
+		self.assertEqual(stats.count, 3)
+		self.assertAlmostEqual(float(stats.mean), 10.8)
+		self.assertAlmostEqual(float(stats.max), 18.0)
+		self.assertEqual(stats.maxTimestamp, 20)
+		scalar = RunningStats.of([Wind['m', 's'](i) for i in (1.0, 5.0, 3.0)], Wind['km', 'hr'])
+		self.assertAlmostEqual(stats.variance, scalar.variance)
@@ -0,0 +1,40 @@
+from unittest import TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Temperature, Length, Time, Wind, MeasurementArray
+from src.WeatherUnits.temperature.vectorized import dewpoint, heatIndex, windChill
+
+
+@skipIf(np is None, 'numpy is not installed')
+class TestTemperatureArrays(TestCase):
+
+	def setUp(self):
+		self.celsius = [Temperature.Celsius(i) for i in (-10.0, 5.5, 22.0, 31.0, 38.5)]
+		self.rh = [0.35, 60, 0.8, 45, 70]
+		self.wind = [Wind(Length.Meter(i), Time.Second(1)) for i in (0.5, 3.0, 6.0, 10.0, 15.0)]
+
+	def assertMatchesScalar(self, function, method, temperatures, others):
+		result = function(MeasurementArray(temperatures), others)
+		self.assertIs(result.unit, type(temperatures[0]))
+		expected = [float(getattr(t, method)(o)) for t, o in zip(temperatures, others)]
+		np.testing.assert_allclose(result.values, expected)
+
+	def test_dewpoint(self):
+		for unit in (Temperature.Celsius, Temperature.Fahrenheit, Temperature.Kelvin):
+			self.assertMatchesScalar(dewpoint, 'dewpoint', [unit(i) for i in self.celsius], self.rh)
+
+	def test_heat_index(self):
+		for unit in (Temperature.Celsius, Temperature.Fahrenheit, Temperature.Kelvin):
+			self.assertMatchesScalar(heatIndex, 'heatIndex', [unit(i) for i in self.celsius], self.rh)
+
+	def test_wind_chill(self):
+		for unit in (Temperature.Celsius, Temperature.Fahrenheit, Temperature.Kelvin):
+			self.assertMatchesScalar(windChill, 'windChill', [unit(i) for i in self.celsius], self.wind)
+
+	def test_kelvin_wind_chill(self):
+		wind = Wind(Length.Meter(10), Time.Second(1))
+		self.assertEqual(Temperature.Kelvin(Temperature.Celsius(-10)).windChill(wind).c, Temperature.Celsius(-10).windChill(wind))
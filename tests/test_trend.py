@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Pressure, PressureTendency, PressureTrend, Time
+
+start = 1.7e9
+
+
+class TestPressureTrend(TestCase):
+
+	def test_rising(self):
+		trend = PressureTrend()
+		for i in range(0, 3 * 3600 + 1, 60):
+			trend.add(1010 + i / 3600, start + i)
+		self.assertIs(trend.trend, Pressure.Trend.Rising)
+		self.assertIsInstance(trend.rate, PressureTendency)
+		self.assertAlmostEqual(float(trend.rate), 1.0)
+		self.assertAlmostEqual(float(trend.change), 3.0)
+
+	def test_thresholds_in_other_units(self):
+		trend = PressureTrend(threshold=Pressure.InchOfMercury(0.06), unit='inHg', rateUnit='inHg/hr')
+		for i in range(0, 3 * 3600 + 1, 60):
+			trend.add(30 - 0.01 * i / 3600, start + i)
+		self.assertIs(trend.trend, Pressure.Trend.Steady)
+		self.assertAlmostEqual(float(trend.rate), -0.01)
+
+		trend = PressureTrend(threshold=(PressureTendency(Pressure.Hectopascal(0.1), Time.Hour(1)), Pressure.Hectopascal(2)))
+		for i in range(0, 3 * 3600 + 1, 60):
+			trend.add(Pressure.Hectopascal(1010 - 0.2 * i / 3600), datetime.fromtimestamp(start + i, tz=timezone.utc))
+		self.assertIs(trend.trend, Pressure.Trend.Falling)
+
+	def test_min_span(self):
+		trend = PressureTrend(window=timedelta(hours=3))
+		trend.add(1010, start)
+		trend.add(1012, start + 600)
+		self.assertIsNone(trend.trend)
+		self.assertIsNone(trend.rate)
+		trend = PressureTrend(window=timedelta(hours=3), minSpan=Time.Minute(5))
+		trend.add(1010, start)
+		trend.add(1012, start + 600)
+		self.assertIs(trend.trend, Pressure.Trend.Rising)
+
+	def test_requires_time(self):
+		with self.assertRaises(TypeError):
+			PressureTrend().add(Pressure.Hectopascal(1010))
+
+	@skipIf(np is None, 'numpy is not installed')
+	def test_matches_polyfit(self):
+		trend = PressureTrend()
+		times = np.arange(0, 48 * 3600, 60.0)
+		values = 1013 + 2 * np.sin(times / 20000) + 0.05 * np.sin(times)
+		for time, value in zip(times, values):
+			trend.add(float(value), start + float(time))
+		window = times > times[-1] - 3 * 3600
+		expected = np.polyfit(times[window], values[window], 1)[0] * 3600
+		self.assertEqual(len(trend), window.sum())
+		self.assertAlmostEqual(float(trend.rate.hPah), expected, places=9)
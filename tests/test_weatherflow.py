@@ -0,0 +1,171 @@
+import asyncio
+import json
+import socket
+from unittest import IsolatedAsyncioTestCase, TestCase, skipIf
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from src.WeatherUnits import Length, Time, Wind, Temperature, Direction
+from src.WeatherUnits.defaults.WeatherFlow import Precipitation
+from src.WeatherUnits.defaults.WeatherFlow.udp import Decoder, UDPListener
+from src.WeatherUnits.defaults.WeatherFlow.columns import ColumnDecoder
+from src.WeatherUnits.defaults.WeatherFlow.wind import WindBuffer, WindBuffers
+
+obs_st = {
+	'serial_number': 'ST-00000512', 'type': 'obs_st', 'hub_sn': 'HB-00013030', 'firmware_revision': 129,
+	'obs': [[1588948614, 0.18, 0.22, 0.27, 144, 6, 1017.57, 22.37, 50.26, 328, 0.03, 3, 0.000000, 0, 0, 0, 2.410, 1]],
+}
+rapid_wind = {'serial_number': 'SK-00008453', 'type': 'rapid_wind', 'hub_sn': 'HB-00000001', 'ob': [1493322445, 2.3, 128]}
+evt_strike = {'serial_number': 'AR-00004049', 'type': 'evt_strike', 'hub_sn': 'HB-00000001', 'evt': [1493322445, 27, 3848]}
+hub_status = {'serial_number': 'HB-00000001', 'type': 'hub_status', 'uptime': 1670133}
+
+
+class FakeHub:
+	"""Sends WeatherFlow messages to a listener over loopback"""
+
+	def __init__(self, port: int):
+		self.address = ('127.0.0.1', port)
+		self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+	def send(self, *messages):
+		for message in messages:
+			self.socket.sendto(message if isinstance(message, bytes) else json.dumps(message).encode(), self.address)
+
+	def close(self):
+		self.socket.close()
+
+
+class TestDecoder(TestCase):
+
+	def test_obs_st(self):
+		observation, = Decoder('obs_st').decode(obs_st)
+		self.assertEqual((observation.type, observation.serial, observation.hub), ('obs_st', 'ST-00000512', 'HB-00013030'))
+		self.assertEqual(observation.time, 1588948614)
+		self.assertEqual(observation['windSpeed'], Wind(Length.Meter(0.22), Time.Second(1)))
+		self.assertIsInstance(observation['temperature'], Temperature.Celsius)
+		self.assertIsInstance(observation['windDirection'], Direction)
+		self.assertIs(observation['precipitationType'], Precipitation.Type.NONE)
+
+	def test_lazy_fields(self):
+		observation, = Decoder('obs_st').decode(obs_st)
+		self.assertFalse(hasattr(observation, '__dict__'))
+		self.assertEqual(observation.raw('temperature'), 22.37)
+		self.assertEqual(len(observation), 18)
+		self.assertEqual(dict(observation), Decoder('obs_st').decodeRow(obs_st['obs'][0]))
+		self.assertEqual(observation.timestamp.year, 2020)
+
+	def test_null_values(self):
+		row = [None] * 18
+		row[0] = 1588948614
+		observation, = Decoder('obs_st').decode({**obs_st, 'obs': [row]})
+		self.assertIsNone(observation['temperature'])
+
+	def test_event(self):
+		observation, = Decoder('evt_strike').decode(evt_strike)
+		self.assertEqual(float(observation['distance'].km), 27)
+		self.assertEqual(observation['energy'], 3848)
+
+
+@skipIf(np is None, 'numpy is not installed')
+class TestColumnDecoder(TestCase):
+
+	def test_matches_decoder(self):
+		rows = obs_st['obs'] + [[1588948674, None, 1.5, 2.1, 180, 6, 1012.0, -3.5, 88, 0, 0, 0, 0.2, 1, 12, 2, 2.5, 1]]
+		columns = ColumnDecoder('obs_st').decode(rows)
+		for index, row in enumerate(rows):
+			for name, value in Decoder('obs_st').decodeRow(row).items():
+				column = columns[name]
+				expected = np.nan if value is None else float(value.value if isinstance(value, Precipitation.Type) else value)
+				actual = column.values[index] if hasattr(column, 'values') else column[index]
+				np.testing.assert_allclose(actual, expected, err_msg=name)
+
+	def test_units(self):
+		columns = ColumnDecoder('obs_st').decode(obs_st['obs'])
+		self.assertIs(columns['temperature'].unit, Temperature.Celsius)
+		self.assertEqual(columns['time'].dtype, np.float64)
+		self.assertEqual(columns['precipitationRate'][0], Decoder('obs_st').decodeRow(obs_st['obs'][0])['precipitationRate'])
+
+	def test_short_rows(self):
+		columns = ColumnDecoder('obs_st').decode([[1588948614, 0.18, 0.22], obs_st['obs'][0]])
+		self.assertTrue(np.isnan(columns['temperature'].values[0]))
+		self.assertEqual(len(columns['battery']), 2)
+
+
+class TestWindBuffer(TestCase):
+
+	def test_window(self):
+		buffer = WindBuffer(window=9)
+		for time, speed in enumerate((4.0, 1.0, 3.0, 7.0, 2.0, 5.0)):
+			buffer.add(time * 3, speed, 90)
+		self.assertEqual(len(buffer), 3)
+		self.assertEqual(float(buffer.lull), 2)
+		self.assertEqual(float(buffer.gust), 7)
+		self.assertAlmostEqual(float(buffer.average), 14 / 3)
+		self.assertIsInstance(buffer.gust, Wind)
+
+	def test_capacity(self):
+		buffer = WindBuffer(window=600, capacity=2)
+		for time, speed in enumerate((9.0, 1.0, 3.0)):
+			buffer.add(time, speed, 0)
+		self.assertEqual((float(buffer.lull), float(buffer.gust)), (1, 3))
+
+	def test_direction(self):
+		buffer = WindBuffer()
+		buffer.add(0, 2.0, 350)
+		buffer.add(3, 2.0, 10)
+		buffer.add(6, 0.0, 180)
+		self.assertIsInstance(buffer.direction, Direction)
+		self.assertAlmostEqual(float(buffer.direction) % 360, 0, places=6)
+		buffer.clear()
+		buffer.add(0, 0.0, 90)
+		self.assertIsNone(buffer.direction)
+
+	def test_observations(self):
+		buffers = WindBuffers(window=60)
+		observation, = Decoder('rapid_wind').decode(rapid_wind)
+		buffer = buffers.addObservation(observation)
+		self.assertIs(buffers['SK-00008453'], buffer)
+		self.assertEqual(float(buffer.gust), 2.3)
+		self.assertEqual(float(buffer.direction), 128)
+
+
+class TestUDPListener(IsolatedAsyncioTestCase):
+
+	async def test_fake_hub(self):
+		async with UDPListener(host='127.0.0.1', port=0) as listener:
+			hub = FakeHub(listener.port)
+			try:
+				hub.send(hub_status, b'not json', obs_st, rapid_wind)
+				first = await asyncio.wait_for(listener.get(), 2)
+				second = await asyncio.wait_for(listener.get(), 2)
+			finally:
+				hub.close()
+		self.assertEqual(first.type, 'obs_st')
+		self.assertEqual(second.type, 'rapid_wind')
+		self.assertEqual(float(second['direction']), 128)
+
+	async def test_iteration_ends_on_close(self):
+		received = []
+
+		async def consume(listener):
+			async for observation in listener:
+				received.append(observation.type)
+
+		async def untilReceived():
+			while not received:
+				await asyncio.sleep(0.01)
+
+		async with UDPListener(host='127.0.0.1', port=0) as listener:
+			consumer = asyncio.create_task(consume(listener))
+			hub = FakeHub(listener.port)
+			try:
+				hub.send(obs_st)
+				await asyncio.wait_for(untilReceived(), 2)
+			finally:
+				hub.close()
+		await asyncio.wait_for(consumer, 2)
+		self.assertEqual(received, ['obs_st'])
+		self.assertIsNone(await listener.get())